@@ -84,6 +84,7 @@ from views import (
     render_admin_page,
     render_faq
 )
+from styles import inject_styles
 
 # Initialize session state
 initialize_session_state()
@@ -103,6 +104,8 @@ else:
         st.session_state.current_section = 0
     if 'responses' not in st.session_state:
         st.session_state.responses = {}
+    if 'answered_count' not in st.session_state:
+        st.session_state.answered_count = 0
     if 'assessment_complete' not in st.session_state:
         st.session_state.assessment_complete = False
     if 'results' not in st.session_state:
@@ -116,10 +119,30 @@ else:
     if 'selected_industry' not in st.session_state:
         st.session_state.selected_industry = "general"
 
+    # Page renderers and the session flag (if any) each page requires
+    PAGE_RENDERERS = {
+        'welcome': (render_welcome_page, None),
+        'assessment': (render_assessment, None),
+        'report': (render_report, 'assessment_complete'),
+        'discovery': (render_data_discovery, 'assessment_complete'),
+        'privacy': (render_privacy_policy_analyzer, None),
+        'faq': (render_faq, None),
+        'admin': (render_admin_page, 'is_admin'),
+    }
+
     # Main app logic
     def main():
         """Main application function that renders the appropriate page"""
         try:
+            # Resolve the page to render, falling back to the welcome page
+            page = st.session_state.current_page
+            renderer, required_flag = PAGE_RENDERERS.get(page, (None, None))
+            if renderer is None or (required_flag and not st.session_state.get(required_flag, False)):
+                page, renderer = 'welcome', render_welcome_page
+
+            # Inject all CSS for this page in one go
+            inject_styles(page)
+
             # Render header
             render_header()
             
@@ -127,22 +150,7 @@ else:
             render_sidebar()
             
             # Render current page
-            if st.session_state.current_page == 'welcome':
-                render_welcome_page()
-            elif st.session_state.current_page == 'assessment':
-                render_assessment()
-            elif st.session_state.current_page == 'report' and st.session_state.get('assessment_complete', False):
-                render_report()
-            elif st.session_state.current_page == 'discovery' and st.session_state.get('assessment_complete', False):
-                render_data_discovery()
-            elif st.session_state.current_page == 'privacy':
-                render_privacy_policy_analyzer()
-            elif st.session_state.current_page == 'faq':
-                render_faq()
-            elif st.session_state.current_page == 'admin' and st.session_state.get('is_admin', False):
-                render_admin_page()
-            else:
-                render_welcome_page()
+            renderer()
                 
         except Exception as e:
             logger.error(f"Error in main application: {str(e)}", exc_info=True)
@@ -15,7 +15,6 @@ import pandas as pd
 import streamlit as st
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
-import functools
 import time
 
 # Local modules
@@ -44,28 +43,12 @@ logger = logging.getLogger(__name__)
 # QUESTIONNAIRE RETRIEVAL FUNCTIONS
 #################################################
 
-# Add a cache for questionnaires to avoid repeated loading
-_questionnaire_cache = {}
-
-# Add caching to questionnaire loading
-@functools.lru_cache(maxsize=32)
+# Questionnaire files are static, so one parsed copy per (regulation, industry)
+# is shared by every session; callers must treat it as read-only
+@st.cache_resource(show_spinner=False, max_entries=16)
 def get_questionnaire(regulation: str, industry: str) -> dict:
     """Cached version of questionnaire loading to prevent repeated disk access"""
     try:
-        # Check if cache should be cleared FIRST - before any other processing
-        import streamlit as st
-        if hasattr(st, 'session_state') and hasattr(st.session_state, 'clear_questionnaire_cache') and st.session_state.clear_questionnaire_cache:
-            logger.info(f"[CACHE] CLEARING ALL QUESTIONNAIRE CACHES due to clear_questionnaire_cache flag")
-            get_questionnaire.cache_clear()
-            # Also clear the manual cache if it exists
-            import sys
-            if '_questionnaire_cache' in globals():
-                global _questionnaire_cache
-                _questionnaire_cache.clear()
-                logger.info("[CACHE] Manual cache also cleared")
-            st.session_state.clear_questionnaire_cache = False
-            logger.info(f"[CACHE] Cache clearing completed for regulation: {regulation}, industry: {industry}")
-        
         # Convert inputs for consistent handling
         logger.info(f"Loading questionnaire for regulation: {regulation}, industry: {industry}")
         regulation = regulation.strip().upper()
@@ -28,8 +28,9 @@ logger.info(f"Base directory: {BASE_DIR}")
 # Use absolute paths for questionnaires directory
 QUESTIONNAIRE_DIR = os.path.join(BASE_DIR, "Questionnaire")
 DATA_DIR = os.path.join(BASE_DIR, "data")
+ASSETS_DIR = os.path.join(BASE_DIR, "Assets")
 # Define logo path relative to project root for st.image
-LOGO_PATH = os.path.join(BASE_DIR, "Assets", "DataINFA.png")
+LOGO_PATH = os.path.join(ASSETS_DIR, "DataINFA.png")
 
 # Ensure critical directories exist
 for directory in [QUESTIONNAIRE_DIR, os.path.join(BASE_DIR, "data"), os.path.join(BASE_DIR, "secure")]:
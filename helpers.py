@@ -24,7 +24,8 @@ from token_storage import (
     get_organization_for_token,
     TOKENS_FILE as TOKEN_PATH,  # Use TOKENS_FILE instead of TOKEN_PATH
     generate_token as ts_generate_token,  # Changed from add_token to generate_token
-    cleanup_expired_tokens as ts_cleanup_expired_tokens
+    cleanup_expired_tokens as ts_cleanup_expired_tokens,
+    ADMIN_TOKENS
 )
 import traceback  # Add this import at the top of the file
 
@@ -42,6 +43,8 @@ def initialize_session_state():
         st.session_state.current_section = 0
     if 'responses' not in st.session_state:
         st.session_state.responses = {}
+    if 'answered_count' not in st.session_state:
+        st.session_state.answered_count = 0
     if 'assessment_complete' not in st.session_state:
         st.session_state.assessment_complete = False
     if 'results' not in st.session_state:
@@ -158,6 +161,23 @@ def go_to_section(section_idx):
     st.rerun()  # Add explicit rerun to avoid double-click issue
 
 # Assessment functions
+def set_response(key, response):
+    """Store a response in session state, keeping answered_count in step"""
+    responses = st.session_state.responses
+    previous = responses.get(key)
+    responses[key] = response
+    if previous is None and response is not None:
+        st.session_state.answered_count = st.session_state.get('answered_count', 0) + 1
+    elif previous is not None and response is None:
+        st.session_state.answered_count = st.session_state.get('answered_count', 0) - 1
+
+def set_responses(updates):
+    """Store several responses at once, keeping answered_count in step"""
+    responses = st.session_state.responses
+    delta = sum((value is not None) - (responses.get(key) is not None) for key, value in updates.items())
+    responses.update(updates)
+    st.session_state.answered_count = st.session_state.get('answered_count', 0) + delta
+
 def save_response(section_idx, question_idx, response):
     """Save a response to a question in the session state and persist to storage
     
@@ -173,12 +193,11 @@ def save_response(section_idx, question_idx, response):
         
     key = f"s{section_idx}_q{question_idx}"
     
-    # Direct assignment is more efficient than checking previous value
-    st.session_state.responses[key] = response
+    set_response(key, response)
     logger.info(f"Saved response for {key}: '{response}'")
     
     # Save to storage if organization name exists
-    if hasattr(st.session_state, 'organization_name') and st.session_state.organization_name:
+    if st.session_state.get('organization_name'):
         from data_storage import save_assessment_data
         assessment_data = {
             'organization_name': st.session_state.organization_name,
@@ -193,6 +212,7 @@ def save_response(section_idx, question_idx, response):
 def reset_assessment():
     """Reset the assessment to start over"""
     st.session_state.responses = {}
+    st.session_state.answered_count = 0
     st.session_state.assessment_complete = False
     st.session_state.results = None
     st.session_state.current_section = 0
@@ -325,7 +345,7 @@ def track_event(event_name, properties=None):
 def validate_token(input_token):
     """Validate if the input token exists and active"""
     # Check for admin access token first
-    if input_token == 'dpdp2025':
+    if input_token in ADMIN_TOKENS:
         st.session_state.is_admin = True
         logger.info("Admin token validated")
         return True
@@ -379,7 +399,7 @@ def fix_null_responses(replace_with="Not applicable"):
     fixed_count = 0
     
     for key in null_keys:
-        st.session_state.responses[key] = replace_with
+        set_response(key, replace_with)
         fixed_count += 1
         logger.info(f"Fixed null response for {key}: replaced with '{replace_with}'")
     
@@ -445,7 +465,7 @@ def fix_questionnaire_selection():
             logger.info(f"Section names: {[s.get('name', 'Unnamed') for s in st.session_state.current_questionnaire.get('sections', [])]}")
             
             # CRITICAL: Check if we have a locked questionnaire type
-            if hasattr(st.session_state, 'locked_questionnaire_type'):
+            if 'locked_questionnaire_type' in st.session_state:
                 if (st.session_state.locked_questionnaire_type == "e-commerce" and 
                     (st.session_state.selected_industry != "e-commerce" or section_count < 4)):
                     logger.warning(f"Detected violation of locked E-commerce questionnaire - forcing reload")
@@ -453,7 +473,7 @@ def fix_questionnaire_selection():
                     if 'current_questionnaire' in st.session_state:
                         del st.session_state.current_questionnaire
                     st.session_state.selected_industry = "e-commerce"
-                    st.session_state.clear_questionnaire_cache = True
+                    clear_questionnaire_cache()
                     logger.info(f"Force-reset industry to e-commerce from locked context")
                     return True
             
@@ -472,7 +492,7 @@ def fix_questionnaire_selection():
                     del st.session_state.current_questionnaire
                 
                 # Signal to clear the cache in assessment module
-                st.session_state.clear_questionnaire_cache = True
+                clear_questionnaire_cache()
                 # Lock the questionnaire type to prevent further switches
                 st.session_state.locked_questionnaire_type = "e-commerce"
                 st.session_state.locked_section_count = 4
@@ -489,8 +509,8 @@ def fix_questionnaire_selection():
 
 def clear_questionnaire_cache():
     """Clear the questionnaire cache to force reload on next access"""
-    st.session_state.clear_questionnaire_cache = True
-    logger.info("Questionnaire cache will be cleared on next access")
+    get_questionnaire.clear()
+    logger.info("Questionnaire cache cleared")
     
     # ADDITIONAL DEBUGGING: Track where this is being called from
     logger.info(f"Cache clearing requested from:\n{''.join(traceback.format_stack()[-5:-1])}")
@@ -25,7 +25,11 @@ FORMAT_MARKDOWN = "markdown"
 FORMAT_HTML = "html"
 FORMAT_PLAIN = "plain"
 
-def generate_report(results: Dict[str, Any], use_external_api: bool = True, format: str = FORMAT_MARKDOWN) -> str:
+# Returned by generate_report when no report could be produced
+REPORT_ERROR_MESSAGE = "Error generating report. Please try again or contact support."
+
+def generate_report(results: Dict[str, Any], use_external_api: bool = True, format: str = FORMAT_MARKDOWN,
+                    fallback_to_template: bool = True) -> str:
     """
     Generate a formatted report based on assessment results
     
@@ -33,6 +37,8 @@ def generate_report(results: Dict[str, Any], use_external_api: bool = True, form
         results: Assessment results dictionary
         use_external_api: Whether to use an external AI API for enhanced report generation
         format: Output format (markdown, html, or plain)
+        fallback_to_template: Whether to return the template report when the
+            requested external API is unavailable or fails; if False, raise instead
         
     Returns:
         String containing the formatted report
@@ -54,10 +60,14 @@ def generate_report(results: Dict[str, Any], use_external_api: bool = True, form
             return report
         except Exception as e:
             logger.error(f"Error using external API for report generation: {str(e)}", exc_info=True)
+            if not fallback_to_template:
+                raise
             # logger.info("Falling back to template-based report")
     else:
         if use_external_api:
             if not ai_enabled:
+                if not fallback_to_template:
+                    raise RuntimeError("External API requested but not configured")
                 logger.warning("External API requested but not configured, using template-based report generation")
             else:
                 # logger.info("External API configured but not requested, using template-based report generation")
@@ -72,9 +82,8 @@ def generate_report(results: Dict[str, Any], use_external_api: bool = True, form
     report = _generate_template_report(results, format)
     
     if not report:
-        error_msg = "Error generating report. Please try again or contact support."
         logger.error("Template report generation failed")
-        return error_msg
+        return REPORT_ERROR_MESSAGE
         
     duration = time.time() - start_time
     # logger.info(f"Generated template-based report in {duration:.2f} seconds")
@@ -2,7 +2,9 @@ import os
 import requests
 from bs4 import BeautifulSoup
 import re
-from typing import Dict, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
 from googlesearch import search
 import logging
 import openai
@@ -359,6 +361,36 @@ def setup_privacy_policy_logging():
 # Initialize logger
 logger = setup_privacy_policy_logging()
 
+# Extracted policy text per URL, with the validators (ETag / Last-Modified) it was
+# served with, so a repeat fetch can be answered by a 304 instead of a full
+# download and re-parse. Bounded LRU; sessions share it from several threads.
+_POLICY_CACHE_SIZE = 32
+_policy_cache: "OrderedDict[str, Tuple[Dict[str, str], str]]" = OrderedDict()
+_policy_cache_lock = threading.Lock()
+
+def _cached_policy(url: str) -> Optional[Tuple[Dict[str, str], str]]:
+    """Conditional request headers and extracted text from the last fetch of url, if any"""
+    with _policy_cache_lock:
+        cached = _policy_cache.get(url)
+        if cached:
+            _policy_cache.move_to_end(url)
+        return cached
+
+def _remember_policy(url: str, response: requests.Response, text: str) -> None:
+    """Keep extracted text for revalidation if the server sent ETag or Last-Modified"""
+    validators = {}
+    if response.headers.get('ETag'):
+        validators['If-None-Match'] = response.headers['ETag']
+    if response.headers.get('Last-Modified'):
+        validators['If-Modified-Since'] = response.headers['Last-Modified']
+    if not validators:
+        return
+    with _policy_cache_lock:
+        _policy_cache[url] = (validators, text)
+        _policy_cache.move_to_end(url)
+        while len(_policy_cache) > _POLICY_CACHE_SIZE:
+            _policy_cache.popitem(last=False)
+
 def find_privacy_policy_url(organization_name: str, country: str = None, num_results: int = 5) -> Optional[str]:
     """Find privacy policy URL using Google search with country context."""
     logger.info(f"Searching privacy policy for organization: {organization_name} in country: {country}")
@@ -399,16 +431,24 @@ def fetch_policy_content(url: str, max_retries: int = 3, retry_delay: int = 2, v
 
             session = requests.Session()
             
+            # Revalidate a previously fetched policy instead of downloading it again
+            cached = _cached_policy(url)
+            request_headers = {**headers, **cached[0]} if cached else headers
+            
             # First try with SSL verification
             try:
-                response = session.get(url, headers=headers, timeout=30, verify=verify_ssl)
+                response = session.get(url, headers=request_headers, timeout=30, verify=verify_ssl)
                 response.raise_for_status()
             except requests.exceptions.SSLError as ssl_error:
                 logger.warning(f"SSL verification failed on attempt {attempt + 1}, trying without verification")
                 # If SSL verification fails, try without verification
-                response = session.get(url, headers=headers, timeout=30, verify=False)
+                response = session.get(url, headers=request_headers, timeout=30, verify=False)
                 response.raise_for_status()
             
+            if response.status_code == 304 and cached:
+                logger.info(f"Privacy policy at {url} not modified; reusing extracted content")
+                return cached[1]
+            
             logger.debug(f"Successfully fetched content from {url} on attempt {attempt + 1}")
             soup = BeautifulSoup(response.text, 'html.parser')
             
@@ -453,6 +493,7 @@ def fetch_policy_content(url: str, max_retries: int = 3, retry_delay: int = 2, v
                 return None
                 
             logger.info(f"Successfully extracted {len(text)} characters of content")
+            _remember_policy(url, response, text)
             return text
 
         except requests.exceptions.SSLError as e:
@@ -506,17 +547,17 @@ def get_law_content(law_key: str) -> Optional[str]:
         logger.error(f"Error reading law content: {e}")
         return None
 
-def analyze_privacy_policy(policy_content: str, law_key: str, organization_name: str = "Organization") -> Dict:
+def analyze_privacy_policy(policy_content: str, law_key: str) -> Dict:
     """
     Analyze a privacy policy against the specified law requirements.
     
     Args:
         policy_content (str): The content of the privacy policy to analyze
         law_key (str): The key of the law to analyze against (e.g., 'dpdp_india')
-        organization_name (str): Name of the organization for the PDF report
         
     Returns:
-        Dict: Analysis results including compliance status, recommendations, and PDF content
+        Dict: Analysis results including compliance status and recommendations;
+        render the PDF report with generate_privacy_policy_pdf when it is needed
     """
     try:
         # Check if policy_content is empty or None
@@ -587,18 +628,10 @@ def analyze_privacy_policy(policy_content: str, law_key: str, organization_name:
         # Clean the analysis to remove any follow-up questions or prompts
         analysis = clean_analysis_content(analysis)
         
-        # Generate PDF report
-        pdf_content = generate_privacy_policy_pdf(
-            {"analysis": analysis},
-            organization_name=organization_name,
-            law_key=law_key
-        )
-        
         return {
             "analysis": analysis,
             "law_name": law_config["name"],
-            "law_country": law_config["country"],
-            "pdf_content": pdf_content
+            "law_country": law_config["country"]
         }
         
     except Exception as e:
@@ -5,9 +5,18 @@ This module contains all CSS styling used throughout the application,
 organized by component or page.
 """
 
-def get_common_button_css():
-    """Return the CSS for common button styling"""
-    return """
+import functools
+import re
+import sys
+
+import streamlit as st
+
+# Patterns used to minify the combined CSS once per process
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_CSS_WHITESPACE_RE = re.compile(r"\s+")
+_CSS_PUNCTUATION_RE = re.compile(r"\s*([{};])\s*")
+
+_COMMON_BUTTON_CSS = """
         <style>
         /* Common button styles - Material UI inspired */
         button, .stButton>button {
@@ -18,7 +27,7 @@ def get_common_button_css():
             text-align: left !important;
             padding: 0.5rem 0.75rem !important;  /* Reduced padding */
             font-size: 0.85rem !important;      /* Smaller font */
-            transition: all 0.2s cubic-bezier(0.4, 0, 0.2, 1) !important;
+            transition: background-color 0.2s cubic-bezier(0.4, 0, 0.2, 1), box-shadow 0.2s cubic-bezier(0.4, 0, 0.2, 1), transform 0.2s cubic-bezier(0.4, 0, 0.2, 1) !important;
             box-shadow: 0 1px 3px rgba(0,0,0,0.12), 0 1px 2px rgba(0,0,0,0.24) !important;
             margin: 0.25rem 0 !important;      /* Reduced margin */
             width: 100% !important;
@@ -68,7 +77,7 @@ def get_common_button_css():
         /* Disabled state */
         button:disabled, .stButton>button:disabled {
             background-color: #1e1e1e !important;
-            color: #666666 !important;
+            color: #666 !important;
             box-shadow: none !important;
             cursor: not-allowed !important;
             opacity: 0.7 !important;
@@ -88,12 +97,12 @@ def get_common_button_css():
         /* Navigation panel specific styling */
         section[data-testid="stSidebarContent"] div.stButton button {
             background-color: #1e1e2d !important;
-            color: #ffffff !important;
+            color: #fff !important;
             margin: 0.15rem 0 !important;
             padding: 0.5rem 0.75rem !important;
             min-height: 32px !important;
             border-radius: 4px !important;
-            transition: all 0.2s ease !important;
+            transition: background-color 0.2s ease, transform 0.2s ease !important;
         }
         
         section[data-testid="stSidebarContent"] div.stButton button:hover {
@@ -122,9 +131,11 @@ def get_common_button_css():
         </style>
     """
 
-def get_landing_page_css():
-    """Return the CSS for the landing page"""
-    return """
+def get_common_button_css():
+    """Return the CSS for common button styling"""
+    return _COMMON_BUTTON_CSS
+
+_LANDING_PAGE_CSS = """
         <style>
         .main > div {
             padding: 1rem;
@@ -155,9 +166,11 @@ def get_landing_page_css():
         </style>
     """
 
-def get_sidebar_css():
-    """Return the CSS for the sidebar navigation"""
-    return """
+def get_landing_page_css():
+    """Return the CSS for the landing page"""
+    return _LANDING_PAGE_CSS
+
+_SIDEBAR_CSS = """
         <style>
             section[data-testid="stSidebar"] > div {
                 padding-top: 1rem;
@@ -189,12 +202,12 @@ def get_sidebar_css():
                 padding: 0.75rem 1rem;
                 margin: 0.25rem 0;
                 background-color: #1e1e2d !important;
-                color: #ffffff;
+                color: #fff;
                 border: none;
                 border-radius: 4px;
                 text-align: center;
                 font-size: 0.9rem;
-                transition: all 0.2s ease;
+                transition: background-color 0.2s ease, transform 0.2s ease;
             }
             
             /* Button hover effect */
@@ -205,9 +218,81 @@ def get_sidebar_css():
         </style>
     """
 
-def get_radio_button_css():
-    """Return the CSS for enhanced radio buttons"""
-    return """
+def get_sidebar_css():
+    """Return the CSS for the sidebar navigation"""
+    return _SIDEBAR_CSS
+
+_SIDEBAR_BUTTONS_CSS = """
+        <style>
+            /* Center all content in sidebar */
+            [data-testid="stSidebarUserContent"] {
+                display: flex !important;
+                flex-direction: column !important;
+                align-items: center !important;
+            }
+
+            /* Logo container styling */
+            [data-testid="stSidebarUserContent"] div:has(> img) {
+                display: flex !important;
+                justify-content: center !important;
+                align-items: center !important;
+                padding: 0.2rem 0 0.6rem 0 !important;
+                margin: 0 !important;
+                width: 100% !important;
+            }
+
+            /* Logo image styling */
+            [data-testid="stSidebarUserContent"] img {
+                width: 200px !important;
+                height: auto !important;
+                margin: 0 auto !important;
+                align-items: center !important;
+            }
+
+            /* Navigation buttons container */
+            div[data-testid="stSidebarUserContent"] div[data-testid="stButton"] {
+                width: 98% !important;
+                margin: 0.01rem auto !important;
+            }
+
+            /* Style the button text itself */
+            div[data-testid="stSidebarUserContent"] div[data-testid="stButton"] > button {
+                width: 100%;
+                padding: 0.5rem 0.75rem;
+                margin: 0.1rem 0;
+                background-color: #23232b !important;
+                color: #fafafa;
+                border: none !important;
+                border-radius: 0.4rem;
+                text-align: left;
+                transition: color 0.2s, background-color 0.2s;
+                box-shadow: none !important;
+            }
+
+            /* Hover effect - subtle background */
+            div[data-testid="stSidebarUserContent"] div[data-testid="stButton"] > button:hover:not(:disabled) {
+                background-color: rgba(255, 255, 255, 0.05) !important;
+                color: #6fa8dc !important;
+                border: none !important;
+            }
+
+            /* Active/Selected state - left border and highlight */
+            div[data-testid="stSidebarUserContent"] div[data-testid="stButton"] > button:focus,
+            div[data-testid="stSidebarUserContent"] div[data-testid="stButton"] > button:active,
+            div[data-testid="stSidebarUserContent"] div[data-testid="stButton"] > button[kind="secondary"] {
+                background-color: rgba(255, 255, 255, 0.08) !important;
+                color: #fff !important;
+                border-left: 3px solid #6fa8dc !important;
+                padding-left: calc(0.75rem - 3px) !important; /* Adjust padding for border */
+            }
+        </style>
+    """
+
+def get_sidebar_buttons_css():
+    """Return the CSS for the sidebar logo and navigation buttons"""
+    return _SIDEBAR_BUTTONS_CSS
+
+_RADIO_BUTTON_CSS = """
         <style>
         div.row-widget.stRadio > div {
             flex-direction: column;
@@ -219,7 +304,7 @@ def get_radio_button_css():
             border: 1px solid #4e4e61;
             border-radius: 5px;
             width: 100%;
-            transition: all 0.2s ease;
+            transition: background-color 0.2s ease, border-color 0.2s ease, box-shadow 0.2s ease, transform 0.2s ease;
         }
         div.row-widget.stRadio > div[role="radiogroup"] > label:hover {
             background: #3b3b49;
@@ -238,23 +323,22 @@ def get_radio_button_css():
         </style>
     """
 
-def get_print_export_css():
-    """Return the CSS for print/PDF export"""
-    return """
+def get_radio_button_css():
+    """Return the CSS for enhanced radio buttons"""
+    return _RADIO_BUTTON_CSS
+
+_PRINT_EXPORT_CSS = """
     <style>
     @media print {
         header, footer, .stSidebar, .main .block-container > div:first-child, 
         button[kind="primary"], button[kind="secondary"], .reportview-container .main footer,
-        .viewerBadge_container__1QSob, [data-testid="stToolbar"] {
+        .viewerBadge_container__1QSob, [data-testid="stToolbar"], [data-testid="stHeader"] {
             display: none !important;
         }
         .main .block-container {
             max-width: 100% !important;
             padding: 0 !important;
         }
-        [data-testid="stHeader"] {
-            display: none !important;
-        }
         h1 {
             text-align: center;
             font-size: 1.5em !important;
@@ -270,9 +354,11 @@ def get_print_export_css():
     </style>
     """
 
-def get_header_css():
-    """Return the CSS for the application header"""
-    return """
+def get_print_export_css():
+    """Return the CSS for print/PDF export"""
+    return _PRINT_EXPORT_CSS
+
+_HEADER_CSS = """
         <style>
         /* Reset all default spacing */
         .main .block-container {
@@ -309,8 +395,9 @@ def get_header_css():
             line-height: 1;
         }
 
-        /* Remove Streamlit container spacing */
-        div[data-testid="stMarkdown"] {
+        /* Remove Streamlit container spacing and fix vertical block spacing */
+        div[data-testid="stMarkdown"],
+        div[data-testid="stVerticalBlock"] > div {
             margin: 0 !important;
             padding: 0 !important;
         }
@@ -323,27 +410,19 @@ def get_header_css():
             padding: 0 !important;
         }
 
-        /* Remove top toolbar spacing */
-        [data-testid="stToolbar"] {
-            display: none !important;
-        }
-
-        /* Remove default header */
+        /* Remove top toolbar spacing and default header */
+        [data-testid="stToolbar"],
         [data-testid="stHeader"] {
             display: none !important;
         }
-
-        /* Fix vertical block spacing */
-        div[data-testid="stVerticalBlock"] > div {
-            margin: 0 !important;
-            padding: 0 !important;
-        }
         </style>
     """
 
-def get_expiry_box_css():
-    """Return the CSS for admin token expiry box styling"""
-    return """
+def get_header_css():
+    """Return the CSS for the application header"""
+    return _HEADER_CSS
+
+_EXPIRY_BOX_CSS = """
     <style>
     /* Fix alignment between input and display box */
     div[data-testid="column"] > div {
@@ -358,7 +437,7 @@ def get_expiry_box_css():
     /* Style for the expiry box */
     .expiry-box {
         background-color: #262730;
-        color: #ffffff;
+        color: #fff;
         border-radius: 5px;
         padding: 10px 15px;
         display: flex;
@@ -370,10 +449,63 @@ def get_expiry_box_css():
     </style>
     """
 
-# Update the print button HTML to use the special-button class
-def get_print_button_html():
-    """Return the HTML for the print button"""
-    return """
+def get_expiry_box_css():
+    """Return the CSS for admin token expiry box styling"""
+    return _EXPIRY_BOX_CSS
+
+# Generated-token card on the admin page
+_TOKEN_BOX_CSS = """
+    <style>
+    .token-box {
+        padding: 20px;
+        background: linear-gradient(135deg, #1a2980, #26d0ce);
+        border: 1px solid #4a90e2;
+        border-radius: 8px;
+        margin: 15px 0;
+        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
+    }
+    .token-box h3 {
+        color: white;
+        margin-bottom: 15px;
+        font-size: 1.4rem;
+        text-shadow: 1px 1px 2px rgba(0,0,0,0.2);
+    }
+    .token-value {
+        font-family: monospace;
+        font-size: 1.2em;
+        font-weight: bold;
+        padding: 15px;
+        background-color: rgba(255, 255, 255, 0.9);
+        color: #1a2980;
+        border-radius: 5px;
+        word-wrap: break-word;
+        margin-bottom: 15px;
+        border-left: 4px solid #26d0ce;
+    }
+    .token-details {
+        margin-top: 15px;
+        font-size: 1em;
+    }
+    .token-details table {
+        width: 100%;
+    }
+    .token-details td {
+        padding: 6px 0;
+    }
+    .token-details td:first-child {
+        font-weight: bold;
+        width: 40%;
+        color: #1a2980;
+    }
+    </style>
+    """
+
+def get_token_box_css():
+    """Return the CSS for the admin generated-token card"""
+    return _TOKEN_BOX_CSS
+
+# Print button HTML (uses the special-button class); static, so built once at import
+_PRINT_BUTTON_HTML = """
     <div style="text-align: right; margin: 0.5rem 0;">
         <button 
             onclick="window.print()"
@@ -385,10 +517,12 @@ def get_print_button_html():
     </div>
     """
 
+def get_print_button_html():
+    """Return the HTML for the print button"""
+    return _PRINT_BUTTON_HTML
+
 # Update section navigation to use common button styles
-def get_section_navigation_css():
-    """Return the CSS for the section navigation in dark theme"""
-    return """
+_SECTION_NAVIGATION_CSS = """
         <style>
         section[data-testid="stSidebarContent"] div.stExpander {
             background-color: transparent !important;
@@ -451,18 +585,20 @@ def get_section_navigation_css():
         </style>
     """
 
-def get_informatica_solution_css():
-    """Return the CSS for Informatica solution styling"""
-    return """
+def get_section_navigation_css():
+    """Return the CSS for the section navigation in dark theme"""
+    return _SECTION_NAVIGATION_CSS
+
+_INFORMATICA_SOLUTION_CSS = """
         <style>
         .informatica-solution {
-            color: #FF4B4B !important;
+            color: #ff4b4b !important;
             font-weight: bold;
         }
         .question-text a {
-            color: #FF4B4B;
+            color: #ff4b4b;
             text-decoration: none;
-            border-bottom: 1px dashed #FF4B4B;
+            border-bottom: 1px dashed #ff4b4b;
         }
         .question-text a:hover {
             color: #ff7575;
@@ -471,9 +607,11 @@ def get_informatica_solution_css():
         </style>
     """
 
-def get_section_header_css():
-    """Return the CSS for section headers"""
-    return """
+def get_informatica_solution_css():
+    """Return the CSS for Informatica solution styling"""
+    return _INFORMATICA_SOLUTION_CSS
+
+_SECTION_HEADER_CSS = """
         <style>
         /* Section header */
         .section-header {
@@ -519,9 +657,11 @@ def get_section_header_css():
         </style>
     """
 
-def get_progress_metrics_css():
-    """Return the CSS for progress metrics"""
-    return """
+def get_section_header_css():
+    """Return the CSS for section headers"""
+    return _SECTION_HEADER_CSS
+
+_PROGRESS_METRICS_CSS = """
         <style>
         .progress-metric {
             margin: 0.5rem 0;
@@ -530,16 +670,18 @@ def get_progress_metrics_css():
         </style>
     """
 
-def get_penalties_table_css():
-    """Return the CSS for penalties table"""
-    return """
+def get_progress_metrics_css():
+    """Return the CSS for progress metrics"""
+    return _PROGRESS_METRICS_CSS
+
+_PENALTIES_TABLE_CSS = """
         <style>
         .penalties-table {
             width: 100%;
             border-collapse: collapse;
             font-size: 0.85em;
             margin: 0.5em 0;
-            background: #1E1E1E;
+            background: #1e1e1e;
         }
         .penalties-table th:first-child,
         .penalties-table td:first-child {
@@ -553,11 +695,11 @@ def get_penalties_table_css():
             text-align: left;
         }
         .penalties-table th {
-            background: ##ff7070;
+            background: #ff7070;
             color: white;
             text-align: left;
             font-weight: 600;
-            border-bottom: 2px solid #FF6B6B;
+            border-bottom: 2px solid #ff6b6b;
         }
         .penalties-table td {
             border-bottom: 1px solid rgba(255, 255, 255, 0.1);
@@ -575,17 +717,19 @@ def get_penalties_table_css():
             margin-top: 10px;
             border-radius: 0 4px 4px 0;
             font-size: 0.85em;
-            color: #FFF;
+            color: #fff;
         }
         </style>
     """
 
-def get_discovery_button_css():
-    """Return the CSS for discovery button"""
-    return """
+def get_penalties_table_css():
+    """Return the CSS for penalties table"""
+    return _PENALTIES_TABLE_CSS
+
+_DISCOVERY_BUTTON_CSS = """
         <style>
         .discovery-button {
-            background-color: #4B4BFF;
+            background-color: #4b4bff;
             color: white;
             padding: 10px 20px;
             border-radius: 5px;
@@ -595,26 +739,28 @@ def get_discovery_button_css():
             transition: background-color 0.3s;
         }
         .discovery-button:hover {
-            background-color: #3A3AFF;
+            background-color: #3a3aff;
         }
         </style>
     """
 
-def get_faq_css():
-    """Return the CSS for FAQ page"""
-    return """
+def get_discovery_button_css():
+    """Return the CSS for discovery button"""
+    return _DISCOVERY_BUTTON_CSS
+
+_FAQ_CSS = """
         <style>
         .faq-header {
-            color: #FF4B4B;
+            color: #ff4b4b;
             margin-bottom: 2rem;
         }
         .faq-category {
-            color: #FFA500;
+            color: #ffa500;
             margin-top: 2rem;
         }
         .faq-question {
-            color: #ffffff;
-            background-color: #2E2E2E;
+            color: #fff;
+            background-color: #2e2e2e;
             padding: 1rem;
             border-radius: 5px;
             margin: 1rem 0;
@@ -622,9 +768,11 @@ def get_faq_css():
         </style>
     """
 
-def get_input_label_css():
-    """Return the CSS for input labels, now with white color for all labels."""
-    return """
+def get_faq_css():
+    """Return the CSS for FAQ page"""
+    return _FAQ_CSS
+
+_INPUT_LABEL_CSS = """
         <style>
         .input-label {
             font-size: 1rem;
@@ -640,9 +788,64 @@ def get_input_label_css():
         </style>
     """
 
-def get_app_header_css():
-    """Return the CSS for the application header"""
-    return """
+def get_input_label_css():
+    """Return the CSS for input labels, now with white color for all labels."""
+    return _INPUT_LABEL_CSS
+
+_SUBTITLE_CSS = """
+        <style>
+        .subtitle {
+            font-size: 1.5em;
+            color: #ffdb58;
+            font-weight: 500;
+            margin-bottom: 1.2em;
+            margin-top: 0.2em;
+            letter-spacing: 0.01em;
+        }
+        </style>
+    """
+
+def get_subtitle_css():
+    """Return the CSS for the page subtitle on the welcome and analyzer pages"""
+    return _SUBTITLE_CSS
+
+_COMPACT_BUTTON_CSS = """
+        <style>
+        .compact-center-btn {
+            display: flex;
+            justify-content: center;
+            margin-top: 1em;
+            margin-bottom: 1em;
+        }
+        .compact-center-btn button {
+            max-width: 160px !important;
+            min-width: 120px !important;
+            width: 100% !important;
+        }
+        </style>
+    """
+
+def get_compact_button_css():
+    """Return the CSS that shrinks the analyzer's Start Assessment button"""
+    return _COMPACT_BUTTON_CSS
+
+_POLICY_ANALYSIS_HEADER_CSS = """
+        <style>
+        .policy-analysis-header {
+            font-size: 1.3em;
+            font-weight: 600;
+            color: #6fa8dc;
+            margin-bottom: 0.5em;
+            margin-top: 0.5em;
+        }
+        </style>
+    """
+
+def get_policy_analysis_header_css():
+    """Return the CSS for the privacy policy analysis header"""
+    return _POLICY_ANALYSIS_HEADER_CSS
+
+_APP_HEADER_CSS = """
         <style>
         .app-header {
             display: flex;
@@ -667,15 +870,17 @@ def get_app_header_css():
         }
         .header-text p {
             margin: 2px 0 0 0;
-            color: #cccccc;
+            color: #ccc;
             font-size: 0.9em;
         }
         </style>
     """
 
-def get_contact_link_css():
-    """Return the CSS for contact link"""
-    return """
+def get_app_header_css():
+    """Return the CSS for the application header"""
+    return _APP_HEADER_CSS
+
+_CONTACT_LINK_CSS = """
         <style>
         .contact-link {
             font-size: 0.9rem;
@@ -684,9 +889,11 @@ def get_contact_link_css():
         </style>
     """
 
-def get_ai_analysis_css():
-    """Return the CSS for the AI analysis section"""
-    return """
+def get_contact_link_css():
+    """Return the CSS for contact link"""
+    return _CONTACT_LINK_CSS
+
+_AI_ANALYSIS_CSS = """
         <style>
         .ai-analysis-container {
             margin: 20px 0;
@@ -694,18 +901,18 @@ def get_ai_analysis_css():
             background-color: rgba(75, 75, 255, 0.1);
             padding: 20px;
             border-radius: 5px;
-            border-left: 4px solid #4B4BFF;
+            border-left: 4px solid #4b4bff;
             font-size: 1.1em;
             line-height: 1.3;
             white-space: normal;
         }
         .ai-analysis-header {
-            color: #4B4BFF;
+            color: #4b4bff;
             margin-bottom: 15px;
             font-size: 1.8em;
         }
         .ai-analysis-text {
-            color: #FFF;
+            color: #fff;
             margin-bottom: 20px;
             font-size: 1.1em;
         }
@@ -713,9 +920,11 @@ def get_ai_analysis_css():
         </style>
     """
 
-def get_penalties_section_css():
-    """Return the CSS for the penalties section block, header, and text."""
-    return """
+def get_ai_analysis_css():
+    """Return the CSS for the AI analysis section"""
+    return _AI_ANALYSIS_CSS
+
+_PENALTIES_SECTION_CSS = """
     <style>
     .penalties-container {
         background: #23232b;
@@ -723,10 +932,10 @@ def get_penalties_section_css():
         padding: 24px 32px 18px 32px;
         margin: 32px 0 24px 0;
         box-shadow: 0 2px 8px rgba(0,0,0,0.08);
-        border-left: 5px solid #FF4B4B;
+        border-left: 5px solid #ff4b4b;
     }
     .penalties-header {
-        color: #FF4B4B;
+        color: #ff4b4b;
         font-size: 1.5rem;
         font-weight: 700;
         margin-bottom: 10px;
@@ -741,32 +950,36 @@ def get_penalties_section_css():
     </style>
     """
 
-def get_countdown_section_css():
-    """Return the CSS for countdown section"""
-    return """
+def get_penalties_section_css():
+    """Return the CSS for the penalties section block, header, and text."""
+    return _PENALTIES_SECTION_CSS
+
+_COUNTDOWN_SECTION_CSS = """
         <style>
         .countdown-container {
-            background-color: #1E1E1E;
+            background-color: #1e1e1e;
             padding: 20px;
             border-radius: 10px;
             margin: 20px 0;
         }
         .countdown-header {
-            color: #FF4B4B;
+            color: #ff4b4b;
             margin-bottom: 15px;
             font-size: 1.4em;
         }
         .countdown-text {
-            color: #FFF;
+            color: #fff;
             margin-bottom: 20px;
             font-size: 1.1em;
         }
         </style>
     """
 
-def get_logo_css():
-    """Return the CSS for logo styling"""
-    return """
+def get_countdown_section_css():
+    """Return the CSS for countdown section"""
+    return _COUNTDOWN_SECTION_CSS
+
+_LOGO_CSS = """
         <style>
         .logo-image {
             width: 230px;
@@ -792,9 +1005,11 @@ def get_logo_css():
         </style>
     """
 
-def get_expiry_text_css():
-    """Return the CSS for expiry text"""
-    return """
+def get_logo_css():
+    """Return the CSS for logo styling"""
+    return _LOGO_CSS
+
+_EXPIRY_TEXT_CSS = """
         <style>
         .expiry-text {
             font-weight: bold;
@@ -802,9 +1017,11 @@ def get_expiry_text_css():
         </style>
     """
 
-def get_spacing_css():
-    """Return the CSS for spacing adjustments"""
-    return """
+def get_expiry_text_css():
+    """Return the CSS for expiry text"""
+    return _EXPIRY_TEXT_CSS
+
+_SPACING_CSS = """
         <style>
         .negative-margin-top {
             margin-top: -40px;
@@ -812,9 +1029,11 @@ def get_spacing_css():
         </style>
     """
 
-def get_data_discovery_css():
-    """Return the CSS for the data discovery page"""
-    return """
+def get_spacing_css():
+    """Return the CSS for spacing adjustments"""
+    return _SPACING_CSS
+
+_DATA_DISCOVERY_CSS = """
         <style>
         /* Page container styling */
         div[data-testid="stVerticalBlock"] > div > div:has(div.stHeader) {
@@ -857,7 +1076,7 @@ def get_data_discovery_css():
             height: auto !important;
             min-height: 32px !important;
             line-height: 1.2 !important;
-            background-color: #4B4BFF !important;
+            background-color: #4b4bff !important;
             border-radius: 4px !important;
             margin: 5px !important;
             width: auto !important;
@@ -886,18 +1105,20 @@ def get_data_discovery_css():
         
         /* Make high-risk items stand out */
         .high-risk { 
-            color: #FF4B4B !important;
+            color: #ff4b4b !important;
             font-weight: bold;
         }
         </style>
     """
 
-def get_magic_quadrant_css():
-    """Return the CSS for the magic quadrant section"""
-    return """
+def get_data_discovery_css():
+    """Return the CSS for the data discovery page"""
+    return _DATA_DISCOVERY_CSS
+
+_MAGIC_QUADRANT_CSS = """
         <style>
         .magic-quadrant-section {
-            background: #1E1E1E;
+            background: #1e1e1e;
             padding: 20px;
             border-radius: 10px;
             margin: 40px 0;
@@ -936,7 +1157,7 @@ def get_magic_quadrant_css():
             text-align: center;
         }
         .new-badge {
-            background: #8A2BE2;
+            background: #8a2be2;
             color: white;
             padding: 2px 8px;
             border-radius: 15px;
@@ -955,7 +1176,7 @@ def get_magic_quadrant_css():
             width: 100%;
             height: 100%;
             object-fit: contain;
-            transition: all 0.3s ease;
+            transition: transform 0.3s ease, box-shadow 0.3s ease;
             background: white;
             border-radius: 8px;
         }
@@ -974,9 +1195,11 @@ def get_magic_quadrant_css():
         </style>
     """
 
-def get_ai_report_css():
-    """Return the CSS for the AI report section"""
-    return """
+def get_magic_quadrant_css():
+    """Return the CSS for the magic quadrant section"""
+    return _MAGIC_QUADRANT_CSS
+
+_AI_REPORT_CSS = """
         <style>
         .ai-analysis-container {
             background: rgba(255, 255, 255, 0.05);
@@ -984,14 +1207,7 @@ def get_ai_report_css():
             border-radius: 10px;
             margin: 20px 0;
         }
-        .ai-analysis-container h1 {
-            font-size: 1.8em;
-            font-weight: bold;
-            color: white;
-            margin-bottom: 25px;
-            padding-bottom: 15px;
-            border-bottom: 2px solid rgba(255, 255, 255, 0.1);
-        }
+        .ai-analysis-container h1,
         .ai-analysis-container .report-header {
             font-size: 1.8em;
             font-weight: bold;
@@ -1030,9 +1246,11 @@ def get_ai_report_css():
         </style>
     """
 
-def get_penalties_note_css():
-    """Return the CSS for the penalties note section"""
-    return """
+def get_ai_report_css():
+    """Return the CSS for the AI report section"""
+    return _AI_REPORT_CSS
+
+_PENALTIES_NOTE_CSS = """
         <style>
         .penalties-note {
             background: rgba(255, 255, 255, 0.05);
@@ -1041,14 +1259,16 @@ def get_penalties_note_css():
             margin-top: 15px;
             font-size: 0.9em;
             color: #aaa;
-            border-left: 3px solid #4B4BFF;
+            border-left: 3px solid #4b4bff;
         }
         </style>
     """
 
-def get_download_button_css():
-    """Return the CSS for download button styling"""
-    return """
+def get_penalties_note_css():
+    """Return the CSS for the penalties note section"""
+    return _PENALTIES_NOTE_CSS
+
+_DOWNLOAD_BUTTON_CSS = """
         <style>
         /* Download button specific styles */
         div[data-testid="stDownloadButton"] button {
@@ -1060,7 +1280,7 @@ def get_download_button_css():
             font-size: 0.92rem !important;
             font-weight: 600 !important;
             text-align: center !important;
-            transition: all 0.3s ease !important;
+            transition: background-color 0.3s ease, box-shadow 0.3s ease, transform 0.3s ease !important;
             box-shadow: 0 4px 6px rgba(0,0,0,0.1) !important;
             margin: 1rem 0 !important;
             min-width: 120px !important;
@@ -1083,8 +1303,8 @@ def get_download_button_css():
         }
         
         div[data-testid="stDownloadButton"] button:disabled {
-            background-color: #cccccc !important;
-            color: #666666 !important;
+            background-color: #ccc !important;
+            color: #666 !important;
             cursor: not-allowed !important;
             transform: none !important;
             box-shadow: none !important;
@@ -1098,3 +1318,342 @@ def get_download_button_css():
         }
         </style>
     """
+
+def get_download_button_css():
+    """Return the CSS for download button styling"""
+    return _DOWNLOAD_BUTTON_CSS
+
+_PAGE_HEADER_CSS = """
+        <style>
+        /* Compact header */
+        .app-header {
+            background: rgba(30, 30, 30, 0.8);
+            padding: 0.4rem 0.5rem;
+            border-radius: 4px;
+            margin: 0;
+        }
+        .header-text {
+            margin: 0;
+            padding: 0;
+            text-align: center;
+        }
+        .header-text h1 {
+            color: white;
+            font-size: 2.2rem;
+            margin: 0;
+            padding: 0;
+            line-height: 1.1;
+        }
+        .header-text p {
+            color: rgba(250, 250, 250, 0.8);
+            font-size: 1.15rem;
+            margin: 0.1rem 0 0 0;
+            padding: 0;
+            line-height: 1;
+        }
+        /* Remove Streamlit spacing only within the header */
+        .app-header .element-container,
+        .app-header div[data-testid="stMarkdown"],
+        .app-header div[data-testid="stVerticalBlock"] {
+            margin: 0 !important;
+            padding: 0 !important;
+        }
+        /* Compact section title */
+        .section-title {
+            font-size: 1.2rem;
+            margin: 0.3rem 0;
+            padding: 0;
+            line-height: 1.2;
+        }
+        /* Compact progress section */
+        .progress-section {
+            margin: 0.3rem 0;
+            padding: 0;
+            font-size: 0.85rem;
+            opacity: 0.8;
+        }
+        .stProgress {
+            margin: 0.2rem 0 !important;
+            padding: 0 !important;
+        }
+        /* Question spacing */
+        .question-container {
+            margin-top: 0.5rem !important;
+        }
+        </style>
+    """
+
+def get_page_header_css():
+    """Return the CSS for the compact header rendered above every page"""
+    return _PAGE_HEADER_CSS
+
+_LANDING_LAYOUT_CSS = """
+        <style>
+        /* Target the main block containing landing page elements */
+        div[data-testid="stVerticalBlock"] > div.stHorizontalBlock > div[data-testid="stVerticalBlock"] {
+            align-items: center;
+        }
+        
+        /* Improved logo centering */
+        .logo-container {
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            width: 100%;
+            margin: 0 auto;
+            padding: 20px 0;
+        }
+        
+        .logo-container img {
+            max-width: 300px;
+            height: auto;
+            display: block;
+            margin: 0 auto;
+        }
+        
+        /* Ensure the middle column is properly centered */
+        div[data-testid="stHorizontalBlock"] > div:nth-child(2) {
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            text-align: center;
+        }
+        </style>
+    """
+
+def get_landing_layout_css():
+    """Return the CSS that centers the landing page content and logo"""
+    return _LANDING_LAYOUT_CSS
+
+_NAVIGATION_PANEL_CSS = """
+        <style>
+        div.stExpander {
+            background-color: #0e1117;
+            border: 1px solid rgba(49, 51, 63, 0.2);
+        }
+        /* Dark theme buttons */
+        div.stButton > button {
+            width: 100%;
+            padding: 0.5rem;
+            margin: 0.25rem 0;
+            background-color: #1e1e1e !important;
+            color: #fafafa;
+            border: 1px solid #333 !important;
+            border-radius: 0.3rem;
+            transition: background-color 0.2s, border-color 0.2s;
+        }
+        /* Hover effect */
+        div.stButton > button:hover:not(:disabled) {
+            background-color: #2d2d2d !important;
+            border-color: #404040 !important;
+        }
+        /* Disabled button */
+        div.stButton > button:disabled {
+            background-color: #161616 !important;
+            color: #666;
+            border-color: #292929 !important;
+        }
+        /* Current section highlight */
+        div.stButton > button.current {
+            border-left: 3px solid #666 !important;
+        }
+        </style>
+    """
+
+def get_navigation_panel_css():
+    """Return the CSS for the assessment navigation panel"""
+    return _NAVIGATION_PANEL_CSS
+
+_TESTING_TOOLS_CSS = """
+        <style>
+        /* Expander styling */
+        .streamlit-expanderHeader {
+            background-color: #262730 !important;
+            border: none !important;
+            border-radius: 4px !important;
+            color: #fafafa !important;
+            font-size: 14px !important;
+        }
+        .streamlit-expanderHeader:hover {
+            background-color: #1e1e1e !important;
+        }
+        /* Testing tools container */
+        div.stExpander {
+            border: none !important;
+            background-color: transparent !important;
+        }
+        /* Radio buttons in testing tools */
+        div.stExpander div[data-testid="stRadio"] > div {
+            display: flex !important;
+            flex-direction: column !important;
+            gap: 8px !important;
+        }
+        div.stExpander div[data-testid="stRadio"] label {
+            background-color: #262730 !important;
+            padding: 8px 12px !important;
+            border-radius: 4px !important;
+            color: #fafafa !important;
+            transition: background-color 0.2s, color 0.2s !important;
+        }
+        div.stExpander div[data-testid="stRadio"] label:hover {
+            background-color: #1e1e1e !important;
+            color: #6fa8dc !important;
+        }
+        /* Button styling */
+        div.stExpander div[data-testid="stButton"] > button {
+            width: 100% !important;
+            padding: 8px 12px !important;
+            margin: 4px 0 !important;
+            background-color: #262730 !important;
+            color: #fafafa !important;
+            border: none !important;
+            border-radius: 4px !important;
+            text-align: left !important;
+            transition: background-color 0.2s, color 0.2s !important;
+        }
+        div.stExpander div[data-testid="stButton"] > button:hover {
+            background-color: #1e1e1e !important;
+            color: #6fa8dc !important;
+        }
+        div.stExpander div[data-testid="stButton"] > button:active {
+            border-left: 3px solid #6fa8dc !important;
+        }
+        </style>
+    """
+
+def get_testing_tools_css():
+    """Return the CSS for the admin testing tools expander"""
+    return _TESTING_TOOLS_CSS
+
+_DIAGRAM_CSS = """
+        <style>
+        .diagram-section-bg {
+            background: #181c24; /* Dark background color */
+            border-radius: 12px;
+            padding: 32px 10px 10px 10px;
+            margin-bottom: 1rem;
+            min-height: 520px;
+            box-shadow: 0 2px 12px rgba(0,0,0,0.10);
+        }
+        .diagram-container {
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            width: 100%;
+            padding: 0;
+            margin: 0;
+            overflow: auto;
+            min-height: 500px;
+            background: transparent;
+        }
+        .diagram-content {
+            position: relative;
+            width: 100%;
+            height: 100%;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+        }
+        .diagram-content svg {
+            max-width: 100%;
+            height: auto;
+            transform-origin: center;
+            transition: transform 0.3s ease;
+        }
+        @media (max-width: 1200px) {
+            .diagram-section-bg { min-height: 470px; }
+            .diagram-content svg { transform: scale(0.85); }
+        }
+        @media (max-width: 992px) {
+            .diagram-section-bg { min-height: 420px; }
+            .diagram-content svg { transform: scale(0.75); }
+        }
+        @media (max-width: 768px) {
+            .diagram-section-bg { min-height: 370px; }
+            .diagram-content svg { transform: scale(0.65); }
+        }
+        @media (max-width: 576px) {
+            .diagram-section-bg { min-height: 320px; }
+            .diagram-content svg { transform: scale(0.5); }
+        }
+        </style>
+    """
+
+def get_diagram_css():
+    """Return the CSS for the report's framework diagram components"""
+    return _DIAGRAM_CSS
+
+# CSS shared by every authenticated page (sidebar, logo, navigation, buttons).
+# Order matters: later blocks win ties in specificity.
+_GLOBAL_CSS = (
+    _SIDEBAR_BUTTONS_CSS,
+    _LOGO_CSS,
+    _SECTION_NAVIGATION_CSS,
+    _COMMON_BUTTON_CSS,
+    _PAGE_HEADER_CSS,
+)
+
+# Page-specific CSS, keyed by st.session_state.current_page. Each page only
+# ships the blocks it actually renders.
+_PAGE_CSS = {
+    "landing": (_LANDING_PAGE_CSS, _CONTACT_LINK_CSS, _LANDING_LAYOUT_CSS),
+    "welcome": (_INPUT_LABEL_CSS, _SUBTITLE_CSS),
+    "assessment": (_NAVIGATION_PANEL_CSS, _TESTING_TOOLS_CSS),
+    "report": (
+        _AI_ANALYSIS_CSS,
+        _AI_REPORT_CSS,
+        _DOWNLOAD_BUTTON_CSS,
+        _PENALTIES_SECTION_CSS,
+        _PENALTIES_TABLE_CSS,
+        _COUNTDOWN_SECTION_CSS,
+        _DISCOVERY_BUTTON_CSS,
+        _MAGIC_QUADRANT_CSS,
+    ),
+    "discovery": (_DATA_DISCOVERY_CSS, _PENALTIES_NOTE_CSS),
+    "privacy": (
+        _INPUT_LABEL_CSS,
+        _SUBTITLE_CSS,
+        _COMPACT_BUTTON_CSS,
+        _POLICY_ANALYSIS_HEADER_CSS,
+        _AI_REPORT_CSS,
+        _DOWNLOAD_BUTTON_CSS,
+        _PENALTIES_SECTION_CSS,
+        _PENALTIES_TABLE_CSS,
+        _DISCOVERY_BUTTON_CSS,
+        _MAGIC_QUADRANT_CSS,
+    ),
+    "faq": (_FAQ_CSS,),
+    "admin": (_EXPIRY_BOX_CSS, _TOKEN_BOX_CSS),
+}
+
+def minify_css(css):
+    """Strip comments and redundant whitespace from a CSS/<style> string"""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_WHITESPACE_RE.sub(" ", css)
+    return _CSS_PUNCTUATION_RE.sub(r"\1", css).strip()
+
+@functools.lru_cache(maxsize=None)
+def get_page_css(page):
+    """Return the combined, minified CSS for a single page"""
+    return sys.intern(minify_css("".join(_PAGE_CSS.get(page, ()))))
+
+def inject_page_css(page=None):
+    """Inject the CSS for the given page (defaults to the current page)"""
+    if page is None:
+        page = st.session_state.get('current_page', 'welcome')
+    css = get_page_css(page)
+    if css:
+        st.html(css)
+
+@functools.lru_cache(maxsize=None)
+def get_all_css(page):
+    """Return the global CSS followed by the CSS for the given page, minified"""
+    return sys.intern(minify_css("".join(_GLOBAL_CSS)) + get_page_css(page))
+
+def inject_styles(page):
+    """Inject all CSS needed by a page with a single st.html call.
+
+    Call this exactly once per rerun. Streamlit drops elements that are not
+    re-emitted on a rerun, so the styles must be sent on every run.
+    """
+    st.html(get_all_css(page))
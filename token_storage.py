@@ -8,8 +8,12 @@ This module handles:
 
 import os
 import csv
+import mmap
+import functools
 import secrets
+import sys
 import logging
+import threading
 from datetime import datetime, timedelta
 from typing import Optional, Tuple
 from config import BASE_DIR
@@ -23,6 +27,9 @@ TOKEN_EXPIRY_DAYS = 30
 SECURE_DIR = os.path.join(BASE_DIR, "secure")
 TOKENS_FILE = os.path.join(SECURE_DIR, "tokens.csv")
 
+# Tokens that grant admin access without a row in tokens.csv
+ADMIN_TOKENS = frozenset({'dpdp2025'})
+
 # Also expose TOKEN_PATH for backwards compatibility
 TOKEN_PATH = TOKENS_FILE
 
@@ -31,23 +38,125 @@ os.makedirs(SECURE_DIR, exist_ok=True)
 
 # Define standard column order as a constant
 TOKEN_CSV_COLUMNS = ['token', 'created_at', 'expires_at', 'organization_name', 'generated_by']
+_TOKEN_CSV_COLUMNS_SET = frozenset(TOKEN_CSV_COLUMNS)
+
+# Larger buffer for whole-file reads/writes of tokens.csv (default is 8 KiB)
+_IO_BUFSIZE = 128 * 1024
+
+# Set once ensure_token_storage has verified the file
+_storage_ensured = False
+
+# In-memory index of tokens.csv: token -> (expires_at, organization_name, byte offset).
+# Rebuilt only when the file's mtime/size changes.
+_TOKEN_CACHE = {}
+_TOKEN_CACHE_STAT = None
+_TOKEN_CACHE_LOCK = threading.RLock()
+
+# Revoked rows are commented out in place by overwriting their first byte;
+# cleanup_expired_tokens compacts them away
+_TOMBSTONE = b'#'
+
+def iter_csv_records(f):
+    """Yield (byte offset, raw bytes) for each record of a CSV opened in binary mode.
+
+    Quoted fields may contain newlines, so a record runs on until its quotes balance.
+    """
+    while True:
+        offset = f.tell()
+        record = f.readline()
+        if not record:
+            return
+        # Escaped quotes are doubled, so an odd count means a quoted field is still open
+        while record.count(b'"') % 2:
+            line = f.readline()
+            if not line:
+                break
+            record += line
+        yield offset, record
+
+@functools.lru_cache(maxsize=4096)
+def _parse_expiry(expires_str: str) -> Optional[datetime]:
+    """Parse an expires_at value, returning None if it can't be parsed"""
+    if not expires_str:
+        return None
+    # fromisoformat handles both the 'T' and space separators as well as
+    # date-only and minute-precision values
+    try:
+        return datetime.fromisoformat(expires_str)
+    except ValueError:
+        return None
+
+def _load_tokens() -> dict:
+    """Return the token index, re-reading the CSV only if it changed on disk"""
+    global _TOKEN_CACHE, _TOKEN_CACHE_STAT
+    with _TOKEN_CACHE_LOCK:
+        try:
+            file_stat = os.stat(TOKENS_FILE)
+        except FileNotFoundError:
+            logger.error(f"Token file not found at {TOKENS_FILE}")
+            _TOKEN_CACHE, _TOKEN_CACHE_STAT = {}, None
+            return _TOKEN_CACHE
+
+        stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+        if stamp == _TOKEN_CACHE_STAT:
+            return _TOKEN_CACHE
+
+        tokens = {}
+        if file_stat.st_size == 0:
+            logger.error("Token file has no headers")
+        else:
+            # Map the file read-only so rows are sliced straight from the page
+            # cache, and each row's byte offset is known for revoke_token
+            with open(TOKENS_FILE, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                fieldnames = next(csv.reader([mm.readline().decode('utf-8')]), None)
+                if not fieldnames:
+                    logger.error("Token file has no headers")
+                elif 'token' not in fieldnames:
+                    logger.error(f"Token file missing 'token' column. Found: {fieldnames}")
+                else:
+                    token_idx = fieldnames.index('token')
+                    expires_idx = fieldnames.index('expires_at') if 'expires_at' in fieldnames else None
+                    org_idx = fieldnames.index('organization_name') if 'organization_name' in fieldnames else None
+                    for line_offset, line in iter_csv_records(mm):
+                        if line.startswith(_TOMBSTONE) or not line.strip():
+                            continue
+                        row = next(csv.reader([line.decode('utf-8')]))
+                        token = row[token_idx] if token_idx < len(row) else None
+                        if not token:
+                            continue
+                        expires_str = row[expires_idx] if expires_idx is not None and expires_idx < len(row) else None
+                        expires_at = _parse_expiry(expires_str)
+                        if expires_str and expires_at is None:
+                            logger.warning(f"Could not parse expiry date: {expires_str}, assuming valid")
+                        organization = row[org_idx] if org_idx is not None and org_idx < len(row) else None
+                        if organization:
+                            # Share one string per organization across its tokens
+                            organization = sys.intern(organization)
+                        tokens[token] = (expires_at, organization, line_offset)
+
+        _TOKEN_CACHE, _TOKEN_CACHE_STAT = tokens, stamp
+        return _TOKEN_CACHE
 
 def ensure_token_storage():
     """Ensure token storage directory and file exist"""
+    global _storage_ensured
+    # Only re-check from scratch if the file has gone missing since
+    if _storage_ensured and os.path.exists(TOKENS_FILE):
+        return True
     try:
         os.makedirs(SECURE_DIR, exist_ok=True)
         if not os.path.exists(TOKENS_FILE):
-            with open(TOKENS_FILE, 'w', newline='') as f:
+            with open(TOKENS_FILE, 'w', newline='', buffering=_IO_BUFSIZE) as f:
                 writer = csv.writer(f)
                 writer.writerow(TOKEN_CSV_COLUMNS)
             logger.info(f"Created new token storage file at {TOKENS_FILE}")
         else:
             # Check existing columns to ensure compatibility
-            with open(TOKENS_FILE, 'r', newline='') as f:
+            with open(TOKENS_FILE, 'r', newline='', buffering=_IO_BUFSIZE) as f:
                 reader = csv.reader(f)
                 try:
                     header = next(reader, None)
-                    if header and set(header) != set(TOKEN_CSV_COLUMNS):
+                    if header and frozenset(header) != _TOKEN_CSV_COLUMNS_SET:
                         logger.warning(f"Token file has inconsistent columns: {header}")
                         # Consider migrating the file structure here
                 except Exception as e:
@@ -63,27 +172,28 @@ def ensure_token_storage():
             except Exception as perm_e:
                 logger.error(f"Could not update permissions: {perm_e}")
         
+        _storage_ensured = True
         return True
     except Exception as e:
         logger.error(f"Error ensuring token storage: {e}")
         return False
 
-def generate_token(organization: str, generated_by: str = "Admin") -> Optional[str]:
-    """Generate a new access token for an organization"""
+def _build_token(organization: str) -> str:
+    """Build a token string for an organization"""
+    # DATAINFA_ prefix, then the organization name with spaces replaced by
+    # underscores and uppercased, then a random URL-safe suffix for uniqueness
+    org_part = organization.strip().replace(' ', '_').upper()
+    return f"DATAINFA_{org_part}_{secrets.token_urlsafe(12)}"  # 12 bytes = 16 chars
+
+def generate_token(organization: str, generated_by: str = "Admin", expiry_days: Optional[int] = None) -> Optional[str]:
+    """Generate a new access token for an organization, valid for expiry_days (default TOKEN_EXPIRY_DAYS)"""
     try:
         ensure_token_storage()
         
-        # Generate token with DATAINFA_ prefix followed by organization name
-        # Replace spaces with underscores and make uppercase
-        org_part = organization.strip().replace(' ', '_').upper()
-        token = f"DATAINFA_{org_part}"
-        
-        # Add a random suffix for uniqueness
-        random_suffix = secrets.token_hex(8)  # 8 bytes = 16 hex chars
-        token = f"{token}_{random_suffix}"
+        token = _build_token(organization)
         
         created_at = datetime.now()
-        expires_at = created_at + timedelta(days=TOKEN_EXPIRY_DAYS)
+        expires_iso = (created_at + timedelta(days=expiry_days or TOKEN_EXPIRY_DAYS)).isoformat()
         
         # Save token - match the exact column order of the CSV
         with open(TOKENS_FILE, 'a', newline='') as f:
@@ -91,13 +201,13 @@ def generate_token(organization: str, generated_by: str = "Admin") -> Optional[s
             writer.writerow([
                 token,
                 created_at.isoformat(),
-                expires_at.isoformat(),
+                expires_iso,
                 organization,
                 generated_by
             ])
         
         logger.info(f"Generated token for {organization} by {generated_by}: {token}")
-        logger.info(f"Token will expire on {expires_at.isoformat()}")
+        logger.info(f"Token will expire on {expires_iso}")
         
         return token
         
@@ -108,65 +218,27 @@ def generate_token(organization: str, generated_by: str = "Admin") -> Optional[s
 def validate_token(token: str) -> bool:
     """Validate an access token"""
     # Admin token special case
-    if token == 'dpdp2025':
+    if token in ADMIN_TOKENS:
         logger.info("Admin token validated")
         return True
+    
+    # Reject empty input without touching the token file
+    if not token or not token.strip():
+        return False
         
     try:
-        if not os.path.exists(TOKENS_FILE):
-            logger.error(f"Token file not found at {TOKENS_FILE}")
-            return False
-        
-        with open(TOKENS_FILE, 'r') as f:
-            reader = csv.DictReader(f)
-            # Check if all required columns exist
-            fieldnames = reader.fieldnames
-            if not fieldnames:
-                logger.error("Token file has no headers")
-                return False
-                
-            if 'token' not in fieldnames:
-                logger.error(f"Token file missing 'token' column. Found: {fieldnames}")
-                return False
-            
-            for row in reader:
-                if row.get('token') == token:
-                    logger.info(f"Found matching token: {token[:8]}...")
-                    
-                    # Check expiration if available
-                    if 'expires_at' in row and row['expires_at']:
-                        try:
-                            # Handle different date formats
-                            expires_str = row['expires_at']
-                            if 'T' in expires_str:
-                                # ISO format with T separator
-                                expires_at = datetime.fromisoformat(expires_str)
-                            else:
-                                # Try various common formats
-                                for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%d']:
-                                    try:
-                                        expires_at = datetime.strptime(expires_str, fmt)
-                                        break
-                                    except ValueError:
-                                        continue
-                                else:
-                                    # If no format worked, assume it's valid
-                                    logger.warning(f"Could not parse expiry date: {expires_str}, assuming valid")
-                                    return True
-                                
-                            if datetime.now() > expires_at:
-                                logger.warning(f"Token expired on {expires_at}")
-                                return False
-                        except Exception as e:
-                            logger.error(f"Error checking token expiry: {e}, assuming valid")
-                            # If we can't parse the date, assume token is valid
-                            return True
-                    
-                    return True
-            
+        entry = _load_tokens().get(token)
+        if entry is None:
             logger.warning(f"No matching token found: {token[:8]}...")
             return False
-        
+
+        logger.info(f"Found matching token: {token[:8]}...")
+        expires_at = entry[0]
+        if expires_at is not None and datetime.now() > expires_at:
+            logger.warning(f"Token expired on {expires_at}")
+            return False
+        return True
+
     except Exception as e:
         logger.error(f"Error validating token: {e}")
         return False
@@ -174,82 +246,92 @@ def validate_token(token: str) -> bool:
 def get_organization_for_token(token: str) -> Optional[str]:
     """Get the organization associated with a token"""
     try:
-        if not os.path.exists(TOKENS_FILE):
-            return None
-            
-        with open(TOKENS_FILE, 'r') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row['token'] == token:
-                    return row['organization']
-                    
-        return None
-            
+        entry = _load_tokens().get(token)
+        return entry[1] if entry is not None else None
+
     except Exception as e:
         logger.error(f"Error getting organization for token: {e}")
         return None
 
 def revoke_token(token: str) -> bool:
     """Revoke an access token"""
+    global _TOKEN_CACHE_STAT
     try:
-        if not os.path.exists(TOKENS_FILE):
-            return False
-            
-        rows = []
-        token_found = False
-        
-        with open(TOKENS_FILE, 'r') as f:
-            reader = csv.DictReader(f)
-            header = reader.fieldnames or []
-            for row in reader:
-                if row['token'] != token:
-                    rows.append(row)
-                else:
-                    token_found = True
+        with _TOKEN_CACHE_LOCK:
+            tokens = _load_tokens()
+            if token not in tokens:
+                return False
 
-        if token_found:
-            with open(TOKENS_FILE, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=header)
-                writer.writeheader()
-                writer.writerows(rows)
-            logger.info(f"Revoked token: {token}")
-            return True
-        else:
-            return False
+            # Comment the row out in place rather than rewriting the whole file
+            token_bytes = token.encode('utf-8')
+            with open(TOKENS_FILE, 'r+b') as f:
+                f.seek(tokens[token][2])
+                # Tokens containing commas are written quoted
+                if not f.read(len(token_bytes) + 1).lstrip(b'"').startswith(token_bytes):
+                    logger.error(f"Token file changed while revoking token: {token}")
+                    return False
+                f.seek(tokens[token][2])
+                f.write(_TOMBSTONE)
+
+            # Keep the index in step with the file instead of reloading it
+            del tokens[token]
+            file_stat = os.stat(TOKENS_FILE)
+            _TOKEN_CACHE_STAT = (file_stat.st_mtime_ns, file_stat.st_size)
+
+        logger.info(f"Revoked token: {token}")
+        return True
         
     except Exception as e:
         logger.error(f"Error revoking token: {e}")
         return False
 
 def cleanup_expired_tokens() -> int:
-    """Remove expired tokens from storage"""
+    """Remove expired tokens from storage and compact revoked ones"""
+    tmp_file = TOKENS_FILE + '.tmp'
     try:
         if not os.path.exists(TOKENS_FILE):
             return 0
         
         current_time = datetime.now()
-        rows = []
+        # generate_token writes ISO timestamps, which order correctly as strings
+        now_iso = current_time.isoformat()
         expired_count = 0
+        revoked_count = 0
         
-        with open(TOKENS_FILE, 'r') as f:
-            reader = csv.DictReader(f)
-            header = reader.fieldnames or []
-            for row in reader:
-                expires_at = datetime.fromisoformat(row['expires_at'])
-                if current_time <= expires_at:
-                    rows.append(row)
-                else:
-                    expired_count += 1
-        
-        if expired_count > 0:
-            with open(TOKENS_FILE, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=header)
+        with _TOKEN_CACHE_LOCK:
+            # Stream the surviving rows into a temp file and swap it in atomically
+            with open(TOKENS_FILE, 'r', newline='', buffering=_IO_BUFSIZE) as src, \
+                    open(tmp_file, 'w', newline='', buffering=_IO_BUFSIZE) as dst:
+                reader = csv.DictReader(src)
+                writer = csv.DictWriter(dst, fieldnames=reader.fieldnames or [])
                 writer.writeheader()
-                writer.writerows(rows)
-            logger.info(f"Removed {expired_count} expired tokens")
+                for row in reader:
+                    # Drop rows tombstoned by revoke_token
+                    if row['token'].startswith('#'):
+                        revoked_count += 1
+                        continue
+                    expires_str = row['expires_at']
+                    if 'T' in expires_str:
+                        expired = expires_str < now_iso
+                    else:
+                        # Fall back to parsing older formats; unparseable dates count as valid
+                        expires_at = _parse_expiry(expires_str)
+                        expired = expires_at is not None and expires_at < current_time
+                    if expired:
+                        expired_count += 1
+                    else:
+                        writer.writerow(row)
+            
+            if expired_count > 0 or revoked_count > 0:
+                os.replace(tmp_file, TOKENS_FILE)
+                logger.info(f"Removed {expired_count} expired tokens and compacted {revoked_count} revoked tokens")
+            else:
+                os.remove(tmp_file)
         
         return expired_count
         
     except Exception as e:
         logger.error(f"Error cleaning up expired tokens: {e}")
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
         return 0
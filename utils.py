@@ -1,54 +1,71 @@
-def get_regulation_and_industry_for_loader() -> tuple[str, str]:
-    """Map session state values to correct regulation directory and industry filename for questionnaire loading.
+import functools
+import logging
+from types import MappingProxyType
 
-    Returns:
-        tuple[str, str]: (regulation_directory, industry_filename)
-    """
-    import streamlit as st
-    import logging
-    import time
-    logger = logging.getLogger(__name__)
-    
-    industry_file_map = {
-        "Oil and Gas": "Oil_and_Gas",
-        "Banking and finance": "Banking and finance",
-        "E-commerce": "E-commerce",
-        "General": "npc"  # Map General industry to npc.json file
-    }
-    regulation_map = {
-        "India": "DPDP",
-        "Qatar": "PDPPL",  # Default Qatar mapping
-        "ndp_qatar": "PDPPL",
-        "Australia": "OAIC"  # Add Australia mapping
-    }
-    
-    # Get the selected country and industry
-    selected_country = st.session_state.get('selected_country', '')
-    selected_industry = st.session_state.get('selected_industry', '')
-    
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+_INDUSTRY_FILE_MAP = MappingProxyType({
+    "Oil and Gas": "Oil_and_Gas",
+    "Banking and finance": "Banking and finance",
+    "E-commerce": "E-commerce",
+    "General": "npc"  # Map General industry to npc.json file
+})
+_REGULATION_MAP = MappingProxyType({
+    "India": "DPDP",
+    "Qatar": "PDPPL",  # Default Qatar mapping
+    "ndp_qatar": "PDPPL",
+    "Australia": "OAIC",  # Add Australia mapping
+    "Saudi Arabia": "PDPL"
+})
+
+@functools.lru_cache(maxsize=64)
+def resolve_regulation_and_industry(country: str, industry: str, fallback_regulation: str) -> tuple[str, str]:
+    """Map a country, display industry and selected regulation to (regulation_directory, industry_filename)"""
     # Normalize the selected industry first
-    if not selected_industry:
+    if not industry:
         # Set default industry based on country only if industry is empty
-        if selected_country == "Qatar":
-            selected_industry = "Oil and Gas"  # Default to Oil and Gas for Qatar
-        elif selected_country == "India":
-            selected_industry = "Banking and finance"
+        if country == "Qatar":
+            industry = "Oil and Gas"  # Default to Oil and Gas for Qatar
+        elif country == "India":
+            industry = "Banking and finance"
         else:
-            selected_industry = "Oil and Gas"  # Default fallback
-    elif selected_industry == "general":
+            industry = "Oil and Gas"  # Default fallback
+    elif industry == "general":
         # Convert lowercase "general" to proper case "General"
-        selected_industry = "General"
+        industry = "General"
     
     # Special handling for Qatar: determine regulation based on industry
-    if selected_country == "Qatar":
-        if selected_industry == "General":
+    if country == "Qatar":
+        if industry == "General":
             regulation = "NPC"
         else:
             regulation = "PDPPL"  # Oil and Gas goes to PDPPL
     else:
-        regulation = regulation_map.get(selected_country, st.session_state.get('selected_regulation', ''))
+        regulation = _REGULATION_MAP.get(country, fallback_regulation)
     
     # Map the display industry to file industry
-    industry = industry_file_map.get(selected_industry, selected_industry)
+    return regulation, _INDUSTRY_FILE_MAP.get(industry, industry)
+
+def get_regulation_and_industry_for_loader() -> tuple[str, str]:
+    """Map session state values to correct regulation directory and industry filename for questionnaire loading.
+
+    Returns:
+        tuple[str, str]: (regulation_directory, industry_filename)
+    """
+    # Get the selected country and industry
+    selected_country = st.session_state.get('selected_country', '')
+    selected_industry = st.session_state.get('selected_industry', '')
+    
+    # Reuse the previous result while the inputs it depends on are unchanged
+    cache_key = (selected_country, selected_industry, st.session_state.get('selected_regulation', ''))
+    if st.session_state.get('_reg_ind_cache_key') == cache_key:
+        return st.session_state['_reg_ind_cache_val']
+    
+    regulation, industry = resolve_regulation_and_industry(*cache_key)
 
-    return regulation, industry 
\ No newline at end of file
+    st.session_state['_reg_ind_cache_key'] = cache_key
+    st.session_state['_reg_ind_cache_val'] = (regulation, industry)
+    return regulation, industry
+ 
\ No newline at end of file
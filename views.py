@@ -4,52 +4,44 @@ This module contains all the Streamlit UI components and page rendering.
 
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime, timedelta
+import functools
 import logging
 import os
+import random
+import secrets
 import time
-import base64
+import binascii
+import bisect
+import io
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import html
+import json
 from typing import Dict, List, Any, Optional, Tuple  # Add typing imports
-import tempfile
 import re
-from markdown_pdf import MarkdownPdf, Section # Add markdown-pdf imports
 import config
 # Update import: get reg/ind functions from config instead of assessment
 from config import get_available_regulations, get_available_industries
 from assessment import get_questionnaire, calculate_compliance_score
 # Import from new recommendation engine instead of assessment
-from recommendation_engine import get_recommendation_priority, organize_recommendations_by_priority
+from recommendation_engine import get_recommendation_priority, organize_recommendations_by_priority, get_recommendation_context
 from helpers import (
     go_to_page, 
     save_response, 
+    set_responses,
     generate_excel_download_link,
-    get_section_progress_percentage,  # Use this instead of local implementation
     format_regulation_name,
     validate_token
 )
-from token_storage import generate_token, cleanup_expired_tokens, revoke_token, get_organization_for_token, TOKENS_FILE
-from utils import get_regulation_and_industry_for_loader
+from token_storage import generate_token, cleanup_expired_tokens, revoke_token, get_organization_for_token, iter_csv_records, TOKENS_FILE
+from data_storage import save_assessment_data
+from utils import get_regulation_and_industry_for_loader, resolve_regulation_and_industry
 # Import the newly created styles
 from styles import (
-    get_landing_page_css, 
-    get_expiry_box_css,
-    get_section_navigation_css,
-    get_common_button_css,
-    get_penalties_table_css,
-    get_discovery_button_css,
-    get_faq_css,
-    get_input_label_css,
-    get_contact_link_css,
-    get_ai_analysis_css,
-    get_penalties_section_css,
-    get_countdown_section_css,
-    get_logo_css,
-    get_data_discovery_css,
-    get_penalties_note_css,
-    get_ai_report_css,
-    get_download_button_css
+    get_diagram_css,
+    minify_css,
+    inject_page_css
 )
 
 from faq import FAQ_DATA  # Add this import at the top
@@ -63,72 +55,60 @@ logger = logging.getLogger(__name__)
 if 'assessment_type' not in st.session_state:
     st.session_state.assessment_type = 'PDPPL'
 
-def render_header():
-    """Render the application header"""
-    org_name = st.session_state.organization_name if st.session_state.organization_name and st.session_state.organization_name.strip() else None
-    
-    st.markdown("""
-        <style>
-        /* Compact header */
-        .app-header {
-            background: rgba(30, 30, 30, 0.8);
-            padding: 0.4rem 0.5rem;
-            border-radius: 4px;
-            margin: 0;
-        }
-        .header-text {
-            margin: 0;
-            padding: 0;
-            text-align: center;
-        }
-        .header-text h1 {
-            color: white;
-            font-size: 2.2rem;
-            margin: 0;
-            padding: 0;
-            line-height: 1.1;
-        }
-        .header-text p {
-            color: rgba(250, 250, 250, 0.8);
-            font-size: 1.15rem;
-            margin: 0.1rem 0 0 0;
-            padding: 0;
-            line-height: 1;
-        }
-        /* Remove Streamlit spacing only within the header */
-        .app-header .element-container,
-        .app-header div[data-testid="stMarkdown"],
-        .app-header div[data-testid="stVerticalBlock"] {
-            margin: 0 !important;
-            padding: 0 !important;
-        }
-        /* Compact section title */
-        .section-title {
-            font-size: 1.2rem;
-            margin: 0.3rem 0;
-            padding: 0;
-            line-height: 1.2;
-        }
-        /* Compact progress section */
-        .progress-section {
-            margin: 0.3rem 0;
-            padding: 0;
-            font-size: 0.85rem;
-            opacity: 0.8;
-        }
-        .stProgress {
-            margin: 0.2rem 0 !important;
-            padding: 0 !important;
-        }
-        /* Question spacing */
-        .question-container {
-            margin-top: 0.5rem !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-    
+# Report text clean-up patterns, compiled once
+_SPAN_RE = re.compile(r"<span[^>]*>Informatica Solution:</span>\s*", re.IGNORECASE)
+_PREFIX_RE = re.compile(r"Informatica Solution:\s*", re.IGNORECASE)
+_LINK_RE = re.compile(r'\s*\[<a.*?</a>\]')
+# Code fences and div tags to drop, and placeholders to fill, in generated AI reports
+_AI_REPORT_CLEAN_RE = re.compile(r"```markdown|```|(?i:</?div[^>]*>)|\[Insert (?:Date|Organization Name)\]")
+_HEADER_RE = re.compile(r"^#\s*(.*?)\s*\*\*Overall Compliance Score: ([0-9.]+)%\*\*\s*\*\*Compliance Level: ([^*]+)\*\*")
+# Markdown heading/bold markers stripped from the privacy policy analysis title
+_ANALYSIS_TITLE_MARKUP_RE = re.compile(r"#|\*\*")
+
+# (regulation, industry) -> the bundle last derived from get_questionnaire
+_questionnaire_bundles: Dict[Tuple[str, str], Tuple[dict, List[List[str]], int, Dict[str, Dict[str, int]]]] = {}
+
+def _questionnaire_bundle(regulation: str, industry: str) -> Tuple[dict, List[List[str]], int, Dict[str, Dict[str, int]]]:
+    """Load a questionnaire and its derived lookups once per (regulation, industry).
+
+    Returns (questionnaire, section_keys, total_questions, option_index_maps).
+    The lookups are rebuilt whenever get_questionnaire hands back a new object,
+    so clear_questionnaire_cache invalidates both. The objects are shared by
+    every session, so callers must treat them as read-only.
+    """
+    questionnaire = get_questionnaire(regulation, industry)
+    bundle = _questionnaire_bundles.get((regulation, industry))
+    if bundle is not None and bundle[0] is questionnaire:
+        return bundle
+    sections = questionnaire.get("sections", [])
+    # Response keys ("s{section}_q{question}") per section
+    section_keys = [
+        [f"s{s_idx}_q{q_idx}" for q_idx in range(len(section.get("questions", [])))]
+        for s_idx, section in enumerate(sections)
+    ]
+    total_questions = sum(len(keys) for keys in section_keys)
+    # Option -> radio index per response key, so restoring a saved answer
+    # is a dict lookup rather than a list scan
+    option_index_maps = {
+        response_key: {option: i for i, option in enumerate(options)}
+        for section, keys in zip(sections, section_keys)
+        for response_key, options in zip(keys, _question_options(section))
+    }
+    bundle = (questionnaire, section_keys, total_questions, option_index_maps)
+    _questionnaire_bundles[(regulation, industry)] = bundle
+    return bundle
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _score(regulation: str, industry: str, responses_key: tuple) -> dict:
+    """Score the current responses; responses_key ties the cache entry to them"""
+    # calculate_compliance_score reads st.session_state.responses itself
+    return calculate_compliance_score(regulation, industry)
+
+@functools.lru_cache(maxsize=64)
+def _header_html(org_name: Optional[str]) -> str:
+    """Return the app header markup for an organization (or none)"""
     # Minimal HTML structure
-    header_html = (
+    return (
         '<div class="app-header">'
         '<div class="header-text">'
         f'<h1>{config.APP_TITLE}</h1>'
@@ -136,7 +116,20 @@ def render_header():
         '</div>'
         '</div>'
     )
-    st.markdown(header_html, unsafe_allow_html=True)
+
+def render_header():
+    """Render the application header"""
+    org_name = st.session_state.organization_name if st.session_state.organization_name and st.session_state.organization_name.strip() else None
+    st.markdown(_header_html(org_name), unsafe_allow_html=True)
+
+# Landing page title block; only depends on config, so built once
+_LANDING_TITLE_HTML = f"""
+        <div class="title-container">
+            <h1>{config.APP_TITLE}</h1>
+            <p>Enter your access token to begin the assessment</p>
+            <p class="contact-link">If you do not have a token, please <a href="mailto:info@datainfa.com?subject=Requesting%20Access%20token%20for%20my%20organisation">contact us</a> to get your access token.</p>
+        </div>
+    """
 
 # Landing page function (moved from landing.py)
 def render_landing_page():
@@ -148,46 +141,10 @@ def render_landing_page():
             st.rerun()
             
     # Apply custom CSS
-    st.markdown(get_landing_page_css(), unsafe_allow_html=True)
-    st.markdown(get_contact_link_css(), unsafe_allow_html=True)
+    inject_page_css("landing")
     
-    # Add CSS to center the main content block and logo
-    st.markdown("""
-        <style>
-        /* Target the main block containing landing page elements */
-        div[data-testid="stVerticalBlock"] > div.stHorizontalBlock > div[data-testid="stVerticalBlock"] {
-            align-items: center;
-        }
-        
-        /* Improved logo centering */
-        .logo-container {
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            width: 100%;
-            margin: 0 auto;
-            padding: 20px 0;
-        }
-        
-        .logo-container img {
-            max-width: 300px;
-            height: auto;
-            display: block;
-            margin: 0 auto;
-        }
-        
-        /* Ensure the middle column is properly centered */
-        div[data-testid="stHorizontalBlock"] > div:nth-child(2) {
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            text-align: center;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-
     # Logo - Display using columns and centered text within middle column
-    if os.path.exists(config.LOGO_PATH):
+    if _asset_exists(config.LOGO_PATH):
         col1, col2, col3 = st.columns([1, 1, 1]) # Equal ratios
         with col2:
             # Use the improved CSS class for logo centering
@@ -198,13 +155,7 @@ def render_landing_page():
         st.warning(f"Logo not found at path: {config.LOGO_PATH}")
     
     # Title
-    st.markdown(f"""
-        <div class="title-container">
-            <h1>{config.APP_TITLE}</h1>
-            <p>Enter your access token to begin the assessment</p>
-            <p class="contact-link">If you do not have a token, please <a href="mailto:info@datainfa.com?subject=Requesting%20Access%20token%20for%20my%20organisation">contact us</a> to get your access token.</p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_LANDING_TITLE_HTML, unsafe_allow_html=True)
     
     # Token input with centered container
     col1, col2, col3 = st.columns([1, 2, 1])
@@ -225,150 +176,10 @@ def render_landing_page():
         </div>
     """, unsafe_allow_html=True)
 
-def render_assessment():
-    """Render the assessment page"""
-    # Get current regulation and industry
-    current_regulation = st.session_state.get('regulation', 'PDPPL')
-    current_industry = st.session_state.get('industry', 'General')
-    
-    # Initialize session state for responses if not exists
-    if 'responses' not in st.session_state:
-        st.session_state.responses = {}
-    
-    # Get questionnaire for current regulation and industry
-    questionnaire = get_questionnaire(current_regulation, current_industry)
-    sections = questionnaire.get('sections', [])
-    
-    # Track current section
-    if 'current_section' not in st.session_state:
-        st.session_state.current_section = 0
-    
-    # Only recalculate if:
-    # 1. We have responses
-    # 2. The regulation or industry has changed
-    # 3. We haven't calculated for this combination before
-    cache_key = f"score_cache_{current_regulation}_{current_industry}"
-    if (st.session_state.responses and 
-        (not hasattr(st.session_state, cache_key) or 
-         st.session_state.get('last_regulation') != current_regulation or
-         st.session_state.get('last_industry') != current_industry)):
-        
-        # Update last used regulation and industry
-        st.session_state.last_regulation = current_regulation
-        st.session_state.last_industry = current_industry
-        
-        # Calculate compliance score
-        results = calculate_compliance_score(current_regulation, current_industry)
-        st.session_state.assessment_results = results
-    elif hasattr(st.session_state, 'assessment_results'):
-        results = st.session_state.assessment_results
-    else:
-        results = None
-    
-    # Create a top anchor without extra spacing
-    st.markdown('<div id="top"></div>', unsafe_allow_html=True)
-    
-    # Check if questionnaire needs to be reloaded due to country/industry change
-    need_reload = False
-    if 'current_questionnaire' not in st.session_state:
-        need_reload = True
-    else:
-        # Check if country or industry has changed
-        cached_country = st.session_state.get('cached_country')
-        cached_industry = st.session_state.get('cached_industry')
-        current_country = st.session_state.get('selected_country')
-        current_industry = st.session_state.get('selected_industry')
-        
-        if cached_country != current_country or cached_industry != current_industry:
-            logger.info(f"Country/Industry changed: {cached_country}/{cached_industry} -> {current_country}/{current_industry}")
-            need_reload = True
-            # Clear the questionnaire cache
-            from helpers import clear_questionnaire_cache
-            clear_questionnaire_cache()
-    
-    # Get questionnaire data
-    if need_reload:    
-        # Add debug logs for session state
-        logger.info(f"[render_assessment] Session selected_country: {st.session_state.get('selected_country')}")
-        logger.info(f"[render_assessment] Session selected_industry: {st.session_state.get('selected_industry')}")
-        # Map display industry to file industry
-        industry_file_map = {
-            "Oil and Gas": "Oil_and_Gas",
-            "Banking and finance": "Banking and finance",
-            "E-commerce": "E-commerce"
-        }
-        industry_for_loader = industry_file_map.get(st.session_state.selected_industry, st.session_state.selected_industry)
-        logger.info(f"[render_assessment] Mapped industry_for_loader: {industry_for_loader}")
-        # Map country to regulation code
-        regulation_map = {
-            "Qatar": "PDPPL",
-            "India": "DPDP",
-            "Australia": "OAIC",
-            "Saudi Arabia": "PDPL"
-        }
-        
-        # Use the proper regulation based on country selection
-        if st.session_state.selected_country == "Qatar" and st.session_state.selected_industry == "General":
-            regulation_for_loader = "NPC"
-            logger.info(f"[render_assessment] Using NPC for Qatar General industry")
-        else:
-            regulation_map = {
-                "Qatar": "PDPPL",
-                "India": "DPDP",
-                "Australia": "OAIC",
-                "Saudi Arabia": "PDPL"
-            }
-            regulation_for_loader = regulation_map.get(st.session_state.selected_country, st.session_state.selected_regulation)
-            logger.info(f"[render_assessment] Using regulation: {regulation_for_loader} for country: {st.session_state.selected_country}")
-        try:
-            questionnaire = get_questionnaire(regulation_for_loader, industry_for_loader)
-            logger.info(f"[render_assessment] Loaded questionnaire for regulation: {regulation_for_loader}, industry: {industry_for_loader}")
-        except Exception as e:
-            logger.error(f"[render_assessment] Error loading questionnaire for regulation: {regulation_for_loader}, industry: {industry_for_loader}: {e}")
-            raise
-        st.session_state.current_questionnaire = questionnaire
-        # Cache the current country/industry to detect changes
-        st.session_state.cached_country = st.session_state.get('selected_country')
-        st.session_state.cached_industry = st.session_state.get('selected_industry')
-    questionnaire = st.session_state.current_questionnaire
-    
-    # Show questionnaire debug info in sidebar with more details
-    with st.sidebar.expander("Navigation panel", expanded=False):
-        st.markdown("""
-            <style>
-            div.stExpander {
-                background-color: #0e1117;
-                border: 1px solid rgba(49, 51, 63, 0.2);
-            }
-            /* Dark theme buttons */
-            div.stButton > button {
-                width: 100%;
-                padding: 0.5rem;
-                margin: 0.25rem 0;
-                background-color: #1e1e1e !important;
-                color: #fafafa;
-                border: 1px solid #333333 !important;
-                border-radius: 0.3rem;
-                transition: all 0.2s;
-            }
-            /* Hover effect */
-            div.stButton > button:hover:not(:disabled) {
-                background-color: #2d2d2d !important;
-                border-color: #404040 !important;
-            }
-            /* Disabled button */
-            div.stButton > button:disabled {
-                background-color: #161616 !important;
-                color: #666666;
-                border-color: #292929 !important;
-            }
-            /* Current section highlight */
-            div.stButton > button.current {
-                border-left: 3px solid #666666 !important;
-            }
-            </style>
-        """, unsafe_allow_html=True)
-        
+@st.fragment
+def _render_nav_sidebar(questionnaire, section_keys):
+    """Render the section navigation panel; reruns on its own when used"""
+    with st.expander("Navigation panel", expanded=False):
         if "sections" in questionnaire:
             st.write("Jump to section:")
             
@@ -377,227 +188,143 @@ def render_assessment():
                 section_name = section.get("name", f"Section {i+1}")
                 
                 # Calculate if section is complete
-                questions = section.get("questions", [])
-                answered = sum(1 for q_idx in range(len(questions)) 
-                             if f"s{i}_q{q_idx}" in st.session_state.responses)
-                complete = answered == len(questions)
+                keys = section_keys[i]
+                answered = sum(1 for key in keys if key in st.session_state.responses)
+                complete = answered == len(keys)
                 
                 # Create button with status indicator
-                button_label = f"{i+1}. {section_name} [{answered}/{len(questions)}]"
+                button_label = f"{i+1}. {section_name} [{answered}/{len(keys)}]"
                 if st.button(button_label, key=f"nav_section_{i}", 
                            disabled=i == st.session_state.current_section,
                            use_container_width=True):
-                    st.session_state.current_section = i
-                    # Only rerun if actually changing sections
                     if i != st.session_state.current_section:
+                        st.session_state.current_section = i
+                        # Rerun the whole app, not just this fragment, to show the section
                         st.rerun()
-    
-    # TESTING ONLY - TO BE REMOVED BEFORE PRODUCTION
-    # Add quick-fill testing option in sidebar for faster testing
-    if st.session_state.get('is_admin', False):
-        st.markdown("""
-            <style>
-            /* Expander styling */
-            .streamlit-expanderHeader {
-                background-color: #262730 !important;
-                border: none !important;
-                border-radius: 4px !important;
-                color: #fafafa !important;
-                font-size: 14px !important;
-            }
-            .streamlit-expanderHeader:hover {
-                background-color: #1E1E1E !important;
-            }
-            /* Testing tools container */
-            div.stExpander {
-                border: none !important;
-                background-color: transparent !important;
-            }
-            /* Radio buttons in testing tools */
-            div.stExpander div[data-testid="stRadio"] > div {
-                display: flex !important;
-                flex-direction: column !important;
-                gap: 8px !important;
-            }
-            div.stExpander div[data-testid="stRadio"] label {
-                background-color: #262730 !important;
-                padding: 8px 12px !important;
-                border-radius: 4px !important;
-                color: #fafafa !important;
-                transition: all 0.2s !important;
-            }
-            div.stExpander div[data-testid="stRadio"] label:hover {
-                background-color: #1E1E1E !important;
-                color: #6fa8dc !important;
-            }
-            /* Button styling */
-            div.stExpander div[data-testid="stButton"] > button {
-                width: 100% !important;
-                padding: 8px 12px !important;
-                margin: 4px 0 !important;
-                background-color: #262730 !important;
-                color: #fafafa !important;
-                border: none !important;
-                border-radius: 4px !important;
-                text-align: left !important;
-                transition: all 0.2s !important;
-            }
-            div.stExpander div[data-testid="stButton"] > button:hover {
-                background-color: #1E1E1E !important;
-                color: #6fa8dc !important;
-            }
-            div.stExpander div[data-testid="stButton"] > button:active {
-                border-left: 3px solid #6fa8dc !important;
-            }
-            </style>
-        """, unsafe_allow_html=True)
-        
-        with st.sidebar.expander("TESTING TOOLS", expanded=True):
-            auto_fill_option = st.radio(
-                "Auto-fill responses with:",
-                ["None", "All Yes/Positive", "All Partial/Medium", "All No/Negative", "Random Mix"],
-                key="auto_fill_option",
-                index=4  # Set default to "Random Mix" (index 4 in the list)
-            )
-            if st.button("Apply Auto-Fill", key="apply_auto_fill", type="primary"):
-                sections = questionnaire["sections"]
-                current_section = st.session_state.current_section
-                
-                if current_section < len(sections):
-                    section = sections[current_section]
-                    questions = section.get("questions", [])
-                    
-                    import random
-                    responses_updated = False
-                
-                    for q_idx, question in enumerate(questions):
-                        # Create the response key in the correct format
-                        response_key = f"s{current_section}_q{q_idx}"
-                        radio_key = f"radio_{response_key}"
-                        
-                        # Get options for the question
-                        if isinstance(question, dict):
-                            options = question.get("options", [])
-                        else:
-                            try:
-                                options = section.get("options", [])[q_idx]
-                            except (IndexError, KeyError):
-                                options = ["Yes", "No", "Not applicable"]
-                        
-                        # Select option based on auto-fill choice
-                        selected_option = None
-                        if auto_fill_option == "All Yes/Positive":
-                            selected_option = options[0]  # First option (Yes/Positive)
-                        elif auto_fill_option == "All Partial/Medium":
-                            selected_option = options[1] if len(options) > 2 else options[0]  # Middle option if available
-                        elif auto_fill_option == "All No/Negative":
-                            selected_option = options[-1]  # Last option (No/Negative)
-                        elif auto_fill_option == "Random Mix":
-                            selected_option = random.choice(options)  # Random choice
-                        
-                        # Update both session state entries
-                        if selected_option:
-                            st.session_state.responses[response_key] = selected_option
-                            st.session_state[radio_key] = selected_option
-                            responses_updated = True
-                    
-                    if responses_updated:
-                        st.sidebar.success("Responses auto-filled successfully!")
-                        # Update the auto-fill state
-                        st.session_state.auto_fill_complete = True
-                        # Use st.rerun() as per latest Streamlit version
-                        st.rerun()
-                else:
-                    st.error("No section available for auto-fill")
-    
-    # END OF TESTING CODE
-    
 
-    sections = questionnaire["sections"]
-    
-    # Check if questionnaire has any sections
-    if not sections:
-        st.error("No assessment questions found for the selected regulation and industry. Please select a different combination.")
-        if st.button("Back to Welcome"):
-            st.session_state.current_page = 'welcome'
-            st.rerun()
-        return
-    
-    # Debug display to show section progress
-    st.sidebar.write(f"Current Section: {st.session_state.current_section + 1} of {len(sections)}")
-    st.sidebar.write(f"Total Sections: {len(sections)}")
-    
-    if st.session_state.current_section >= len(sections):
-        st.session_state.assessment_complete = True
-        # Force recalculation of results using correct mapping
-        if st.session_state.selected_country == "Qatar" and st.session_state.selected_industry == "General":
-            regulation_for_calc = "NPC"
+# How each auto-fill choice picks an answer from a question's options
+_AUTO_FILL_PICKERS = {
+    "All Yes/Positive": lambda options: options[0],  # First option (Yes/Positive)
+    "All Partial/Medium": lambda options: options[1] if len(options) > 2 else options[0],  # Middle option if available
+    "All No/Negative": lambda options: options[-1],  # Last option (No/Negative)
+    "Random Mix": random.choice,
+}
+
+def _question_options(section):
+    """Return the answer options for each question in a section"""
+    options_list = []
+    section_options = section.get("options", [])
+    for q_idx, question in enumerate(section.get("questions", [])):
+        if isinstance(question, dict):
+            options_list.append(question.get("options", []))
+        elif q_idx < len(section_options):
+            options_list.append(section_options[q_idx])
         else:
-            regulation_map = {
-                "Qatar": "PDPPL",
-                "India": "DPDP",
-                "Australia": "OAIC",
-                "Saudi Arabia": "PDPL"
-            }
-            regulation_for_calc = regulation_map.get(st.session_state.selected_country, st.session_state.selected_regulation)
-        
-        # Map display industry to file industry
-        industry_file_map = {
-            "Oil and Gas": "Oil_and_Gas",
-            "Banking and finance": "Banking and finance",
-            "E-commerce": "E-commerce",
-            "General": "General"  # Keep General as is for NPC
-        }
-        industry_for_calc = industry_file_map.get(st.session_state.selected_industry, st.session_state.selected_industry)
-        
-        st.session_state.results = calculate_compliance_score(
-            regulation_for_calc,
-            industry_for_calc
+            options_list.append(["Yes", "No", "Not applicable"])
+    return options_list
+
+@st.fragment
+def _render_testing_tools(questionnaire, section_keys):
+    """Render the admin auto-fill tools; reruns on its own when used"""
+    with st.expander("TESTING TOOLS", expanded=True):
+        auto_fill_option = st.radio(
+            "Auto-fill responses with:",
+            ["None", "All Yes/Positive", "All Partial/Medium", "All No/Negative", "Random Mix"],
+            key="auto_fill_option",
+            index=4  # Set default to "Random Mix" (index 4 in the list)
         )
-        
-        # Redirect to report page
-        st.session_state.current_page = 'report'
-        st.rerun()
-        return
+        if st.button("Apply Auto-Fill", key="apply_auto_fill", type="primary"):
+            sections = questionnaire["sections"]
+            current_section = st.session_state.current_section
+            
+            if current_section < len(sections):
+                section = sections[current_section]
+                pick = _AUTO_FILL_PICKERS.get(auto_fill_option)
+                
+                # Choose every answer first, then write them in one batch
+                updates = {}
+                if pick is not None:
+                    for response_key, options in zip(section_keys[current_section], _question_options(section)):
+                        selected_option = pick(options)
+                        if selected_option:
+                            updates[response_key] = selected_option
+                
+                if updates:
+                    set_responses(updates)
+                    # Keep the radio widgets in step with the responses
+                    for response_key, selected_option in updates.items():
+                        st.session_state[f"radio_{response_key}"] = selected_option
+                    st.success("Responses auto-filled successfully!")
+                    # Update the auto-fill state
+                    st.session_state.auto_fill_complete = True
+                    # Use st.rerun() as per latest Streamlit version
+                    st.rerun()
+            else:
+                st.error("No section available for auto-fill")
+
+def _finalize_assessment():
+    """Score the completed assessment and redirect to the report page"""
+    st.session_state.assessment_complete = True
+    # Force recalculation of results using correct mapping
+    regulation_for_calc, industry_for_calc = resolve_regulation_and_industry(
+        st.session_state.selected_country,
+        st.session_state.selected_industry,
+        st.session_state.selected_regulation
+    )
     
-    # Get current section
-    current_section = sections[st.session_state.current_section]
-    section_name = current_section["name"]
-    questions = current_section["questions"]
+    st.session_state.results = _score(
+        regulation_for_calc,
+        industry_for_calc,
+        tuple(sorted(st.session_state.responses.items()))
+    )
     
-    # Display section name prominently
-    st.markdown(f"""
-        <div class="section-header">
-            <h2>Part {st.session_state.current_section + 1}: {section_name}</h2>
+    # Redirect to report page
+    st.session_state.current_page = 'report'
+    st.rerun()
+
+@functools.lru_cache(maxsize=256)
+def _progress_html(section_progress: float, overall_progress: float, answered: int, total: int) -> str:
+    """Return the part/overall progress line shown above the question form"""
+    return f'''
+        <div class="progress-section">
+            <span style="float:left">Part progress: {section_progress:.1f}%</span>
+            <span style="float:right">Overall progress: {overall_progress:.1f}% ({answered}/{total} questions)</span>
+            <div style="clear:both"></div>
         </div>
-    """, unsafe_allow_html=True)
-    
-    # Calculate overall progress across all sections
-    total_questions = sum(len(section["questions"]) for section in sections)
+    '''
+
+@st.fragment
+def _render_section_form(questionnaire, section_keys):
+    """Render progress and the current section's question form.
+
+    Submitting the form reruns only this fragment; moving to another
+    section or finishing the assessment triggers a full rerun.
+    """
+    current_section = questionnaire["sections"][st.session_state.current_section]
     
-    # Count only responses that belong to the current questionnaire structure
-    answered_questions = 0
-    for s_idx, section in enumerate(sections):
-        section_questions = len(section.get("questions", []))
-        for q_idx in range(section_questions):
-            response_key = f"s{s_idx}_q{q_idx}"
-            if response_key in st.session_state.responses and st.session_state.responses[response_key] is not None:
-                answered_questions += 1
+    # Calculate overall progress across all sections; set_response keeps the
+    # answered count current
+    total_questions = st.session_state.total_questions
+    answered_questions = st.session_state.get('answered_count', 0)
     
     overall_progress = (answered_questions / total_questions) * 100 if total_questions > 0 else 0
     # Ensure progress never exceeds 100%
     overall_progress = min(overall_progress, 100.0)
-    section_progress = get_section_progress_percentage()
+    # Part progress from this section's precomputed keys, rather than
+    # reloading the questionnaire to rebuild them
+    current_keys = section_keys[st.session_state.current_section]
+    section_answered = sum(1 for key in current_keys if key in st.session_state.responses)
+    section_progress = min((section_answered / len(current_keys)) * 100, 100.0) if current_keys else 0
     
     # Show progress bar and metrics compactly
     st.progress(overall_progress / 100)
-    st.markdown(f'''
-        <div class="progress-section">
-            <span style="float:left">Part progress: {section_progress:.1f}%</span>
-            <span style="float:right">Overall progress: {overall_progress:.1f}% ({answered_questions}/{total_questions} questions)</span>
-            <div style="clear:both"></div>
-        </div>
-    ''', unsafe_allow_html=True)
+    st.markdown(
+        _progress_html(round(section_progress, 1), round(overall_progress, 1), answered_questions, total_questions),
+        unsafe_allow_html=True
+    )
+    
+    option_index_maps = st.session_state.option_index_maps
+    saved_responses = False
     
     # Create form for questions
     with st.form(key=f"section_form_{st.session_state.current_section}"):
@@ -617,14 +344,12 @@ def render_assessment():
             """, unsafe_allow_html=True)
             
             # Create response radio buttons
-            response_key = f"s{st.session_state.current_section}_q{q_idx}"
+            response_key = section_keys[st.session_state.current_section][q_idx]
             radio_key = f"radio_{response_key}"
             current_response = st.session_state.responses.get(response_key)
             
             # Determine index for radio button - None for no pre-selection, or index of saved response
-            radio_index = None
-            if current_response and current_response in options:
-                radio_index = options.index(current_response)
+            radio_index = option_index_maps[response_key].get(current_response) if current_response else None
             
             response = st.radio(
                 "Select your response:",
@@ -636,79 +361,156 @@ def render_assessment():
             # Only save response if user actually made a selection (response is not None)
             if response is not None and response != current_response:
                 save_response(st.session_state.current_section, q_idx, response)
-                st.session_state.responses[response_key] = response
+                saved_responses = True
         
         # Navigation buttons
-        st.markdown(get_common_button_css(), unsafe_allow_html=True)
         col1, col2 = st.columns([1, 1])
         with col1:
             if st.session_state.current_section > 0:
                 prev_clicked = st.form_submit_button("Previous Section")
                 if prev_clicked:
                     st.session_state.current_section -= 1
-                    # Only rerun if actually changing sections
-                    if st.session_state.current_section >= 0:
-                        st.rerun()
+                    # The form lives in a fragment, so rerun the app to redraw the section
+                    st.rerun()
         
         with col2:
             is_last_section = st.session_state.current_section == len(questionnaire["sections"]) - 1
             next_label = "Complete Assessment" if is_last_section else "Next Section"
             next_clicked = st.form_submit_button(next_label)
+            # Shown after the rerun that refreshed the navigation panel's counts
+            pending_error = st.session_state.pop('section_form_error', None)
+            if pending_error:
+                st.error(pending_error)
             if next_clicked:
                 # Validate responses - check for missing or None responses
-                unanswered = []
-                for q_idx in range(len(current_section["questions"])):
-                    response_key = f"s{st.session_state.current_section}_q{q_idx}"
-                    response = st.session_state.responses.get(response_key)
-                    if response is None:  # Either missing or explicitly None from radio button
-                        unanswered.append(q_idx + 1)
+                responses = st.session_state.responses
+                # Either missing or explicitly None from radio button
+                unanswered = [
+                    q_idx + 1 for q_idx, response_key in enumerate(current_keys)
+                    if responses.get(response_key) is None
+                ]
                 
                 if not unanswered:
                     if is_last_section:
-                        st.session_state.assessment_complete = True
-                        # Force recalculation of results using correct mapping
-                        if st.session_state.selected_country == "Qatar" and st.session_state.selected_industry == "General":
-                            regulation_for_calc = "NPC"
-                        else:
-                            regulation_map = {
-                                "Qatar": "PDPPL",
-                                "India": "DPDP",
-                                "Australia": "OAIC",
-                                "Saudi Arabia": "PDPL"
-                            }
-                            regulation_for_calc = regulation_map.get(st.session_state.selected_country, st.session_state.selected_regulation)
-                        
-                        # Map display industry to file industry
-                        industry_file_map = {
-                            "Oil and Gas": "Oil_and_Gas",
-                            "Banking and finance": "Banking and finance",
-                            "E-commerce": "E-commerce",
-                            "General": "General"  # Keep General as is for NPC
-                        }
-                        industry_for_calc = industry_file_map.get(st.session_state.selected_industry, st.session_state.selected_industry)
-                        
-                        st.session_state.results = calculate_compliance_score(
-                            regulation_for_calc,
-                            industry_for_calc
-                        )
-                        
-                        # Redirect to report page
-                        st.session_state.current_page = 'report'
-                        st.rerun()
+                        _finalize_assessment()
                     else:
                         st.session_state.current_section += 1
-                        # Only rerun if actually changing sections
-                        if st.session_state.current_section < len(questionnaire["sections"]):
-                            st.rerun()
+                        # The form lives in a fragment, so rerun the app to redraw the section
+                        st.rerun()
                 else:
-                    st.error(f"Please answer question(s) {', '.join(map(str, unanswered))} before proceeding.")
+                    message = f"Please answer question(s) {', '.join(map(str, unanswered))} before proceeding."
+                    if saved_responses:
+                        # The navigation panel is a separate fragment; rerun the app so its
+                        # answered counts include what was just saved
+                        st.session_state.section_form_error = message
+                        st.rerun()
+                    st.error(message)
+
+def render_assessment():
+    """Render the assessment page"""
+    ss = st.session_state
+    # Initialize session state for responses if not exists
+    if 'responses' not in ss:
+        ss.responses = {}
+        ss.answered_count = 0
+    
+    # Track current section
+    if 'current_section' not in ss:
+        ss.current_section = 0
+    current_idx = ss.current_section
+    
+    # Create a top anchor without extra spacing
+    st.markdown('<div id="top"></div>', unsafe_allow_html=True)
+    
+    # Map the selected country/industry to the questionnaire to load
+    regulation_for_loader, industry_for_loader = resolve_regulation_and_industry(
+        ss.selected_country,
+        ss.selected_industry,
+        ss.selected_regulation
+    )
+    
+    # The cache is keyed on (regulation, industry), so a country/industry
+    # change loads the matching questionnaire without extra bookkeeping
+    try:
+        questionnaire, section_keys, total_questions, option_index_maps = _questionnaire_bundle(
+            regulation_for_loader, industry_for_loader
+        )
+    except Exception as e:
+        logger.error(f"[render_assessment] Error loading questionnaire for regulation: {regulation_for_loader}, industry: {industry_for_loader}: {e}")
+        raise
+    # Published for the report page and countdown timer
+    ss.current_questionnaire = questionnaire
+    # Read by the section form fragment
+    ss.total_questions = total_questions
+    ss.option_index_maps = option_index_maps
+    
+    # Show questionnaire debug info in sidebar with more details
+    with st.sidebar:
+        _render_nav_sidebar(questionnaire, section_keys)
+    
+    # TESTING ONLY - TO BE REMOVED BEFORE PRODUCTION
+    # Add quick-fill testing option in sidebar for faster testing
+    if ss.get('is_admin', False):
+        with st.sidebar:
+            _render_testing_tools(questionnaire, section_keys)
+    
+    # END OF TESTING CODE
+    
+
+    sections = questionnaire["sections"]
+    
+    # Check if questionnaire has any sections
+    if not sections:
+        st.error("No assessment questions found for the selected regulation and industry. Please select a different combination.")
+        if st.button("Back to Welcome"):
+            ss.current_page = 'welcome'
+            st.rerun()
+        return
+    
+    # Debug display to show section progress
+    st.sidebar.write(f"Current Section: {current_idx + 1} of {len(sections)}")
+    st.sidebar.write(f"Total Sections: {len(sections)}")
+    
+    if current_idx >= len(sections):
+        _finalize_assessment()
+        return
+    
+    # Display section name prominently
+    section_name = sections[current_idx]["name"]
+    st.markdown(f"""
+        <div class="section-header">
+            <h2>Part {current_idx + 1}: {section_name}</h2>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    # Progress and questions rerun on their own when the form is submitted
+    _render_section_form(questionnaire, section_keys)
+
+from nlg_report import generate_report, REPORT_ERROR_MESSAGE
 
+def _results_hash(results: Dict[str, Any]) -> str:
+    """Stable digest of assessment results, used as the AI report cache key"""
+    return hashlib.sha1(json.dumps(results, sort_keys=True, default=str).encode()).hexdigest()
 
-from nlg_report import generate_report
+# Held in memory: Streamlit ignores ttl for persist="disk" and never evicts
+# disk entries, so a persisted cache would grow by one file per answer set
+@st.cache_data(ttl=86400, max_entries=64, show_spinner=False)
+def _cached_ai_report(results_hash: str, use_external_api: bool, generation: str, _results: Dict[str, Any]) -> str:
+    """Generate the report for a set of results once, sharing it across sessions for a day.
+
+    _results is keyed through results_hash; generation is empty for the shared
+    report and a per-request nonce when a user asks for a fresh one, so no
+    one else's entry is evicted or reused. Failures, including an AI call that
+    would have fallen back to the template report, raise so they are not cached.
+    """
+    report = generate_report(_results, use_external_api=use_external_api, fallback_to_template=False)
+    if not report or report == REPORT_ERROR_MESSAGE:
+        raise ValueError("no content returned")
+    return report
 
-def generate_natural_language_report(results: Dict[str, Any]) -> str:
+def generate_natural_language_report(results: Dict[str, Any], generation: str = "") -> Optional[str]:
     """
-    Generate human-readable report using AI
+    Generate human-readable report using AI; returns None if generation fails
     """
     logger.info("Requesting AI report generation with the following configuration:")
     logger.info(f"AI enabled: {config.get_ai_enabled()}")
@@ -717,14 +519,18 @@ def generate_natural_language_report(results: Dict[str, Any]) -> str:
     
     # Record timing information
     start_time = time.time()
+    use_external_api = config.get_ai_enabled()
     try:
-        report = generate_report(results, use_external_api=config.get_ai_enabled())
-        if not report:
-            logger.error("Report generation failed - no content returned")
-            return "Error: Failed to generate report. Please try again or contact support."
+        report = _cached_ai_report(_results_hash(results), use_external_api, generation, results)
     except Exception as e:
         logger.error(f"Error in report generation: {e}")
-        return "Error: Failed to generate report. Please try again or contact support."
+        if not use_external_api:
+            return None
+        # Template report in place of the AI one, kept out of the shared cache
+        # so the next request tries the API again
+        report = generate_report(results, use_external_api=False)
+        if not report or report == REPORT_ERROR_MESSAGE:
+            return None
         
     duration = time.time() - start_time
     logger.info(f"Report generation completed in {duration:.2f} seconds")
@@ -732,466 +538,221 @@ def generate_natural_language_report(results: Dict[str, Any]) -> str:
     
     return report
 
-def render_report():
-    """Render the compliance report"""
-    if not st.session_state.assessment_complete:
-        st.info("Complete the assessment to view your compliance report")
-        if st.button("Go to Assessment", type="primary"):
-            st.session_state.current_page = 'assessment'
-            st.rerun()
-        return
+# Bundled assets for the report/PDF header and the Informatica diagrams
+_PDF_LOGO_PATH = os.path.join(config.ASSETS_DIR, "@DataINFA.png")
+_INFA_DIAGRAM_PATH = os.path.join(config.ASSETS_DIR, "INFA.html")
+_CLAIRE_DIAGRAM_PATH = os.path.join(config.ASSETS_DIR, "CLAIRE.html")
+
+@functools.lru_cache(maxsize=8)
+def _asset_exists(path: str) -> bool:
+    """Whether a bundled asset (logo) exists; checked once per process"""
+    return os.path.exists(path)
+
+def _encode_image(image_path: str) -> str:
+    """Read an image file and base64-encode it for an inline data: URI"""
+    with open(image_path, "rb") as img_file:
+        return binascii.b2a_base64(img_file.read(), newline=False).decode("ascii")
+
+@st.cache_data(show_spinner=False)
+def _get_image_base64(image_path: str) -> str:
+    """Return a static image asset base64-encoded for inline data: URIs"""
+    return _encode_image(image_path)
+
+# Gartner Magic Quadrant images, in tile order. They live in ./static and are
+# served by Streamlit (server.enableStaticServing), so the browser fetches and
+# caches them once instead of receiving them inline with every rerun
+_MAGIC_QUADRANT_SRC = tuple(f"app/static/{name}" for name in (
+    "data-integration-tools-mq.jpg",
+    "ipaas-mq.jpg",
+    "data-governance-mq.jpg",
+    "data-quality-mq.png",
+))
+
+# The report's Gartner Magic Quadrant tiles
+_MAGIC_QUADRANT_HTML = f"""
+        <div class="magic-quadrant-section">
+            <div class="magic-quadrant-header">
+                <span style="color: #FFA500;">Informatica Leadership in Gartner Magic Quadrant</span>
+            </div>
+            <div class="magic-quadrant-grid">
+                <div class="quadrant-item">
+                    <div class="magic-quadrant-title">Data Integration Tools</div>
+                    <a href="https://www.informatica.com/lp/gartner-leadership.html" target="_blank" class="quadrant-link">
+                        <div class="image-container">
+                            <img src="{_MAGIC_QUADRANT_SRC[0]}" alt="Data Integration Tools">
+                        </div>
+                    </a>
+                </div>
+                <div class="quadrant-item">
+                    <div class="magic-quadrant-title">Integration Platform as a Service (iPaaS)</div>
+                    <a href="https://www.informatica.com/lp/gartner-leadership.html" target="_blank" class="quadrant-link">
+                        <div class="image-container">
+                            <img src="{_MAGIC_QUADRANT_SRC[1]}" alt="iPaaS">
+                        </div>
+                    </a>
+                </div>
+                <div class="quadrant-item">
+                    <div class="magic-quadrant-title">Data and Analytics Governance Platforms<span class="new-badge">NEW</span></div>
+                    <a href="https://www.informatica.com/lp/gartner-leadership.html" target="_blank" class="quadrant-link">
+                        <div class="image-container">
+                            <img src="{_MAGIC_QUADRANT_SRC[2]}" alt="Data Governance">
+                        </div>
+                    </a>
+                </div>
+                <div class="quadrant-item">
+                    <div class="magic-quadrant-title">Augmented Data Quality Solutions<span class="new-badge">NEW</span></div>
+                    <a href="https://www.informatica.com/lp/gartner-leadership.html" target="_blank" class="quadrant-link">
+                        <div class="image-container">
+                            <img src="{_MAGIC_QUADRANT_SRC[3]}" alt="Data Quality">
+                        </div>
+                    </a>
+                </div>
+            </div>
+        </div>
+    """
 
-    # Clear questionnaire cache to ensure we get fresh data
-    if not st.session_state.get('report_cache_cleared', False):
-        st.session_state.clear_questionnaire_cache = True
-        st.session_state.report_cache_cleared = True
-    
-    results = st.session_state.results
+def _wrap_diagram(path: str) -> str:
+    """Read a framework diagram asset and wrap it in its responsive container"""
+    with open(path, "r", encoding="utf-8") as f:
+        html_content = f.read()
+    # Each diagram is its own iframe, so each carries the (minified) CSS
+    return f"""{minify_css(get_diagram_css())}
+        <div class="diagram-section-bg">
+            <div class="diagram-container">
+                <div class="diagram-content">
+                    {html_content}
+                </div>
+            </div>
+        </div>
+        """
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _diagram_htmls(stamped_paths: Tuple[Tuple[str, float], ...]) -> Tuple[str, ...]:
+    """Build the component HTML for each (path, mtime), reading the files concurrently.
+
+    The mtimes are part of the cache key so an edited asset is picked up.
+    The result is immutable, so every session shares the same strings
+    instead of receiving a copy on each hit.
+    """
+    if not stamped_paths:
+        return ()
+    with ThreadPoolExecutor(max_workers=len(stamped_paths)) as executor:
+        return tuple(executor.map(_wrap_diagram, [path for path, _ in stamped_paths]))
+
+def _render_framework_diagrams() -> None:
+    """Render the Implementation Framework and CLAIRE diagrams; both assets are loaded in one batch"""
+    html_path = _INFA_DIAGRAM_PATH
+    claire_path = _CLAIRE_DIAGRAM_PATH
+    stamped_paths = tuple((path, os.path.getmtime(path)) for path in (html_path, claire_path) if os.path.exists(path))
+    diagram_htmls = dict(zip((path for path, _ in stamped_paths), _diagram_htmls(stamped_paths)))
     
-    # CRITICAL FIX: Force fresh calculation if we detect stale results
-    # Check if results contain wrong questionnaire type before proceeding
-    if results:
-        result_section_names = list(results.get("section_scores", {}).keys())
-        regulation_for_loader, industry_for_loader = get_regulation_and_industry_for_loader()
-        
-        # If we expect NPC but results contain PDPPL sections, force recalculation
-        if regulation_for_loader == "NPC" and any("PDPPL" in name or "Principles of Data Privacy" in name for name in result_section_names):
-            logger.warning(f"[STALE] Detected stale PDPPL results when expecting NPC. Forcing fresh calculation...")
-            st.session_state.clear_questionnaire_cache = True
-            
-            # Force fresh calculation with correct parameters
-            regulation_map = {"Qatar": "PDPPL", "India": "DPDP", "Australia": "OAIC"}
-            regulation_for_calc = regulation_map.get(st.session_state.selected_country, st.session_state.selected_regulation)
-            logger.info(f"[STALE] Recalculating with correct regulation: {regulation_for_calc}")
-            
-            industry_file_map = {
-                "Oil and Gas": "Oil_and_Gas",
-                "Banking and finance": "Banking and finance", 
-                "E-commerce": "E-commerce",
-                "General": "General"
-            }
-            industry_for_calc = industry_file_map.get(st.session_state.selected_industry, st.session_state.selected_industry)
-            
-            logger.info(f"[STALE] Recalculating with fresh {regulation_for_calc}/{industry_for_calc}")
-            st.session_state.results = calculate_compliance_score(regulation_for_calc, industry_for_calc)
-            results = st.session_state.results
-            st.info("🔄 **Refreshed stale results** - Now using correct NPC questionnaire data.")
-    elif actual_section_count < expected_section_count:
-        # Auto-fix section count mismatch too
-        st.info(f"🔄 **Auto-processing all sections** - Ensuring all {expected_section_count} sections are included...")
-        
-        # DEMO MODE: Force NPC for all selections
-        regulation_for_calc = "NPC"
-        logger.info(f"[DEMO] AUTO-FIXING: FORCING NPC for Process All Sections")
-        
-        # Map display industry to file industry
-        industry_file_map = {
-            "Oil and Gas": "Oil_and_Gas",
-            "Banking and finance": "Banking and finance",
-            "E-commerce": "E-commerce",
-            "General": "General"
-        }
-        industry_for_calc = industry_file_map.get(st.session_state.selected_industry, st.session_state.selected_industry)
-        
-        st.session_state.results = calculate_compliance_score(
-            regulation_for_calc,
-            industry_for_calc
-        )
-        st.success(f"✅ **Auto-processed all {expected_section_count} sections!** Report now shows complete results.")
-        st.rerun()
-    
-    st.subheader(f"{format_regulation_name(st.session_state.selected_regulation)}  Compliance Report")
-    # st.subheader(f"For: {st.session_state.organization_name}")
-    # st.write(f"Assessment Date: {st.session_state.assessment_date}")
-    
-    # Get questionnaire to check how many sections it has vs how many have scores
-    regulation_for_loader, industry_for_loader = get_regulation_and_industry_for_loader()
-    questionnaire = get_questionnaire(regulation_for_loader, industry_for_loader)
-    expected_section_count = len(questionnaire.get("sections", []))
-    actual_section_count = len(results.get("section_scores", {}))
-    
-    # Check if we have a questionnaire type mismatch (CRITICAL FIX)
-    expected_section_names = [section["name"] for section in questionnaire.get("sections", [])]
-    actual_section_names = list(results.get("section_scores", {}).keys())
-    
-    # Detect if we're using the wrong questionnaire (e.g., PDPPL sections for NPC)
-    questionnaire_mismatch = False
-    if regulation_for_loader == "NPC" and any("PDPPL" in name for name in actual_section_names):
-        logger.warning(f"[MISMATCH] QUESTIONNAIRE MISMATCH DETECTED: Expected NPC sections but found PDPPL sections in results")
-        questionnaire_mismatch = True
-    elif regulation_for_loader == "PDPPL" and any("Data Management Strategy" in name for name in actual_section_names):
-        logger.warning(f"[MISMATCH] QUESTIONNAIRE MISMATCH DETECTED: Expected PDPPL sections but found NPC sections in results")
-        questionnaire_mismatch = True
-    
-    # Show questionnaire mismatch and auto-fix it immediately for demo
-    if questionnaire_mismatch:
-        # Prevent infinite loops with a session state flag
-        if not st.session_state.get('auto_fixing_mismatch', False):
-            st.session_state.auto_fixing_mismatch = True
-            
-            st.info(f"🔄 **Auto-fixing questionnaire mismatch** - Recalculating with correct {regulation_for_loader} questionnaire...")
-            
-            # Add a small delay to make the process visible
-            import time
-            time.sleep(1)
-            
-            # Use correct regulation mapping
-            regulation_map = {"Qatar": "PDPPL", "India": "DPDP", "Australia": "OAIC"}
-            regulation_for_calc = regulation_map.get(st.session_state.selected_country, st.session_state.selected_regulation)
-            logger.info(f"[AUTO-FIX] Using correct regulation: {regulation_for_calc}")
-            
-            # Map display industry to file industry
-            industry_file_map = {
-                "Oil and Gas": "Oil_and_Gas",
-                "Banking and finance": "Banking and finance",
-                "E-commerce": "E-commerce",
-                "General": "General"
-            }
-            industry_for_calc = industry_file_map.get(st.session_state.selected_industry, st.session_state.selected_industry)
-            
-            # Clear caches before recalculating
-            st.session_state.clear_questionnaire_cache = True
-            
-            logger.info(f"AUTO-FIX: Recalculating with {regulation_for_calc}/{industry_for_calc}")
-            st.session_state.results = calculate_compliance_score(
-                regulation_for_calc,
-                industry_for_calc
-            )
-            st.success(f"✅ **Auto-fixed questionnaire mismatch!** Now using correct {regulation_for_calc} questionnaire.")
-            
-            # Reset the flag and rerun
-            st.session_state.auto_fixing_mismatch = False
-            st.rerun()
-        else:
-            # If we're still in auto-fix mode, show a simple message
-            st.info("🔄 Finalizing questionnaire alignment...")
-            st.session_state.auto_fixing_mismatch = False
-    
-    # Summary section
-    st.markdown(f"""
-    ### Overall Compliance: {results['overall_score']:.1f}% and <span style='color: {get_compliance_level_color(results['compliance_level'])}; font-weight: bold;'>{results['compliance_level']}</span>
-    This report provides a detailed assessment of your organization's compliance with the {format_regulation_name(st.session_state.selected_regulation)}
-    across key areas. Review the section scores and recommendations below to identify areas
-    for improvement.
-    """, unsafe_allow_html=True)
-    
-    # Create two columns for charts with 1:2 ratio
-    col1, col2 = st.columns([1, 2])
-    
-    # Add gauge chart in the first column
-    with col1:
-        # Create gauge chart
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=results['overall_score'],
-            number={'suffix': '%', 'valueformat': '.0f'},
-            domain={'x': [0.1, 0.9], 'y': [0, 0.9]},
-            gauge={
-                'axis': {'range': [0, 100], 'tickvals': [0, 25, 50, 75, 100], 'ticktext': ['0%', '25%', '50%', '75%', '100%']},
-                'bar': {'color': "#1f77b4"},
-                'steps': [
-                    {'range': [0, 50], 'color': "#ff4b4b"},
-                    {'range': [50, 75], 'color': "#ffa64b"},
-                    {'range': [75, 100], 'color': "#4bff4b"}
-                ]
-            },
-            title={'text': "Overall Compliance Score"}
-        ))
-        fig.update_layout(height=300, margin=dict(t=40, b=20, l=20, r=20))
-        st.plotly_chart(fig, use_container_width=True)
-    
-    # Add horizontal bar chart in the second column
-    with col2:
-        # Get all sections from questionnaire
-        questionnaire = st.session_state.current_questionnaire
-        all_sections = [section["name"] for section in questionnaire["sections"]]
-        
-        # Create section scores dataframe with percentage scores and weights, including all sections
-        df = pd.DataFrame([
-            {
-                "Section": section,
-                "Score": max(0.1, round(results["section_scores"].get(section, 0) * 100)),
-                "Weight": round(next((s['weight'] * 100 for s in questionnaire['sections'] if s['name'] == section), 0), 1)
-            }
-            for section in all_sections
-        ])
-        df = df.sort_values(by="Score", ascending=True)
-        
-        # Create horizontal bar chart with improved color scheme and hover template
-        fig = px.bar(
-            df, 
-            x="Score", 
-            y="Section", 
-            orientation='h',
-            color="Score",
-            color_continuous_scale=[[0, "#FF4B4B"], [0.5, "#FF4B4B"], [0.5, "#FFA500"], [0.75, "#FFA500"], [0.75, "#00CC96"], [1, "#00CC96"]],
-            range_color=[0, 100],
-            labels={"Score": "Compliance Score (%)"}
-        )
-        fig.update_layout(
-            height=400,
-            margin=dict(l=10, r=10, t=10, b=10),
-            yaxis=dict(automargin=True)
-        )
-        # Add custom hover template to show weight
-        fig.update_traces(
-            hovertemplate="<b>%{y}</b><br>Score: %{x:.1f}%<br>Weight: %{customdata:.1f}%<extra></extra>",
-            customdata=df["Weight"]
-        )
-        st.plotly_chart(fig, use_container_width=True)
-    
-    # Add verification for perfect scores
-    all_perfect = True
-    all_section_scores = []
-    
-    for section_name, score in results["section_scores"].items():
-        if score is not None:  # Skip sections with no applicable questions
-            all_section_scores.append(score)
-            if score < 1.0:
-                all_perfect = False
-                break
-    
-    if all_perfect and results['overall_score'] < 100:
-        st.warning("""
-        **Note:** All your section scores show full compliance, but the overall score may be slightly below 100% 
-        due to weighting factors or rounding. Your organization has effectively achieved full compliance.
-        """)
-
-    # Create dataframe for section scores table
-    section_data = []
-    none_score_sections = []
-    
-    for section, score in results["section_scores"].items():
-        if score is not None:  # Skip sections with no applicable questions
-            status = "High Risk" if score < 0.6 else ("Moderate Risk" if score < 0.75 else "Compliant")
-            section_data.append({
-                "Section": section,
-                "Score (%)": f"{score * 100:.1f}%",
-                "Weight": (
-                    f"{next((s['weight'] * 100 for s in get_questionnaire(*get_regulation_and_industry_for_loader())['sections'] if s['name'] == section), 0):.1f}%"
-                ),
-                "Status": status
-            })
-        else:
-            none_score_sections.append(section)
-    
-    df = pd.DataFrame(section_data)
-    
-    # Display sections with None scores
-    if none_score_sections:
-        st.info("The following sections have no score because all questions were marked as 'Not applicable' or had no responses:")
-        for section in none_score_sections:
-            st.write(f"• {section}")
-    
-    # Add Recommended Actions section here
-    st.subheader("Recommended Actions")
-
-    def clean_recommendation_text(text: str) -> str:
-        """Remove all Informatica Solution prefixes and HTML spans from recommendation text."""
-        # Remove all HTML spans
-        text = re.sub(r"<span[^>]*>Informatica Solution:</span>\s*", "", text, flags=re.IGNORECASE)
-        # Remove all plain text occurrences
-        text = re.sub(r"Informatica Solution:\s*", "", text, flags=re.IGNORECASE)
-        # Remove any leading/trailing whitespace and newlines
-        return text.strip()
-
-    if results.get("improvement_priorities"):
-        for i, area in enumerate(results["improvement_priorities"][:3]):
-            with st.expander(f"Priority {i+1}: {area}"):
-                if area in results["recommendations"] and results["recommendations"][area]:
-                    for rec in results["recommendations"][area]:
-                        st.write(f"• {clean_recommendation_text(rec)}")
-                else:
-                    st.write("No specific recommendations available for this area.")
-    else:
-        st.info("No specific priority actions identified based on your assessment results.")
-    
-    # Add INFA Diagram
     st.subheader("Implementation Framework")
-    html_path = os.path.join(config.BASE_DIR, "Assets", "INFA.html")
-    if os.path.exists(html_path):
-        with open(html_path, "r", encoding="utf-8") as f:
-            html_content = f.read()
-        # Use CSS for responsive scaling with container adjustments and new dark background color
-        centered_html = f"""
-        <style>
-        .diagram-section-bg {{
-            background: #181c24; /* Dark background color */
-            border-radius: 12px;
-            padding: 32px 10px 10px 10px;
-            margin-bottom: 1rem;
-            min-height: 520px;
-            box-shadow: 0 2px 12px rgba(0,0,0,0.10);
-        }}
-        .diagram-container {{
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            width: 100%;
-            padding: 0;
-            margin: 0;
-            overflow: auto;
-            min-height: 500px;
-            background: transparent;
-        }}
-        .diagram-content {{
-            position: relative;
-            width: 100%;
-            height: 100%;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-        }}
-        .diagram-content svg {{
-            max-width: 100%;
-            height: auto;
-            transform-origin: center;
-            transition: transform 0.3s ease;
-        }}
-        @media (max-width: 1200px) {{
-            .diagram-section-bg {{ min-height: 470px; }}
-            .diagram-content svg {{ transform: scale(0.85); }}
-        }}
-        @media (max-width: 992px) {{
-            .diagram-section-bg {{ min-height: 420px; }}
-            .diagram-content svg {{ transform: scale(0.75); }}
-        }}
-        @media (max-width: 768px) {{
-            .diagram-section-bg {{ min-height: 370px; }}
-            .diagram-content svg {{ transform: scale(0.65); }}
-        }}
-        @media (max-width: 576px) {{
-            .diagram-section-bg {{ min-height: 320px; }}
-            .diagram-content svg {{ transform: scale(0.5); }}
-        }}
-        </style>
-        <div class="diagram-section-bg">
-            <div class="diagram-container">
-                <div class="diagram-content">
-                    {html_content}
-                </div>
-            </div>
-        </div>
-        """
-        st.components.v1.html(centered_html, height=700, scrolling=True)
+    if html_path in diagram_htmls:
+        st.components.v1.html(diagram_htmls[html_path], height=700, scrolling=True)
     else:
         st.warning("DPDP Implementation Framework diagram not found.")
     
     # Add CLAIRE Diagram with reduced spacing
     st.markdown('<div style="margin-bottom: 1rem;"></div>', unsafe_allow_html=True)
     st.subheader("Informatica CLAIRE Framework")
-    claire_path = os.path.join(config.BASE_DIR, "Assets", "CLAIRE.html")
-    if os.path.exists(claire_path):
-        with open(claire_path, "r", encoding="utf-8") as f:
-            claire_content = f.read()
-        # Use the same dark background and container style as INFA diagram
-        centered_html = f"""
-        <style>
-        .diagram-section-bg {{
-            background: #181c24; /* Dark background color */
-            border-radius: 12px;
-            padding: 32px 10px 10px 10px;
-            margin-bottom: 1rem;
-            min-height: 520px;
-            box-shadow: 0 2px 12px rgba(0,0,0,0.10);
-        }}
-        .diagram-container {{
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            width: 100%;
-            padding: 0;
-            margin: 0;
-            overflow: auto;
-            min-height: 500px;
-            background: transparent;
-        }}
-        .diagram-content {{
-            position: relative;
-            width: 100%;
-            height: 100%;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-        }}
-        .diagram-content svg {{
-            max-width: 100%;
-            height: auto;
-            transform-origin: center;
-            transition: transform 0.3s ease;
-        }}
-        @media (max-width: 1200px) {{
-            .diagram-section-bg {{ min-height: 470px; }}
-            .diagram-content svg {{ transform: scale(0.85); }}
-        }}
-        @media (max-width: 992px) {{
-            .diagram-section-bg {{ min-height: 420px; }}
-            .diagram-content svg {{ transform: scale(0.75); }}
-        }}
-        @media (max-width: 768px) {{
-            .diagram-section-bg {{ min-height: 370px; }}
-            .diagram-content svg {{ transform: scale(0.65); }}
-        }}
-        @media (max-width: 576px) {{
-            .diagram-section-bg {{ min-height: 320px; }}
-            .diagram-content svg {{ transform: scale(0.5); }}
-        }}
-        </style>
-        <div class="diagram-section-bg">
-            <div class="diagram-container">
-                <div class="diagram-content">
-                    {claire_content}
-                </div>
-            </div>
-        </div>
-        """
-        st.components.v1.html(centered_html, height=700, scrolling=True)
+    if claire_path in diagram_htmls:
+        # Same dark background and container style as the INFA diagram
+        st.components.v1.html(diagram_htmls[claire_path], height=700, scrolling=True)
     else:
         st.warning("CLAIRE Framework diagram not found.")
-    # --- End of commented out section ---
 
-    # Add Not Applicable answers section
-    st.markdown('<div style="margin-bottom: 1rem;"></div>', unsafe_allow_html=True)
-    st.subheader("Answers marked as \"Not Applicable\"")
-    
-    # Get questionnaire for reference
-    regulation_for_loader, industry_for_loader = get_regulation_and_industry_for_loader()
-    questionnaire = get_questionnaire(regulation_for_loader, industry_for_loader)
-    
-    # Find all "Not applicable" responses
-    na_responses = []
-    for section_idx, section in enumerate(questionnaire["sections"]):
-        for q_idx, question in enumerate(section["questions"]):
-            response_key = f"s{section_idx}_q{q_idx}"
-            response = st.session_state.responses.get(response_key)
-            
-            if isinstance(response, str) and "not applicable" in response.lower():
-                # Get question text
-                q_text = question.get("text", question) if isinstance(question, dict) else question
-                na_responses.append({
-                    "section": section["name"],
-                    "question": q_text,
-                    "question_number": f"Q{q_idx + 1}"
-                })
-    
-    if na_responses:
-        with st.expander("View Not Applicable Responses", expanded=False):
-            for item in na_responses:
-                # Strip HTML links from question text
-                clean_question = re.sub(r'\s*\[<a.*?</a>\]', '', item['question']).strip()
-                st.markdown(f"""
-                **{item['section']} - {item['question_number']}**  
-                {clean_question}
-                """)
-                st.markdown("---")
+@st.cache_data(show_spinner=False, max_entries=16)
+def _question_index(regulation: str, industry: str) -> Dict[str, Tuple[int, str, str, str]]:
+    """Map each response key to (position, section name, "Qn", question text without links)"""
+    questionnaire = get_questionnaire(regulation, industry)
+    index = {}
+    for section_idx, section in enumerate(questionnaire.get("sections", [])):
+        for q_idx, question in enumerate(section.get("questions", [])):
+            q_text = question.get("text", question) if isinstance(question, dict) else question
+            # Strip HTML links from question text
+            index[f"s{section_idx}_q{q_idx}"] = (len(index), section["name"], f"Q{q_idx + 1}", _LINK_RE.sub('', q_text).strip())
+    return index
+
+def _request_ai_report_regeneration():
+    """Regenerate button callback: ask for a fresh AI report on the next run"""
+    st.session_state.ai_report_generated = False
+    # A fresh nonce per request bypasses the shared report cache, so this
+    # never lands on an entry another session regenerated
+    st.session_state.ai_report_generation = secrets.token_hex(8)
+
+@st.fragment
+def _render_pdf_download():
+    """Render the PDF download button; clicking it reruns only this fragment"""
+    # Function to generate PDF when download button is clicked
+    def get_pdf_data():
+        with st.spinner("Generating PDF report..."):
+            try:
+                # Get the original AI report content
+                original_report_content = st.session_state.cached_ai_report
+                if not original_report_content:
+                    st.error("No report content available. Please generate a report first.")
+                    return None
+
+                # Get organization name, default if not found
+                org_name = st.session_state.get('organization_name', 'Unknown Organization')
+                current_date = datetime.now().strftime("%B %d, %Y")
+
+                # Get the logo path and verify it exists
+                logo_path = _PDF_LOGO_PATH
+
+                # Add header with logo if available
+                header_content = ""
+                if _asset_exists(logo_path):
+                    # Convert logo to base64
+                    logo_base64 = _get_image_base64(logo_path)
+                    
+                    # Add header with logo and styling
+                    header_content = f"""<div style=\"text-align: center; margin-bottom: 30px;\">
+                            <img src=\"data:image/png;base64,{logo_base64}\" style=\"max-width: 32px; height: 32px; margin-bottom: 10px;\">
+                            <h1 style=\"color: #333; margin: 0;\">{org_name}</h1>
+                            <p style=\"color: #666; margin: 5px 0;\">Compliance Assessment Report</p>
+                            <p style=\"color: #666; margin: 5px 0;\">Generated on: {current_date} by DataINFA</p>
+                        </div>
+
+                        ---
+
+                        """
+                # Combine header with the report content
+                report_with_header = f"{header_content}{original_report_content}"
+
+                # Generate PDF
+                return convert_markdown_to_pdf(report_with_header, org_name)
+            except Exception as e:
+                logger.error(f"Error generating PDF: {e}")
+                st.error("An error occurred while generating the PDF. Please try again.")
+                return None
+
+    # Only show the download button if PDF data is available
+    pdf_data = get_pdf_data()
+    if pdf_data is not None:
+        st.download_button(
+            label="Download Report (PDF)",
+            data=pdf_data,
+            file_name=f"Questionnaire_Assessment_Report_{datetime.now().strftime('%Y%m%d')}.pdf",
+            mime="application/pdf",
+            help="Download the AI-generated analysis as a PDF document",
+            use_container_width=True,
+            key="download_pdf_button",
+            disabled=not st.session_state.get('cached_ai_report')
+        )
     else:
-        with st.expander("View Not Applicable Responses", expanded=False):
-            st.info("No questions were marked as Not Applicable.")
-    
+        st.warning("PDF report is not available yet. Please try regenerating the report.")
+
+@st.fragment
+def _render_ai_report_fragment():
+    """Render the AI analysis with its download and regenerate buttons.
+
+    Clicking either button reruns only this fragment, not the score checks,
+    charts and diagrams above it.
+    """
     # Add AI Analysis section header/intro
-    st.markdown(get_ai_analysis_css(), unsafe_allow_html=True)
     st.markdown("""
-        <div class="ai-analysis-container-header"> <!-- Use a different class if needed -->
+        <div class="ai-analysis-container-header">
             <h3 class="ai-analysis-header">🤖 AI Analysis Summary</h3>
         </div>
     """, unsafe_allow_html=True)
@@ -1214,14 +775,20 @@ def render_report():
     with st.spinner("🔄 Generating detailed AI analysis... (Estimated time: 60–120 seconds)") if should_regenerate else st.container():
         try:
             if should_regenerate:
-                generated_report = generate_natural_language_report(st.session_state.results)
-                if generated_report and not generated_report.startswith("Error:"):
+                generated_report = generate_natural_language_report(
+                    st.session_state.results,
+                    st.session_state.get('ai_report_generation', "")
+                )
+                if generated_report is not None:
                     # Clean up the report text
-                    cleaned_report = generated_report.strip()
-                    cleaned_report = cleaned_report.replace("```markdown", "").replace("```", "")
-                    cleaned_report = re.sub(r'</?div[^>]*>', '', cleaned_report, flags=re.IGNORECASE)
-                    cleaned_report = cleaned_report.replace("[Insert Date]", st.session_state.get('assessment_date', 'Unknown Date'))
-                    cleaned_report = cleaned_report.replace("[Insert Organization Name]", st.session_state.get('organization_name', 'Unknown Organization'))
+                    placeholders = {
+                        "[Insert Date]": st.session_state.get('assessment_date', 'Unknown Date'),
+                        "[Insert Organization Name]": st.session_state.get('organization_name', 'Unknown Organization')
+                    }
+                    # Single pass: drop fences/div tags and fill placeholders
+                    cleaned_report = _AI_REPORT_CLEAN_RE.sub(
+                        lambda m: placeholders.get(m.group(0), ""), generated_report
+                    ).strip()
 
                     st.session_state.cached_ai_report = cleaned_report
                     st.session_state.ai_report_generated = True
@@ -1234,61 +801,6 @@ def render_report():
 
             # Display the report content in the placeholder
             if ai_report:
-                # Add the previous CSS styling
-                st.markdown("""
-                    <style>
-                    .ai-analysis-container {
-                        background: rgba(255, 255, 255, 0.05);
-                        padding: 20px;
-                        border-radius: 10px;
-                        margin: 20px 0;
-                    }
-                    .ai-analysis-container h1 {
-                        font-size: 1.8em;
-                        font-weight: bold;
-                        color: white;
-                        margin-bottom: 25px;
-                        padding-bottom: 15px;
-                        border-bottom: 2px solid rgba(255, 255, 255, 0.1);
-                    }
-                    .ai-analysis-container .report-header {
-                        font-size: 1.8em;
-                        font-weight: bold;
-                        color: white;
-                        margin-bottom: 25px;
-                        padding-bottom: 15px;
-                        border-bottom: 2px solid rgba(255, 255, 255, 0.1);
-                    }
-                    .ai-analysis-container h2 {
-                        color: #6fa8dc;
-                        font-size: 1.5em;
-                        margin-top: 20px;
-                        margin-bottom: 15px;
-                    }
-                    .ai-analysis-container h3 {
-                        color: #6fa8dc;
-                        font-size: 1.3em;
-                        margin-top: 20px;
-                        margin-bottom: 15px;
-                    }
-                    .ai-analysis-container strong {
-                        color: #f8aeae;
-                    }
-                    .ai-analysis-container ul {
-                        margin-left: 20px;
-                        margin-bottom: 15px;
-                    }
-                    .ai-analysis-container li {
-                        margin-bottom: 10px;
-                        line-height: 1.6;
-                    }
-                    .ai-analysis-container p {
-                        line-height: 1.6;
-                        margin-bottom: 15px;
-                    }
-                    </style>
-                """, unsafe_allow_html=True)
-                        
                 # Process the report to fix the first line
                 lines = ai_report.split('\n')
                 # Remove any lines before the first Markdown header
@@ -1297,8 +809,7 @@ def render_report():
                 processed_lines = []
 
                 # Robust header extraction using regex
-                header_pattern = re.compile(r"^#\s*(.*?)\s*\*\*Overall Compliance Score: ([0-9.]+)%\*\*\s*\*\*Compliance Level: ([^*]+)\*\*")
-                header_match = header_pattern.match(lines[0]) if lines else None
+                header_match = _HEADER_RE.match(lines[0]) if lines else None
 
                 if header_match:
                     title = header_match.group(1).strip()
@@ -1344,9 +855,6 @@ def render_report():
 
     # --- Download/Regenerate Buttons ---
     if ai_report: # Only show buttons if report exists
-        # Add download button styling
-        st.markdown(get_download_button_css(), unsafe_allow_html=True)
-        
         # Place both buttons in the same row and align them
         button_col1, button_col2 = st.columns([1, 1])
         with button_col1:
@@ -1354,438 +862,460 @@ def render_report():
             if 'cached_ai_report' not in st.session_state:
                 st.session_state.cached_ai_report = ai_report
 
-            # Function to generate PDF when download button is clicked
-            def get_pdf_data():
-                if 'pdf_data' not in st.session_state:
-                    with st.spinner("Generating PDF report..."):
-                        try:
-                            # Get the original AI report content
-                            original_report_content = st.session_state.cached_ai_report
-                            if not original_report_content:
-                                st.error("No report content available. Please generate a report first.")
-                                return None
-
-                            # Get organization name, default if not found
-                            org_name = st.session_state.get('organization_name', 'Unknown Organization')
-                            current_date = datetime.now().strftime("%B %d, %Y")
-
-                            # Get the logo path and verify it exists
-                            logo_path = os.path.join(config.BASE_DIR, "Assets", "@DataINFA.png")
-                            logger.info(f"Looking for logo at: {logo_path}")
-
-                            # Add header with logo if available
-                            header_content = ""
-                            if os.path.exists(logo_path):
-                                # Convert logo to base64
-                                with open(logo_path, "rb") as f:
-                                    logo_base64 = base64.b64encode(f.read()).decode()
-                                
-                                # Add header with logo and styling
-                                header_content = f"""<div style=\"text-align: center; margin-bottom: 30px;\">
-                                    <img src=\"data:image/png;base64,{logo_base64}\" style=\"max-width: 32px; height: 32px; margin-bottom: 10px;\">
-                                    <h1 style=\"color: #333; margin: 0;\">{org_name}</h1>
-                                    <p style=\"color: #666; margin: 5px 0;\">Compliance Assessment Report</p>
-                                    <p style=\"color: #666; margin: 5px 0;\">Generated on: {current_date} by DataINFA</p>
-                                </div>
-
-                                ---
-
-                                """
-                            # Combine header with the report content
-                            report_with_header = f"{header_content}{original_report_content}"
-
-                            # Generate PDF
-                            pdf_data = convert_markdown_to_pdf(report_with_header, org_name)
-                            if pdf_data:
-                                st.session_state.pdf_data = pdf_data
-                                return pdf_data
-                        except Exception as e:
-                            logger.error(f"Error generating PDF: {e}")
-                            st.error("An error occurred while generating the PDF. Please try again.")
-                            return None
-                return st.session_state.get('pdf_data')
-
-            # Only show the download button if PDF data is available
-            pdf_data = get_pdf_data()
-            if pdf_data is not None:
-                st.download_button(
-                    label="Download Report (PDF)",
-                    data=pdf_data,
-                    file_name=f"Questionnaire_Assessment_Report_{datetime.now().strftime('%Y%m%d')}.pdf",
-                    mime="application/pdf",
-                    help="Download the AI-generated analysis as a PDF document",
-                    use_container_width=True,
-                    key="download_pdf_button",
-                    disabled=not st.session_state.get('cached_ai_report')
-                )
-            else:
-                st.warning("PDF report is not available yet. Please try regenerating the report.")
+            # Downloading reruns only the PDF fragment
+            _render_pdf_download()
             # Add a small vertical space between buttons
             st.markdown("<div style='height: 0.5em'></div>", unsafe_allow_html=True)
             # Regenerate button directly below download button
-            if st.button("🔄 Regenerate", help="Generate a new AI analysis", use_container_width=True, key="regenerate_button"):
-                st.session_state.ai_report_generated = False
-                st.rerun()
+            # The click reruns this fragment, which then regenerates the report
+            st.button("🔄 Regenerate", help="Generate a new AI analysis", use_container_width=True, key="regenerate_button",
+                      on_click=_request_ai_report_regeneration)
         # Remove the right_col and any extra alignment divs for these buttons
 
-    def get_image_base64(image_path):
-        with open(image_path, "rb") as img_file:
-            return base64.b64encode(img_file.read()).decode()
+@st.cache_data(show_spinner=False, max_entries=64)
+def _gauge_figure(overall_score: float):
+    """Build the overall compliance gauge"""
+    # Plotly is only needed for the report charts; import it lazily to keep startup light
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=overall_score,
+        number={'suffix': '%', 'valueformat': '.0f'},
+        domain={'x': [0.1, 0.9], 'y': [0, 0.9]},
+        gauge={
+            'axis': {'range': [0, 100], 'tickvals': [0, 25, 50, 75, 100], 'ticktext': ['0%', '25%', '50%', '75%', '100%']},
+            'bar': {'color': "#1f77b4"},
+            'steps': [
+                {'range': [0, 50], 'color': "#ff4b4b"},
+                {'range': [50, 75], 'color': "#ffa64b"},
+                {'range': [75, 100], 'color': "#4bff4b"}
+            ]
+        },
+        title={'text': "Overall Compliance Score"}
+    ))
+    fig.update_layout(height=300, margin=dict(t=40, b=20, l=20, r=20))
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _section_bar_figure(records: Tuple[Tuple[str, float, float], ...]):
+    """Build the section score bar chart from (section, score %, weight %) records"""
+    import plotly.express as px
+    
+    df = pd.DataFrame(records, columns=["Section", "Score", "Weight"])
+    # Create horizontal bar chart with improved color scheme and hover template
+    fig = px.bar(
+        df, 
+        x="Score", 
+        y="Section", 
+        orientation='h',
+        color="Score",
+        color_continuous_scale=[[0, "#FF4B4B"], [0.5, "#FF4B4B"], [0.5, "#FFA500"], [0.75, "#FFA500"], [0.75, "#00CC96"], [1, "#00CC96"]],
+        range_color=[0, 100],
+        labels={"Score": "Compliance Score (%)"}
+    )
+    fig.update_layout(
+        height=400,
+        margin=dict(l=10, r=10, t=10, b=10),
+        yaxis=dict(automargin=True)
+    )
+    # Add custom hover template to show weight
+    fig.update_traces(
+        hovertemplate="<b>%{y}</b><br>Score: %{x:.1f}%<br>Weight: %{customdata:.1f}%<extra></extra>",
+        customdata=df["Weight"]
+    )
+    return fig
+
+def _needs_recalc(results: Dict[str, Any], expected_regulation: str) -> Optional[Tuple[str, str]]:
+    """Return the (regulation, industry) to rescore with if results came from the wrong questionnaire"""
+    section_names = results.get("section_scores", {})
+    # e.g. PDPPL sections in results when NPC is expected, or the reverse
+    if expected_regulation == "NPC" and any("PDPPL" in name or "Principles of Data Privacy" in name for name in section_names):
+        logger.warning(f"[MISMATCH] Expected NPC sections but found PDPPL sections in results")
+    elif expected_regulation == "PDPPL" and any("Data Management Strategy" in name for name in section_names):
+        logger.warning(f"[MISMATCH] Expected PDPPL sections but found NPC sections in results")
+    else:
+        return None
+    
+    # Same mapping the assessment was scored with, so Qatar/General rescores against NPC
+    return resolve_regulation_and_industry(
+        st.session_state.selected_country,
+        st.session_state.selected_industry,
+        st.session_state.selected_regulation
+    )
 
-    # Get all image data first
-    img1_base64 = get_image_base64(os.path.join(config.BASE_DIR, "Assets", "data-integration-tools-mq.jpg"))
-    img2_base64 = get_image_base64(os.path.join(config.BASE_DIR, "Assets", "ipaas-mq.jpg"))
-    img3_base64 = get_image_base64(os.path.join(config.BASE_DIR, "Assets", "data-governance-mq.jpg"))
-    img4_base64 = get_image_base64(os.path.join(config.BASE_DIR, "Assets", "data-quality-mq.png"))
-    # Add Gartner Magic Quadrant section with hover effect
-    st.markdown("""
-        <style>
-        .magic-quadrant-section {
-            background: #1E1E1E;
-            padding: 20px;
-                        border-radius: 10px;
-            margin: 40px 0;
-                    }
-        .magic-quadrant-header {
-                        color: white;
-            text-align: center;
-            font-size: 24px;
-            font-weight: bold;
-            margin-bottom: 20px;
-        }
-        .magic-quadrant-grid {
-            display: flex;
-            justify-content: space-between;
-            gap: 20px;
-                        padding: 10px;
-            flex-wrap: wrap;
-        }
-        .quadrant-item {
-            flex: 1;
-            min-width: 200px;
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-        }
-        .magic-quadrant-title {
-            color: white;
-            text-align: center;
-            margin-bottom: 10px;
-            font-size: 14px;
-            font-weight: 500;
-            height: 40px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            text-align: center;
-        }
-        .new-badge {
-            background: #8A2BE2;
-            color: white;
-            padding: 2px 8px;
-            border-radius: 15px;
-            font-size: 10px;
-            font-weight: bold;
-            margin-left: 6px;
-        }
-        /* Image container styles */
-        .image-container {
-            position: relative;
-            width: 220px;
-            height: 220px;
-            transition: transform 0.3s ease;
-            cursor: pointer;
-        }
-        .image-container img {
-            width: 100%;
-            height: 100%;
-            object-fit: contain;
-            transition: all 0.3s ease;
-            background: white;
-            border-radius: 8px;
-        }
-        .image-container:hover {
-            position: relative;
-            z-index: 1000;
-        }
-        .image-container:hover img {
-            transform: scale(2.5);
-            box-shadow: 0 0 30px rgba(0,0,0,0.7);
-        }
-        /* Add styles for the link */
-        .quadrant-link {
-            text-decoration: none;
-                        display: block;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+# Regulation-specific penalties header, table data and compliance timeline for
+# the report. OAIC assessments share the Australian Privacy Act content.
+_PENALTIES_HEADERS = {
+    'DPDP': """
+            <div class="penalties-container" data-regulation="DPDP">
+                <h4 class="penalties-header">Potential Penalties Under DPDP</h4>
+                <p class="penalties-text">
+                    The Digital Personal Data Protection Act, 2023 prescribes significant penalties for non-compliance:
+                </p>
+            </div>
+        """,
+    'PDPPL': """
+            <div class="penalties-container" data-regulation="PDPPL">
+                <h4 class="penalties-header">Potential Penalties Under Qatar PDPL</h4>
+                <p class="penalties-text">
+                    Qatar Personal Data Protection Law prescribes the following penalties:
+                </p>
+            </div>
+        """,
+    'NPC': """
+            <div class="penalties-container" data-regulation="NPC">
+                <h4 class="penalties-header">Compliance Requirements Under Qatar NDP</h4>
+                <p class="penalties-text">
+                    Qatar National Data Policy requires adherence to the following compliance standards:
+                </p>
+            </div>
+        """,
+    'AU_PRIVACY_ACT': """
+            <div class="penalties-container" data-regulation="AU_PRIVACY_ACT">
+                <h4 class="penalties-header">Compliance Requirements Under AU_PRIVACY_ACT</h4>
+                <p class="penalties-text">
+                    AU_PRIVACY_ACT prescribes the following compliance standards:
+                </p>
+            </div>
+        """,
+    'PDPL': """
+            <div class="penalties-container" data-regulation="PDPL">
+                <h4 class="penalties-header">Potential Penalties Under Saudi PDPL</h4>
+                <p class="penalties-text">
+                    Saudi Personal Data Protection Law prescribes the following penalties:
+                </p>
+            </div>
+        """,
+}
+
+_PENALTIES_DATA = {
+    'DPDP': {
+        "Nature of violation/breach": [
+            "Failure of data fiduciary to take reasonable security safeguards to prevent personal data breach",
+            "Failure to notify Data Protection Board of India and affected data principals in case of personal data breach",
+            "Non-fulfilment of additional obligations in relation to personal data of children",
+            "Non-fulfilment of additional obligations by significant data fiduciaries",
+            "Non-compliance with duties of data principals",
+            "Breach of any term of voluntary undertaking accepted by the Data Protection Board",
+            "Residuary penalty"
+        ],
+        "Penalty": [
+            "May extend to INR 250 crores",
+            "May extend to INR 200 crores",
+            "May extend to INR 200 crores",
+            "May extend to INR 150 crores",
+            "May extend to INR 10,000",
+            "Up to the extent applicable",
+            "May extend to INR 50 crores"
+        ]
+    },
+    'PDPPL': {
+        "Violation Type": [
+            "General violation of core data protection duties",
+            "Serious violations (e.g., breach notification, DPIA, cross-border transfer)",
+            "Legal person (organization) violation",
+            "Maximum penalty for any infringement"
+        ],
+        "Penalty Amount (QAR)": [
+            "Up to 1,000,000",
+            "Up to 5,000,000",
+            "Up to 1,000,000",
+            "Up to 5,000,000"
+        ],
+        "Penalty Amount (USD, approx.)": [
+            "Up to ~$275,000",
+            "Up to ~$1,375,000",
+            "Up to ~$275,000",
+            "Up to ~$1,375,000"
+        ]
+    },
+    # NPC focuses on data policy compliance rather than privacy violations
+    # You may want to update this section with specific NPC compliance requirements
+    'NPC': {
+        "Compliance Area": [
+            "Non-compliance with National Data Policy requirements",
+            "Failure to establish required data governance structures",
+            "Non-adherence to data quality and management standards",
+            "Lack of coordination with NPC for data initiatives"
+        ],
+        "Consequence": [
+            "Regulatory review and corrective action requirements",
+            "Mandatory implementation of governance frameworks",
+            "Required improvement of data management practices",
+            "Mandatory coordination and approval processes"
+        ]
+    },
+    'AU_PRIVACY_ACT': {
+        "Nature of violation/breach": [
+            "Serious or repeated interference with privacy",
+            "Mid-tier civil penalty (interference with privacy)",
+            "Administrative breaches (e.g., not having compliant privacy policy, failing to provide opt-outs)",
+            "Infringement notices (minor breaches)",
+            "Failure to comply with OAIC compliance notice",
+            "Criminal penalty for doxxing (malicious public disclosure of personal information)",
+            "Statutory tort for serious invasion of privacy"
+        ],
+        "Penalty": [
+            "Greater of AUD 50 million, 3× value of benefit obtained, or 30% of adjusted turnover",
+            "AUD 3,300,000 (10,000 penalty units) for corporations; AUD 660,000 (2,000 penalty units) for individuals",
+            "AUD 330,000 (1,000 penalty units) for corporations; AUD 66,000 (200 penalty units) for individuals",
+            "AUD 19,800–66,000 for corporations; AUD 3,960–66,000 for individuals",
+            "AUD 330,000 (1,000 penalty units) for corporations; AUD 66,000 (200 penalty units) for individuals",
+            "Up to 6 years' imprisonment (7 years for aggravated cases)",
+            "Damages up to AUD 478,550 (non-economic) plus economic loss"
+        ]
+    },
+    'PDPL': {
+        "Nature of violation/breach": [
+            "Disclosure or publication of Sensitive Data with intent to harm or for personal benefit",
+            "General violations of PDPL provisions",
+            "Failure to implement required security measures",
+            "Failure to maintain records of processing activities",
+            "Failure to respond to data subject rights requests",
+            "Unauthorized cross-border data transfers",
+            "Failure to notify data breaches"
+        ],
+        "Penalty": [
+            "Imprisonment up to 2 years or fine up to 3 million SAR, or both",
+            "Warning or fine up to 5 million SAR (may be doubled for repeat violations)",
+            "Warning or fine up to 5 million SAR",
+            "Warning or fine up to 5 million SAR",
+            "Warning or fine up to 5 million SAR",
+            "Warning or fine up to 5 million SAR",
+            "Warning or fine up to 5 million SAR"
+        ],
+        "Penalty Amount (USD, approx.)": [
+            "Up to ~$800,000",
+            "Up to ~$1.33 million",
+            "Up to ~$1.33 million",
+            "Up to ~$1.33 million",
+            "Up to ~$1.33 million",
+            "Up to ~$1.33 million",
+            "Up to ~$1.33 million"
+        ]
+    },
+}
 
-    # Render the Magic Quadrant section
-    st.markdown(f"""
-        <div class="magic-quadrant-section">
-            <div class="magic-quadrant-header">
-                <span style="color: #FFA500;">Informatica Leadership in Gartner Magic Quadrant</span>
+_COUNTDOWN_HTML = {
+    'DPDP': """
+            <div class="countdown-container">
+                <h3 class="countdown-header">Time Left to Achieve DPDP Compliance</h3>
+                <p class="countdown-text">
+                    Your organization must achieve compliance before the tentative deadline: December 31, 2025
+                </p>
             </div>
-            <div class="magic-quadrant-grid">
-                <div class="quadrant-item">
-                    <div class="magic-quadrant-title">Data Integration Tools</div>
-                    <a href="https://www.informatica.com/lp/gartner-leadership.html" target="_blank" class="quadrant-link">
-                        <div class="image-container">
-                            <img src="data:image/jpeg;base64,{img1_base64}" alt="Data Integration Tools">
-                        </div>
-                    </a>
-                </div>
-                <div class="quadrant-item">
-                    <div class="magic-quadrant-title">Integration Platform as a Service (iPaaS)</div>
-                    <a href="https://www.informatica.com/lp/gartner-leadership.html" target="_blank" class="quadrant-link">
-                        <div class="image-container">
-                            <img src="data:image/jpeg;base64,{img2_base64}" alt="iPaaS">
-                        </div>
-                    </a>
-                </div>
-                <div class="quadrant-item">
-                    <div class="magic-quadrant-title">Data and Analytics Governance Platforms<span class="new-badge">NEW</span></div>
-                    <a href="https://www.informatica.com/lp/gartner-leadership.html" target="_blank" class="quadrant-link">
-                        <div class="image-container">
-                            <img src="data:image/jpeg;base64,{img3_base64}" alt="Data Governance">
-                        </div>
-                    </a>
-                </div>
-                <div class="quadrant-item">
-                    <div class="magic-quadrant-title">Augmented Data Quality Solutions<span class="new-badge">NEW</span></div>
-                    <a href="https://www.informatica.com/lp/gartner-leadership.html" target="_blank" class="quadrant-link">
-                        <div class="image-container">
-                            <img src="data:image/jpeg;base64,{img4_base64}" alt="Data Quality">
-                        </div>
-                    </a>
-                </div>
+        """,
+    'NPC': """
+            <div class="countdown-container">
+                <h3 class="countdown-header">Qatar National Data Policy Compliance</h3>
+                <p class="countdown-text">
+                    Ongoing compliance with Qatar's National Data Policy is required for all government and semi-government entities
+                </p>
             </div>
-        </div>
+        """,
+    'AU_PRIVACY_ACT': """
+            <div class="countdown-container">
+                <h3 class="countdown-header">AU_PRIVACY_ACT Compliance</h3>
+                <p class="countdown-text">
+                    Ongoing compliance with AU_PRIVACY_ACT is required for all government and semi-government entities
+                </p>
+            </div>
+        """,
+    'PDPL': """
+            <div class="countdown-container">
+                <h3 class="countdown-header">Saudi PDPL Compliance</h3>
+                <p class="countdown-text">
+                    Saudi PDPL came into force on September 14, 2023. Organizations must ensure ongoing compliance with all provisions.
+                </p>
+            </div>
+        """,
+}
+
+_PENALTIES_HEADERS['OAIC'] = _PENALTIES_HEADERS['AU_PRIVACY_ACT']
+_PENALTIES_DATA['OAIC'] = _PENALTIES_DATA['AU_PRIVACY_ACT']
+_COUNTDOWN_HTML['OAIC'] = _COUNTDOWN_HTML['AU_PRIVACY_ACT']
+
+def _penalties_table(penalties_data: Dict[str, List[str]]) -> str:
+    """Render column -> cells penalties data as a penalties-table.
+
+    Emits the same markup DataFrame.to_html(index=False) did, without
+    building a DataFrame for a handful of static rows.
+    """
+    head = "".join(f"<th>{html.escape(column, quote=False)}</th>" for column in penalties_data)
+    body = "".join(
+        "<tr>" + "".join(f"<td>{html.escape(cell, quote=False)}</td>" for cell in row) + "</tr>"
+        for row in zip(*penalties_data.values())
+    )
+    return (
+        '<table border="1" class="dataframe penalties-table">'
+        f'<thead><tr style="text-align: right;">{head}</tr></thead>'
+        f'<tbody>{body}</tbody></table>'
+    )
+
+@functools.lru_cache(maxsize=16)
+def _penalties_table_html(regulation: str) -> str:
+    """HTML penalties table for a regulation, or an empty string if there is none"""
+    penalties_data = _PENALTIES_DATA.get(regulation)
+    if not penalties_data:
+        return ""
+    return _penalties_table(penalties_data)
+
+def render_report():
+    """Render the compliance report"""
+    if not st.session_state.assessment_complete:
+        st.info("Complete the assessment to view your compliance report")
+        if st.button("Go to Assessment", type="primary"):
+            st.session_state.current_page = 'assessment'
+            st.rerun()
+        return
+
+    results = st.session_state.results
+    # Recalculations below go through the cached scorer, keyed on the responses
+    responses_key = tuple(sorted(st.session_state.responses.items()))
+    
+    # Load the questionnaire once; every check and table below reuses it
+    regulation_for_loader, industry_for_loader = get_regulation_and_industry_for_loader()
+    questionnaire = get_questionnaire(regulation_for_loader, industry_for_loader)
+    
+    # CRITICAL FIX: Force fresh calculation if the results came from the wrong questionnaire
+    recalc = _needs_recalc(results, regulation_for_loader) if results else None
+    if recalc:
+        regulation_for_calc, industry_for_calc = recalc
+        logger.info(f"[AUTO-FIX] Recalculating with {regulation_for_calc}/{industry_for_calc}")
+        st.session_state.results = _score(regulation_for_calc, industry_for_calc, responses_key)
+        results = st.session_state.results
+        st.info(f"🔄 **Refreshed stale results** - Now using the correct {regulation_for_calc} questionnaire data.")
+    
+    st.subheader(f"{format_regulation_name(st.session_state.selected_regulation)}  Compliance Report")
+    # st.subheader(f"For: {st.session_state.organization_name}")
+    # st.write(f"Assessment Date: {st.session_state.assessment_date}")
+    
+    # Section weight (%) by name, for the bar chart and section table
+    weight_by_section = {s['name']: round(s['weight'] * 100, 1) for s in questionnaire.get("sections", [])}
+    
+    # Summary section
+    st.markdown(f"""
+    ### Overall Compliance: {results['overall_score']:.1f}% and <span style='color: {get_compliance_level_color(results['compliance_level'])}; font-weight: bold;'>{results['compliance_level']}</span>
+    This report provides a detailed assessment of your organization's compliance with the {format_regulation_name(st.session_state.selected_regulation)}
+    across key areas. Review the section scores and recommendations below to identify areas
+    for improvement.
     """, unsafe_allow_html=True)
+    
+    # Section scores as floats; sections with no applicable questions are NaN
+    section_scores = pd.Series(results["section_scores"], dtype=float)
+    
+    # Create two columns for charts with 1:2 ratio
+    col1, col2 = st.columns([1, 2])
+    
+    # Add gauge chart in the first column
+    with col1:
+        st.plotly_chart(_gauge_figure(results['overall_score']), use_container_width=True)
+    
+    # Add horizontal bar chart in the second column
+    with col2:
+        # Get all sections from questionnaire
+        all_sections = [section["name"] for section in questionnaire["sections"]]
+        
+        # Create section scores dataframe with percentage scores and weights, including all sections
+        df = pd.DataFrame({"Section": all_sections})
+        df["Score"] = df["Section"].map(section_scores).fillna(0).mul(100).round().clip(lower=0.1)
+        df["Weight"] = df["Section"].map(weight_by_section).fillna(0)
+        df = df.sort_values(by="Score", ascending=True)
+        
+        # Records are hashable, so the figure is only rebuilt when the scores change
+        st.plotly_chart(_section_bar_figure(tuple(df.itertuples(index=False, name=None))), use_container_width=True)
+    
+    # Add verification for perfect scores, skipping sections with no applicable questions
+    if results['overall_score'] < 100 and (section_scores.dropna() >= 1.0).all():
+        st.warning("""
+        **Note:** All your section scores show full compliance, but the overall score may be slightly below 100% 
+        due to weighting factors or rounding. Your organization has effectively achieved full compliance.
+        """)
+
+    none_score_sections = section_scores.index[section_scores.isna()].tolist()
+    
+    # Display sections with None scores
+    if none_score_sections:
+        st.info("The following sections have no score because all questions were marked as 'Not applicable' or had no responses:")
+        for section in none_score_sections:
+            st.write(f"• {section}")
+    
+    # Add Recommended Actions section here
+    st.subheader("Recommended Actions")
+
+    def clean_recommendation_text(text: str) -> str:
+        """Remove all Informatica Solution prefixes and HTML spans from recommendation text."""
+        # Remove HTML spans, then plain text occurrences, then surrounding whitespace
+        return _PREFIX_RE.sub("", _SPAN_RE.sub("", text)).strip()
 
+    if results.get("improvement_priorities"):
+        for i, area in enumerate(results["improvement_priorities"][:3]):
+            with st.expander(f"Priority {i+1}: {area}"):
+                if area in results["recommendations"] and results["recommendations"][area]:
+                    for rec in results["recommendations"][area]:
+                        st.write(f"• {clean_recommendation_text(rec)}")
+                else:
+                    st.write("No specific recommendations available for this area.")
+    else:
+        st.info("No specific priority actions identified based on your assessment results.")
+    
+    # Add INFA and CLAIRE Diagrams
+    _render_framework_diagrams()
+    # --- End of commented out section ---
 
-        # Update headers based on regulation
-    regulation_for_loader, _ = get_regulation_and_industry_for_loader()
-    logger.info(f"[render_assessment] Mapped regulation_for_loader: {regulation_for_loader}")
+    # Add Not Applicable answers section
+    st.markdown('<div style="margin-bottom: 1rem;"></div>', unsafe_allow_html=True)
+    st.subheader("Answers marked as \"Not Applicable\"")
+    
+    # Find all "Not applicable" responses, in questionnaire order
+    na_keys = {
+        key for key, response in st.session_state.responses.items()
+        if isinstance(response, str) and "not applicable" in response.lower()
+    }
+    question_index = _question_index(regulation_for_loader, industry_for_loader)
+    na_responses = sorted(question_index[key] for key in na_keys if key in question_index)
     
-    # Inject penalties section CSS before rendering penalties block
-    st.markdown(get_penalties_section_css(), unsafe_allow_html=True)
-    if regulation_for_loader == 'DPDP':
-        st.markdown("""
-            <div class="penalties-container" data-regulation="DPDP">
-                <h4 class="penalties-header">Potential Penalties Under DPDP</h4>
-                <p class="penalties-text">
-                    The Digital Personal Data Protection Act, 2023 prescribes significant penalties for non-compliance:
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
-    elif regulation_for_loader == 'PDPPL':
-        st.markdown("""
-            <div class="penalties-container" data-regulation="PDPPL">
-                <h4 class="penalties-header">Potential Penalties Under Qatar PDPL</h4>
-                <p class="penalties-text">
-                    Qatar Personal Data Protection Law prescribes the following penalties:
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
-    elif regulation_for_loader == 'NPC':
-        st.markdown("""
-            <div class="penalties-container" data-regulation="NPC">
-                <h4 class="penalties-header">Compliance Requirements Under Qatar NDP</h4>
-                <p class="penalties-text">
-                    Qatar National Data Policy requires adherence to the following compliance standards:
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
-    elif regulation_for_loader == 'AU_PRIVACY_ACT' or regulation_for_loader == 'OAIC':
-        st.markdown("""
-            <div class="penalties-container" data-regulation="AU_PRIVACY_ACT">
-                <h4 class="penalties-header">Compliance Requirements Under AU_PRIVACY_ACT</h4>
-                <p class="penalties-text">
-                    AU_PRIVACY_ACT prescribes the following compliance standards:
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
-    elif regulation_for_loader == 'PDPL':
-        st.markdown("""
-            <div class="penalties-container" data-regulation="PDPL">
-                <h4 class="penalties-header">Potential Penalties Under Saudi PDPL</h4>
-                <p class="penalties-text">
-                    Saudi Personal Data Protection Law prescribes the following penalties:
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
-    # Create regulation-specific penalties data
-    penalties_data = {}  # Default initialization
-    regulation_for_loader, _ = get_regulation_and_industry_for_loader()
-    if regulation_for_loader == 'DPDP':
-        penalties_data = {
-            "Nature of violation/breach": [
-                "Failure of data fiduciary to take reasonable security safeguards to prevent personal data breach",
-                "Failure to notify Data Protection Board of India and affected data principals in case of personal data breach",
-                "Non-fulfilment of additional obligations in relation to personal data of children",
-                "Non-fulfilment of additional obligations by significant data fiduciaries",
-                "Non-compliance with duties of data principals",
-                "Breach of any term of voluntary undertaking accepted by the Data Protection Board",
-                "Residuary penalty"
-            ],
-            "Penalty": [
-                "May extend to INR 250 crores",
-                "May extend to INR 200 crores",
-                "May extend to INR 200 crores",
-                "May extend to INR 150 crores",
-                "May extend to INR 10,000",
-                "Up to the extent applicable",
-                "May extend to INR 50 crores"
-            ]
-        }
-    elif regulation_for_loader == 'PDPPL':
-        penalties_data = {
-            "Violation Type": [
-                "General violation of core data protection duties",
-                "Serious violations (e.g., breach notification, DPIA, cross-border transfer)",
-                "Legal person (organization) violation",
-                "Maximum penalty for any infringement"
-            ],
-            "Penalty Amount (QAR)": [
-                "Up to 1,000,000",
-                "Up to 5,000,000",
-                "Up to 1,000,000",
-                "Up to 5,000,000"
-            ],
-            "Penalty Amount (USD, approx.)": [
-                "Up to ~$275,000",
-                "Up to ~$1,375,000",
-                "Up to ~$275,000",
-                "Up to ~$1,375,000"
-            ]
-        }
-    elif regulation_for_loader == 'NPC':
-        # NPC focuses on data policy compliance rather than privacy violations
-        # You may want to update this section with specific NPC compliance requirements
-        penalties_data = {
-            "Compliance Area": [
-                "Non-compliance with National Data Policy requirements",
-                "Failure to establish required data governance structures",
-                "Non-adherence to data quality and management standards",
-                "Lack of coordination with NPC for data initiatives"
-            ],
-            "Consequence": [
-                "Regulatory review and corrective action requirements",
-                "Mandatory implementation of governance frameworks",
-                "Required improvement of data management practices",
-                "Mandatory coordination and approval processes"
-            ]
-        }
-    elif regulation_for_loader == 'AU_PRIVACY_ACT' or regulation_for_loader == 'OAIC':
-        penalties_data = {
-            "Nature of violation/breach": [
-                "Serious or repeated interference with privacy",
-                "Mid-tier civil penalty (interference with privacy)",
-                "Administrative breaches (e.g., not having compliant privacy policy, failing to provide opt-outs)",
-                "Infringement notices (minor breaches)",
-                "Failure to comply with OAIC compliance notice",
-                "Criminal penalty for doxxing (malicious public disclosure of personal information)",
-                "Statutory tort for serious invasion of privacy"
-            ],
-            "Penalty": [
-                "Greater of AUD 50 million, 3× value of benefit obtained, or 30% of adjusted turnover",
-                "AUD 3,300,000 (10,000 penalty units) for corporations; AUD 660,000 (2,000 penalty units) for individuals",
-                "AUD 330,000 (1,000 penalty units) for corporations; AUD 66,000 (200 penalty units) for individuals",
-                "AUD 19,800–66,000 for corporations; AUD 3,960–66,000 for individuals",
-                "AUD 330,000 (1,000 penalty units) for corporations; AUD 66,000 (200 penalty units) for individuals",
-                "Up to 6 years' imprisonment (7 years for aggravated cases)",
-                "Damages up to AUD 478,550 (non-economic) plus economic loss"
-            ]
-        }
-    elif regulation_for_loader == 'PDPL':
-        penalties_data = {
-            "Nature of violation/breach": [
-                "Disclosure or publication of Sensitive Data with intent to harm or for personal benefit",
-                "General violations of PDPL provisions",
-                "Failure to implement required security measures",
-                "Failure to maintain records of processing activities",
-                "Failure to respond to data subject rights requests",
-                "Unauthorized cross-border data transfers",
-                "Failure to notify data breaches"
-            ],
-            "Penalty": [
-                "Imprisonment up to 2 years or fine up to 3 million SAR, or both",
-                "Warning or fine up to 5 million SAR (may be doubled for repeat violations)",
-                "Warning or fine up to 5 million SAR",
-                "Warning or fine up to 5 million SAR",
-                "Warning or fine up to 5 million SAR",
-                "Warning or fine up to 5 million SAR",
-                "Warning or fine up to 5 million SAR"
-            ],
-            "Penalty Amount (USD, approx.)": [
-                "Up to ~$800,000",
-                "Up to ~$1.33 million",
-                "Up to ~$1.33 million",
-                "Up to ~$1.33 million",
-                "Up to ~$1.33 million",
-                "Up to ~$1.33 million",
-                "Up to ~$1.33 million"
-            ]
-        }
+    if na_responses:
+        with st.expander("View Not Applicable Responses", expanded=False):
+            for _, section_name, question_number, clean_question in na_responses:
+                st.markdown(f"""
+                **{section_name} - {question_number}**  
+                {clean_question}
+                """)
+                st.markdown("---")
+    else:
+        with st.expander("View Not Applicable Responses", expanded=False):
+            st.info("No questions were marked as Not Applicable.")
     
-    if penalties_data:
-        penalties_df = pd.DataFrame(penalties_data)
-        st.markdown(get_penalties_table_css(), unsafe_allow_html=True)
-        st.markdown(penalties_df.to_html(classes='penalties-table', escape=False, index=False), unsafe_allow_html=True)
+    # Reserve the AI analysis slot; it is filled last so the rest of the
+    # report is on screen while the analysis is generated
+    ai_report_container = st.container()
+
+    # Add Gartner Magic Quadrant section with hover effect (styles ship with the report page CSS)
+    st.markdown(_MAGIC_QUADRANT_HTML, unsafe_allow_html=True)
+
+    # Update headers based on regulation (resolved once at the top of render_report)
+    penalties_header = _PENALTIES_HEADERS.get(regulation_for_loader)
+    if penalties_header:
+        st.markdown(penalties_header, unsafe_allow_html=True)
+
+    penalties_html = _penalties_table_html(regulation_for_loader)
+    if penalties_html:
+        st.markdown(penalties_html, unsafe_allow_html=True)
     else:
         st.info("No penalties data available for the selected regulation.")
     
-    # --- Temporarily comment out Countdown section for debugging ---
     # Add the countdown timer with reloader
-    st.markdown(get_countdown_section_css(), unsafe_allow_html=True)
-    if regulation_for_loader == 'DPDP':
-        st.markdown("""
-            <div class="countdown-container">
-                <h3 class="countdown-header">Time Left to Achieve DPDP Compliance</h3>
-                <p class="countdown-text">
-                    Your organization must achieve compliance before the tentative deadline: December 31, 2025
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
-    elif regulation_for_loader == 'NPC':
-        st.markdown("""
-            <div class="countdown-container">
-                <h3 class="countdown-header">Qatar National Data Policy Compliance</h3>
-                <p class="countdown-text">
-                    Ongoing compliance with Qatar's National Data Policy is required for all government and semi-government entities
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
-    elif regulation_for_loader == 'AU_PRIVACY_ACT' or regulation_for_loader == 'OAIC':
-        st.markdown("""
-            <div class="countdown-container">
-                <h3 class="countdown-header">AU_PRIVACY_ACT Compliance</h3>
-                <p class="countdown-text">
-                    Ongoing compliance with AU_PRIVACY_ACT is required for all government and semi-government entities
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
-    elif regulation_for_loader == 'PDPL':
-        st.markdown("""
-            <div class="countdown-container">
-                <h3 class="countdown-header">Saudi PDPL Compliance</h3>
-                <p class="countdown-text">
-                    Saudi PDPL came into force on September 14, 2023. Organizations must ensure ongoing compliance with all provisions.
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
-    # --- End of commented out section ---
-    
-    # --- End of commented out section ---
+    countdown_html = _COUNTDOWN_HTML.get(regulation_for_loader)
+    if countdown_html:
+        st.markdown(countdown_html, unsafe_allow_html=True)
 
     # --- Temporarily comment out final columns/buttons for debugging ---
     col1, col2, col3 = st.columns(3)
     
     with col2:
         # Add Quick AI Data Discovery button
-        st.markdown(get_discovery_button_css(), unsafe_allow_html=True)
-        
         if st.button("🔍 Ready for a Quick AI Data Discovery ?", use_container_width=True):
             st.session_state.current_page = 'discovery'
             st.rerun()
@@ -1810,6 +1340,14 @@ def render_report():
                 st.session_state.selected_industry
             )
             st.markdown(excel_link, unsafe_allow_html=True)
+    
+    # AI analysis, PDF download and regenerate rerun on their own
+    with ai_report_container:
+        _render_ai_report_fragment()
+
+# Section score cut-offs for high / medium / low priority context, and their markers
+_PRIORITY_THRESHOLDS = (0.6, 0.75)
+_PRIORITY_EMOJI = ("🔴", "🟠", "🟢")
 
 def render_recommendations():
     """Render the detailed recommendations page"""
@@ -1826,7 +1364,6 @@ def render_recommendations():
     st.subheader(f"For: {st.session_state.organization_name}")
     
     # Use the consolidated recommendation organization function
-    from recommendation_engine import organize_recommendations_by_priority
     recommendations_by_priority = organize_recommendations_by_priority(results)
     
     # Display recommendations by priority
@@ -1860,8 +1397,7 @@ def render_recommendations():
     # Add detailed context for recommendations if available
     regulation_for_loader, industry_for_loader = get_regulation_and_industry_for_loader()
     questionnaire = get_questionnaire(regulation_for_loader, industry_for_loader)
-    # Import and use the enhanced recommendations functionality
-    from recommendation_engine import get_recommendation_context
+    # Use the enhanced recommendations functionality
     recommendation_context = get_recommendation_context(questionnaire, st.session_state.responses)
     
     if recommendation_context:
@@ -1874,8 +1410,7 @@ def render_recommendations():
             if score is None:
                 continue
                 
-            priority = "high" if score < 0.6 else ("medium" if score < 0.75 else "low")
-            priority_emoji = "🔴" if priority == "high" else ("🟠" if priority == "medium" else "🟢")
+            priority_emoji = _PRIORITY_EMOJI[bisect.bisect_right(_PRIORITY_THRESHOLDS, score)]
             
             with st.expander(f"{priority_emoji} {section} - {len(contexts)} recommendations"):
                 for context in contexts:  # Fixed missing 'in contexts'
@@ -1887,75 +1422,121 @@ def render_recommendations():
     
     # The AI Analysis section previously here has been removed.
 
-def convert_markdown_to_pdf(markdown_content: str, organization_name: str = "Report") -> bytes | None:
-    """Convert markdown content to PDF format using the markdown-pdf library."""
-    output_file = None
-    try:
-        # Initialize PDF object with TOC level=2 (headings ##)
-        pdf = MarkdownPdf(toc_level=2)
+# Markdown headings that land in the PDF outline (toc_level=2)
+_PDF_TOC_HEADING_RE = re.compile(r"^#{1,2}\s", re.MULTILINE)
 
-        # Get the logo path and verify it exists
-        logo_path = os.path.join(config.BASE_DIR, "Assets", "@DataINFA.png")
-        logger.info(f"Looking for logo at: {logo_path}")
-        
-        # Create a header similar to privacy_policy_analyzer.py (no logo)
-        header_content = f"""
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def _markdown_pdf_bytes(markdown_content: str, organization_name: str, report_date: str) -> bytes:
+    """Render markdown to PDF bytes; raises on failure so errors are never cached.
+
+    report_date is stamped in the header, and keying on it keeps a cached PDF
+    from carrying a stale date.
+    """
+    from markdown_pdf import MarkdownPdf, Section
+
+    # Initialize PDF object with TOC level=2 (headings ##). The header's <h1> is
+    # always one outline entry, so only build the outline if the report adds more
+    with_toc = _PDF_TOC_HEADING_RE.search(markdown_content) is not None
+    pdf = MarkdownPdf(toc_level=2 if with_toc else 0)
+
+    # Create a header similar to privacy_policy_analyzer.py (no logo)
+    header_content = f"""
 <div style="text-align: center; margin-bottom: 30px;">
     <h1 style="color: #333; margin: 0;">{organization_name}</h1>
     <p style="color: #666; margin: 5px 0;">Compliance Assessment Report</p>
-    <p style="color: #666; margin: 5px 0;">Generated on: {datetime.now().strftime('%B %d, %Y')} by DataINFA</p>
+    <p style="color: #666; margin: 5px 0;">Generated on: {report_date} by DataINFA</p>
 </div>
 
 ---
 """
-        # Combine header with the report content
-        full_content = f"{header_content}{markdown_content}"
-        
-        # Add the entire markdown content as one section
-        pdf.add_section(Section(full_content, toc=True))
-
-        # Set PDF metadata
-        pdf.meta["title"] = f"{organization_name} - Compliance Assessment Report"
-        pdf.meta["author"] = config.APP_TITLE
-        pdf.meta["subject"] = "DPDP Compliance Assessment Report"
-        pdf.meta["keywords"] = "compliance, DPDP, assessment, analysis"
-        pdf.meta["creator"] = "DataInfa Assessment Tool"
-
-        # Create a temporary file path for the PDF output
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as temp_pdf_file:
-            output_file = temp_pdf_file.name
-            logger.info(f"Temporary PDF output path: {output_file}")
-
-        # Save the PDF to the temporary file
-        logger.info(f"Attempting conversion and save to: {output_file}")
-        pdf.save(output_file)
-        logger.info(f"markdown-pdf save operation completed for {output_file}")
-
-        # Check if the output file was created and read it
-        if os.path.exists(output_file):
-            logger.info(f"Output PDF file exists: {output_file}")
-            with open(output_file, 'rb') as f:
-                pdf_content = f.read()
-            logger.info(f"Successfully read {len(pdf_content)} bytes from {output_file}")
-            return pdf_content
-        else:
-            logger.error(f"Conversion failed. Output PDF file not found: {output_file}")
-            st.error("Error: Failed to generate PDF file.")
-            return None
+    # Combine header with the report content
+    full_content = f"{header_content}{markdown_content}"
+
+    # Add the entire markdown content as one section
+    pdf.add_section(Section(full_content, toc=with_toc))
+
+    # Set PDF metadata
+    pdf.meta["title"] = f"{organization_name} - Compliance Assessment Report"
+    pdf.meta["author"] = config.APP_TITLE
+    pdf.meta["subject"] = "DPDP Compliance Assessment Report"
+    pdf.meta["keywords"] = "compliance, DPDP, assessment, analysis"
+    pdf.meta["creator"] = "DataInfa Assessment Tool"
+
+    # Render straight into memory; PyMuPDF accepts a file-like target
+    buffer = io.BytesIO()
+    pdf.save(buffer)
+    pdf_content = buffer.getvalue()
+    if not pdf_content:
+        raise ValueError("markdown-pdf produced an empty document")
+    logger.info("Generated %d byte PDF for %s", len(pdf_content), organization_name)
+    return pdf_content
 
+def convert_markdown_to_pdf(markdown_content: str, organization_name: str = "Report") -> bytes | None:
+    """Convert markdown content to PDF format using the markdown-pdf library."""
+    # Cached process-wide, so every session downloading the same report shares one render
+    try:
+        return _markdown_pdf_bytes(markdown_content, organization_name, datetime.now().strftime('%B %d, %Y'))
+    except ValueError as e:
+        logger.error(f"Conversion failed. {e}")
+        st.error("Error: Failed to generate PDF file.")
+        return None
     except Exception as e:
-            # Catching a general exception as specific errors from markdown-pdf might vary
-            logger.error(f"Error during markdown-pdf generation: {e}", exc_info=True)
-            st.error(f"An error occurred during PDF generation: {e}")
-            return None
-    finally:
-        # Clean up temporary PDF file
-        if output_file and os.path.exists(output_file):
-            try:
-                os.unlink(output_file)
-                logger.info(f"Cleaned up temporary PDF file: {output_file}")
-            except Exception as e:
-                logger.error(f"Error deleting temporary PDF file {output_file}: {e}")
+        # Catching a general exception as specific errors from markdown-pdf might vary
+        logger.error(f"Error during markdown-pdf generation: {e}", exc_info=True)
+        st.error(f"An error occurred during PDF generation: {e}")
+        return None
+
+def _tokens_file_stat() -> Optional[os.stat_result]:
+    """stat() of the tokens CSV (existence, mtime and size in one call), or None"""
+    try:
+        return os.stat(TOKENS_FILE)
+    except FileNotFoundError:
+        return None
+
+@st.cache_data(show_spinner=False, max_entries=2)
+def _read_tokens_csv(path: str, mtime_ns: int, size: int) -> bytes:
+    """Tokens CSV for the admin export, without revoked rows; mtime_ns and size only key the cache"""
+    with open(path, 'rb') as f:
+        # Revoked rows are commented out in place (a leading '#'); leave them out
+        return b"".join(record for _, record in iter_csv_records(f) if not record.startswith(b'#'))
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _load_tokens_df(path: str, mtime_ns: int, size: int) -> pd.DataFrame:
+    """Read the tokens CSV, drop revoked rows and parse its date columns.
+
+    mtime_ns and size only key the cache, so edits to the file are picked up;
+    nanoseconds, because revoking a token rewrites one byte in place.
+    """
+    date_columns = ['created_at', 'expires_at']
+    try:
+        # Parse the dates and type the text columns in the same pass as the read
+        tokens_df = pd.read_csv(
+            path,
+            parse_dates=date_columns,
+            dtype={'token': 'string', 'organization_name': 'string', 'generated_by': 'string'},
+            on_bad_lines='skip'
+        )
+    except ValueError:
+        # A file without the date columns; fall back to a permissive read
+        tokens_df = pd.read_csv(path)
+    logger.info(f"CSV columns detected: {list(tokens_df.columns)}")
+    # Hide rows revoked in place (commented out with a leading '#')
+    if 'token' in tokens_df.columns:
+        tokens_df = tokens_df[~tokens_df['token'].astype(str).str.startswith('#')]
+    
+    # Rename columns if needed for display consistency
+    column_mapping = {}
+    if 'organization_name' in tokens_df.columns:
+        column_mapping['organization_name'] = 'organization'
+    # Apply column renames if any mappings exist
+    if column_mapping:
+        tokens_df = tokens_df.rename(columns=column_mapping)
+    
+    # read_csv leaves a date column as text if any value fails to parse; coerce those to NaT
+    for col in date_columns:
+        if col in tokens_df.columns and not pd.api.types.is_datetime64_any_dtype(tokens_df[col]):
+            tokens_df[col] = pd.to_datetime(tokens_df[col], errors='coerce')
+    return tokens_df
 
 def render_admin_page():
     """Render the admin page"""
@@ -1992,9 +1573,6 @@ def render_admin_page():
         # Expiry date settings with better alignment
         st.markdown("#### Token Expiration")
         
-        # Apply custom CSS for expiry box
-        st.markdown(get_expiry_box_css(), unsafe_allow_html=True)
-        
         # Force single line with container_width and custom height
         container = st.container()
         with container:
@@ -2011,7 +1589,9 @@ def render_admin_page():
                 )
             
             with col2:
-                expiry_date = (datetime.now() + timedelta(days=expiry_days)).strftime("%Y-%m-%d")
+                # One timestamp for the preview and the generated-token card
+                now = datetime.now()
+                expiry_date = (now + timedelta(days=expiry_days)).strftime("%Y-%m-%d")
                 st.markdown(f"""
                 <div class="expiry-box">
                     <span style="font-weight: bold;">Expiry date:</span> {expiry_date}
@@ -2022,66 +1602,15 @@ def render_admin_page():
         if st.button("Generate Token", key="gen_token_btn", type="primary", use_container_width=True):
             if org_name:
                 try:
-                    # Set token expiry in session state for token_storage to use
-                    import token_storage
-                    token_storage.TOKEN_EXPIRY_DAYS = expiry_days
-                    
-                    # Create secure directory if it doesn't exist
-                    if not os.path.exists('secure'):
-                        os.makedirs('secure', exist_ok=True)
-                    
-                    # Generate token with the organization name and generated by info
-                    new_token = generate_token(org_name, generated_by)
+                    # Generate token with the organization name, generated by info and validity
+                    new_token = generate_token(org_name, generated_by, expiry_days=expiry_days)
                     if new_token:
                         st.success(f"Token successfully generated for {org_name}!")
                         
-                        # Get current timestamp and format it
-                        current_time = datetime.now().strftime('%Y-%m-%d %H:%M')
+                        # Format the shared timestamp for the card
+                        current_time = now.strftime('%Y-%m-%d %H:%M')
                         # Display the token in a more prominent way with updated styling
                         st.markdown(f"""
-                        <style>
-                        .token-box {{
-                            padding: 20px;
-                            background: linear-gradient(135deg, #1a2980, #26d0ce);
-                            border: 1px solid #4a90e2;
-                            border-radius: 8px;
-                            margin: 15px 0;
-                            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-                        }}
-                        .token-box h3 {{
-                            color: white;
-                            margin-bottom: 15px;
-                            font-size: 1.4rem;
-                            text-shadow: 1px 1px 2px rgba(0,0,0,0.2);
-                        }}
-                        .token-value {{
-                            font-family: monospace;
-                            font-size: 1.2em;
-                            font-weight: bold;
-                            padding: 15px;
-                            background-color: rgba(255, 255, 255, 0.9);
-                            color: #1a2980;
-                            border-radius: 5px;
-                            word-wrap: break-word;
-                            margin-bottom: 15px;
-                            border-left: 4px solid #26d0ce;
-                        }}
-                        .token-details {{
-                            margin-top: 15px;
-                            font-size: 1em;
-                        }}
-                        .token-details table {{
-                            width: 100%;
-                        }}
-                        .token-details td {{
-                            padding: 6px 0;
-                        }}
-                        .token-details td:first-child {{
-                            font-weight: bold;
-                            width: 40%;
-                            color: #1a2980;
-                        }}
-                        </style>
                         <div class="token-box">
                             <h3>🔑 Token Generated</h3>
                             <div class="token-value">{new_token}</div>
@@ -2129,61 +1658,27 @@ def render_admin_page():
             st.rerun()
         try:
             # Get tokens from secure/tokens.csv
-            from token_storage import TOKENS_FILE
-            if os.path.exists(TOKENS_FILE):
-                # Read the actual CSV structure first to determine the column format
-                with open(TOKENS_FILE, 'r') as f:
-                    first_line = f.readline().strip()
-                    logger.info(f"CSV Header: {first_line}")
-                # Read CSV file with correct columns
-                tokens_df = pd.read_csv(TOKENS_FILE)
-                logger.info(f"CSV columns detected: {list(tokens_df.columns)}")
+            tokens_stat = _tokens_file_stat()
+            if tokens_stat:
+                # Parsed tokens are cached until the file changes (mtime/size are the key)
+                tokens_df = _load_tokens_df(TOKENS_FILE, tokens_stat.st_mtime_ns, tokens_stat.st_size)
                 
                 if not tokens_df.empty:
-                    # Rename columns if needed for display consistency
-                    column_mapping = {}
-                    if 'organization_name' in tokens_df.columns:
-                        column_mapping['organization_name'] = 'organization'
-                    # Apply column renames if any mappings exist
-                    if column_mapping:
-                        tokens_df = tokens_df.rename(columns=column_mapping)
-                    
-                    # Format dates for better readability
-                    date_columns = ['created_at', 'expires_at']
-                    for col in date_columns:
-                        if col in tokens_df.columns:
-                            try:
-                                # Convert to datetime with flexible parsing
-                                tokens_df[col] = pd.to_datetime(tokens_df[col], errors='coerce')
-                            except Exception as e:
-                                logger.warning(f"Error formatting {col}: {e}")
-                    
-                    # Add days remaining column
+                    # Add days remaining (numeric, blank once expired) and a status column
                     if 'expires_at' in tokens_df.columns:
-                        current_time = datetime.now()
-                        days_remaining = []
-                        
-                        # Process each row individually
-                        for _, row in tokens_df.iterrows():
-                            try:
-                                if pd.notna(row['expires_at']):
-                                    expires = pd.to_datetime(row['expires_at'], errors='coerce')
-                                    if pd.notna(expires):
-                                        delta = expires - current_time
-                                        days = delta.days
-                                        days_remaining.append("Expired" if days < 0 else f"{days} days")
-                                    else:
-                                        days_remaining.append("Unknown")
-                                else:
-                                    days_remaining.append("Unknown")
-                            except Exception as e:
-                                logger.warning(f"Error calculating days remaining: {e}")
-                                days_remaining.append("Unknown")
-                                
-                        tokens_df['Days Remaining'] = days_remaining
+                        try:
+                            delta_days = (tokens_df['expires_at'] - pd.Timestamp(datetime.now())).dt.days.astype('Int64')
+                            expired = delta_days < 0
+                            tokens_df['Days Remaining'] = delta_days.mask(expired)
+                            status = pd.Series("Active", index=tokens_df.index).mask(expired, "Expired")
+                            tokens_df['Status'] = status.mask(delta_days.isna(), "Unknown").astype('category')
+                        except Exception as e:
+                            logger.warning(f"Error calculating days remaining: {e}")
+                            tokens_df['Days Remaining'] = pd.NA
+                            tokens_df['Status'] = "Unknown"
                     
                     # Define columns to display, make sure they exist in the dataframe
-                    preferred_columns = ['organization', 'token', 'generated_by', 'created_at', 'expires_at', 'Days Remaining']
+                    preferred_columns = ['organization', 'token', 'generated_by', 'created_at', 'expires_at', 'Days Remaining', 'Status']
                     display_columns = [col for col in preferred_columns if col in tokens_df.columns]
                     
                     # Final display column renames for better presentation
@@ -2196,7 +1691,11 @@ def render_admin_page():
                     }
                     # Only select and rename columns that exist
                     tokens_df = tokens_df[display_columns].rename(columns={col: column_renames.get(col, col) for col in display_columns})
-                    st.dataframe(tokens_df, use_container_width=True)
+                    st.dataframe(
+                        tokens_df,
+                        use_container_width=True,
+                        column_config={"Days Remaining": st.column_config.NumberColumn(format="%d days")}
+                    )
                 else:
                     st.info("No tokens found")
             else:
@@ -2236,128 +1735,72 @@ def render_admin_page():
             except Exception as e:
                 st.error(f"Error during cleanup: {str(e)}")
     with col2:
-        if st.button("Export Token Database", key="export_btn"):
-            from token_storage import TOKENS_FILE
-            if os.path.exists(TOKENS_FILE):
-                import base64
-                with open(TOKENS_FILE, 'rb') as f:
-                    b64 = base64.b64encode(f.read()).decode()
-                href = f'<a href="data:file/csv;base64,{b64}" download="tokens_export.csv">Download CSV</a>'
-                st.markdown(href, unsafe_allow_html=True)
-            else:
-                st.info("No token database found to export")
+        # Stat again: the Generate/Revoke/cleanup actions above may have just written the file
+        tokens_stat = _tokens_file_stat()
+        if tokens_stat:
+            st.download_button(
+                "Export Token Database",
+                data=_read_tokens_csv(TOKENS_FILE, tokens_stat.st_mtime_ns, tokens_stat.st_size),
+                file_name="tokens_export.csv",
+                mime="text/csv",
+                key="export_btn"
+            )
+        else:
+            st.info("No token database found to export")
 
     
 
+# Answer used for every question by each uniform auto-fill type
+_AUTO_FILL_ANSWERS = {
+    "All Compliant": "Yes",
+    "All Non-Compliant": "No",
+    "All Partially Compliant": "Partially",
+}
+
 def auto_fill_responses(auto_fill_type):
     """Auto-fill responses based on the selected type"""
     if not st.session_state.get('responses'):
         st.session_state.responses = {}
+        st.session_state.answered_count = 0
     
     questionnaire = get_questionnaire(
         st.session_state.selected_regulation,
         st.session_state.selected_industry
     )
     
-    for section_idx, section in enumerate(questionnaire["sections"]):
-        for q_idx, question in enumerate(section["questions"]):
-            response_key = f"s{section_idx}_q{q_idx}"
-            
-            if auto_fill_type == "All Compliant":
-                st.session_state.responses[response_key] = "Yes"
-            elif auto_fill_type == "All Non-Compliant":
-                st.session_state.responses[response_key] = "No"
-            elif auto_fill_type == "All Partially Compliant":
-                st.session_state.responses[response_key] = "Partially"
-            elif auto_fill_type == "Random Mix":
-                import random
-                options = ["Yes", "No", "Partially", "Not applicable"]
-                st.session_state.responses[response_key] = random.choice(options)
+    keys = [
+        f"s{section_idx}_q{q_idx}"
+        for section_idx, section in enumerate(questionnaire["sections"])
+        for q_idx in range(len(section["questions"]))
+    ]
+    if auto_fill_type == "Random Mix":
+        values = random.choices(["Yes", "No", "Partially", "Not applicable"], k=len(keys))
+    elif auto_fill_type in _AUTO_FILL_ANSWERS:
+        values = [_AUTO_FILL_ANSWERS[auto_fill_type]] * len(keys)
+    else:
+        return
+    set_responses(dict(zip(keys, values)))
+
+# Sidebar navigation buttons: (label, widget key, page), in display order
+_NAV_ITEMS = (
+    ("Privacy Policy Analyzer", "nav_home", "welcome"),
+    ("Assessment", "nav_assessment", "assessment"),
+    ("AI Report ✨", "nav_report", "report"),
+    ("AI Data Discovery 🪄", "nav_discovery", "discovery"),
+    ("AI Privacy Policy Analyzer 💫", "nav_privacy", "privacy"),
+    ("Admin", "nav_admin", "admin"),
+    ("FAQ", "nav_faq", "faq"),
+)
 
 def render_sidebar():
     """Render the application sidebar"""
     with st.sidebar:
-        # --- Inject CSS directly for sidebar buttons --- #
-        st.markdown("""
-            <style>
-                /* Center all content in sidebar */
-                [data-testid="stSidebarUserContent"] {
-                    display: flex !important;
-                    flex-direction: column !important;
-                    align-items: center !important;
-                }
-
-                /* Logo container styling */
-                [data-testid="stSidebarUserContent"] div:has(> img) {
-                    display: flex !important;
-                    justify-content: center !important;
-                    align-items: center !important;
-                    padding: 0.2rem 0 0.6rem 0 !important;
-                    margin: 0 !important;
-                    width: 100% !important;
-                }
-
-                /* Logo image styling */
-                [data-testid="stSidebarUserContent"] img {
-                    width: 200px !important;
-                    height: auto !important;
-                    margin: 0 auto !important;
-                    align-items: center !important;
-                }
-
-                /* Navigation buttons container */
-                div[data-testid="stSidebarUserContent"] div[data-testid="stButton"] {
-                    width: 98% !important;
-                    margin: 0.01rem auto !important;
-                }
-
-                /* Style the button text itself */
-                div[data-testid="stSidebarUserContent"] div[data-testid="stButton"] > button {
-                    width: 100%;
-                    padding: 0.5rem 0.75rem;
-                    margin: 0.1rem 0;
-                    background-color: #23232b !important;
-                    color: #fafafa;
-                    border: none !important;
-                    border-radius: 0.4rem;
-                    text-align: left;
-                    transition: color 0.2s, background-color 0.2s;
-                    box-shadow: none !important;
-                }
-                
-                /* Hover effect - subtle background */
-                div[data-testid="stSidebarUserContent"] div[data-testid="stButton"] > button:hover:not(:disabled) {
-                    background-color: rgba(255, 255, 255, 0.05) !important;
-                    color: #6fa8dc !important;
-                    border: none !important;
-                }
-
-                /* Active/Selected state - left border and highlight */
-                div[data-testid="stSidebarUserContent"] div[data-testid="stButton"] > button:focus,
-                div[data-testid="stSidebarUserContent"] div[data-testid="stButton"] > button:active,
-                div[data-testid="stSidebarUserContent"] div[data-testid="stButton"] > button[kind="secondary"] {
-                    background-color: rgba(255, 255, 255, 0.08) !important;
-                    color: #ffffff !important;
-                    border-left: 3px solid #6fa8dc !important;
-                    padding-left: calc(0.75rem - 3px) !important; /* Adjust padding for border */
-                    }
-                    </style>
-            """, unsafe_allow_html=True)
-        # --- End of CSS Injection --- #
-
         # Logo: Centered using CSS only, no Streamlit columns
-        st.markdown(get_logo_css(), unsafe_allow_html=True)
-        if os.path.exists(config.LOGO_PATH): 
+        if _asset_exists(config.LOGO_PATH):
             st.image(config.LOGO_PATH, width=230)
         else:
             st.warning(f"Logo not found at path: {config.LOGO_PATH}")
         
-        # Apply custom CSS for navigation menu
-        st.markdown(get_section_navigation_css(), unsafe_allow_html=True)
-        
-        # Make sure we apply common button CSS
-        st.markdown(get_common_button_css(), unsafe_allow_html=True)
-        
         # Navigation section title
         
         # Check if assessment parameters are filled AND assessment is started
@@ -2371,33 +1814,50 @@ def render_sidebar():
 
 
 
-        # Define navigation items with conditional display
-        nav_items = [
-            {"label": "Privacy Policy Analyzer", "key": "nav_home", "page": "welcome", "always_show": True},
-            {"label": "Assessment", "key": "nav_assessment", "page": "assessment", "show_if_ready": assessment_ready},
-            {"label": "AI Report ✨", "key": "nav_report", "page": "report", "show_if": "assessment_complete"},
-            {"label": "AI Data Discovery 🪄", "key": "nav_discovery", "page": "discovery", "show_if": "assessment_complete"},
-            {"label": "AI Privacy Policy Analyzer 💫", "key": "nav_privacy", "page": "privacy", "always_show": True},
-            {"label": "Admin", "key": "nav_admin", "page": "admin", "show_if": "is_admin"},
-            {"label": "FAQ", "key": "nav_faq", "page": "faq", "always_show": True}
-        ]
+        # Which pages get a navigation button on this run
+        assessment_complete = st.session_state.get('assessment_complete', False)
+        visibility = {
+            'welcome': True,
+            'assessment': bool(assessment_ready),
+            'report': assessment_complete,
+            'discovery': assessment_complete,
+            'privacy': True,
+            'admin': st.session_state.get('is_admin', False),
+            'faq': True,
+        }
+        current_page = st.session_state.current_page
         
         # Fix for button rendering
-        for item in nav_items:
-            should_show = (
-                item.get("always_show", False) or 
-                (item.get("show_if") and st.session_state.get(item.get("show_if"), False)) or
-                (item.get("show_if_ready") and item.get("show_if_ready"))
-            )
-            if should_show:
-                button_type = "secondary" if st.session_state.current_page == item["page"] else "primary"
+        for label, key, page in _NAV_ITEMS:
+            if visibility[page]:
+                button_type = "secondary" if current_page == page else "primary"
                 if st.button(
-                    item["label"], 
-                    key=item["key"], 
+                    label, 
+                    key=key, 
                     type=button_type, 
                     use_container_width=True
                 ):
-                    go_to_page(item["page"])
+                    go_to_page(page)
+
+# Welcome page choices: industries offered per country (in selectbox order), and
+# the (label, key) of the regulation each country - or country/industry - maps to
+_COUNTRY_INDUSTRIES = {
+    "Qatar": ["Oil and Gas", "General"],
+    "India": ["Banking and finance", "E-commerce"],
+    "Europe": ["General", "Banking and finance", "E-commerce"],
+    "Australia": ["General", "Banking and finance", "E-commerce"],
+    "Saudi Arabia": ["General", "Banking and finance", "E-commerce"],
+}
+_COUNTRY_REGULATIONS = {
+    "Qatar": ("Qatar Personal Data Protection Law", "PDPPL"),
+    "India": ("Digital Personal Data Protection Act (DPDP)", "DPDP"),
+    "Europe": ("General Data Protection Regulation (GDPR)", "GDPR"),
+    "Australia": ("Australian Privacy Principles (APPs)", "OAIC"),
+    "Saudi Arabia": ("Personal Data Protection Law (PDPL)", "PDPL"),
+}
+_INDUSTRY_REGULATIONS = {
+    ("Qatar", "General"): ("National Data Policy (Qatar)", "NPC"),
+}
 
 def render_welcome_page():
     """Render the welcome page"""
@@ -2406,20 +1866,7 @@ def render_welcome_page():
     with center_col:
         # Create container for form elements
         with st.container():
-            st.markdown(get_input_label_css(), unsafe_allow_html=True)
-            # Add subtitle CSS and subtitle
-            st.markdown("""
-                <style>
-                .subtitle {
-                    font-size: 1.5em;
-                    color: #FFDB58;
-                    font-weight: 500;
-                    margin-bottom: 1.2em;
-                    margin-top: 0.2em;
-                    letter-spacing: 0.01em;
-                }
-                </style>
-            """, unsafe_allow_html=True)
+            # Add subtitle (styled by the page CSS)
             st.markdown("<div class='subtitle'>Questionnaire-based Policy Assessment</div>", unsafe_allow_html=True)
             
             # 1. Organization Name *
@@ -2433,24 +1880,13 @@ def render_welcome_page():
             )
             if org_name != st.session_state.organization_name:
                 # Capitalize the organization name
+                # Persisted when the assessment starts, not on every name edit
                 st.session_state.organization_name = org_name.strip().title()
-                # Save organization data
-                from data_storage import save_assessment_data
-                org_data = {
-                    'organization_name': st.session_state.organization_name,
-                    'assessment_date': datetime.now().strftime("%Y-%m-%d"),
-                    'selected_regulation': st.session_state.selected_regulation,
-                    'selected_industry': st.session_state.selected_industry,
-                    'responses': {},
-                    'assessment_complete': False
-                }
-                save_assessment_data(org_data)
             
             
-            # 2. Country (from PRIVACY_LAWS)
-            from privacy_policy_analyzer import PRIVACY_LAWS
+            # 2. Country
             # Define allowed countries directly
-            allowed_countries = ["Qatar", "India", "Europe", "Australia", "Saudi Arabia"]
+            allowed_countries = list(_COUNTRY_INDUSTRIES)
             
             # Initialize session state for country if not exists
             if "selected_country" not in st.session_state:
@@ -2474,17 +1910,7 @@ def render_welcome_page():
             
             # 3. Select Industry * (context-sensitive)
             st.markdown('<p class="input-label">Industry *</p>', unsafe_allow_html=True)
-            industry_options = []
-            if selected_country == "Qatar":
-                industry_options = ["Oil and Gas", "General"]
-            elif selected_country == "India":
-                industry_options = ["Banking and finance", "E-commerce"]
-            elif selected_country == "Europe":
-                industry_options = ["General", "Banking and finance", "E-commerce"]
-            elif selected_country == "Australia":
-                industry_options = ["General", "Banking and finance", "E-commerce"]
-            elif selected_country == "Saudi Arabia":
-                industry_options = ["General", "Banking and finance", "E-commerce"]
+            industry_options = _COUNTRY_INDUSTRIES.get(selected_country, [])
 
             # Initialize industry in session state if not exists or if current industry is invalid
             if "selected_industry" not in st.session_state or st.session_state.selected_industry not in industry_options:
@@ -2507,25 +1933,10 @@ def render_welcome_page():
 
             # 4. Regulation (auto-populated, disabled)
             # Determine regulation based on current selections
-            if selected_country == "Qatar":
-                if selected_industry == "General":
-                    regulation_label = "National Data Policy (Qatar)"
-                    regulation_key = "NPC"
-                else:
-                    regulation_label = "Qatar Personal Data Protection Law"
-                    regulation_key = "PDPPL"
-            elif selected_country == "Europe":
-                regulation_label = "General Data Protection Regulation (GDPR)"
-                regulation_key = "GDPR"
-            elif selected_country == "Australia":
-                regulation_label = "Australian Privacy Principles (APPs)"
-                regulation_key = "OAIC"
-            elif selected_country == "Saudi Arabia":
-                regulation_label = "Personal Data Protection Law (PDPL)"
-                regulation_key = "PDPL"
-            else:  # India
-                regulation_label = "Digital Personal Data Protection Act (DPDP)"
-                regulation_key = "DPDP"
+            regulation_label, regulation_key = (
+                _INDUSTRY_REGULATIONS.get((selected_country, selected_industry))
+                or _COUNTRY_REGULATIONS.get(selected_country, _COUNTRY_REGULATIONS["India"])
+            )
                 
             st.selectbox(
                 "Regulation",
@@ -2550,13 +1961,13 @@ def render_welcome_page():
                         return
                     # Reset responses and assessment completion status
                     st.session_state.responses = {}
+                    st.session_state.answered_count = 0
                     st.session_state.assessment_complete = False
                     st.session_state.results = None
                     st.session_state.current_section = 0
                     st.session_state.assessment_started = True
                     logger.info(f"Starting assessment for {org_name}")
                     # Save organization data
-                    from data_storage import save_assessment_data
                     org_data = {
                         'organization_name': org_name,
                         'assessment_date': datetime.now().strftime("%Y-%m-%d"),
@@ -2578,7 +1989,6 @@ def render_dashboard():
 
 def render_faq():
     """Render the FAQ view"""
-    st.markdown(get_faq_css(), unsafe_allow_html=True)
     st.markdown("<h1 class='faq-header'>Frequently Asked Questions</h1>", unsafe_allow_html=True)
     
     for category, faqs in FAQ_DATA.items():
@@ -2587,6 +1997,19 @@ def render_faq():
             with st.expander(question):
                 st.markdown(answer)
 
+@st.cache_data(ttl=3600, max_entries=8, show_spinner=False)
+def _cached_ddl_analysis(content_digest: str, _ddl_bytes: memoryview) -> Dict[str, Any]:
+    """Decode and analyze an uploaded DDL script once per distinct file.
+
+    _ddl_bytes is keyed through content_digest. Failures raise so they are
+    not cached.
+    """
+    from data_discovery import analyze_ddl_script
+    findings = analyze_ddl_script(str(_ddl_bytes, "utf-8"))
+    if "error" in findings:
+        raise ValueError(findings["error"])
+    return findings
+
 def render_data_discovery():
     """Render the data discovery view"""
     if not st.session_state.assessment_complete:
@@ -2596,23 +2019,25 @@ def render_data_discovery():
             st.rerun()
         return
     
-    # Add custom CSS for data discovery page
-    st.markdown(get_data_discovery_css(), unsafe_allow_html=True)
-
     st.header("AI Data Discovery")
     
     # Import and use the data discovery functionality
-    from data_discovery import analyze_ddl_script, render_findings_section, get_recommendations
+    from data_discovery import render_findings_section, get_recommendations
     
     # File upload for DDL script
     uploaded_file = st.file_uploader("Upload your database DDL script (SQL or TXT format)", type=['sql', 'txt'])
     
     if uploaded_file is not None:
         try:
-            ddl_content = uploaded_file.getvalue().decode("utf-8")
+            # Hash and decode straight from the upload's buffer; getvalue() would copy the bytes first
+            ddl_bytes = uploaded_file.getbuffer()
+            content_digest = hashlib.blake2b(ddl_bytes, digest_size=16).hexdigest()
             
             with st.spinner("Analyzing database schema..."):
-                findings = analyze_ddl_script(ddl_content)
+                try:
+                    findings = _cached_ddl_analysis(content_digest, ddl_bytes)
+                except ValueError as e:
+                    findings = {"error": str(e)}
                 
                 if "error" in findings:
                     st.error(f"Analysis failed: {findings['error']}")
@@ -2622,8 +2047,8 @@ def render_data_discovery():
                     
                     st.subheader("Recommendations")
                     recommendations = get_recommendations(findings)
-                    for rec in recommendations:
-                        st.markdown(f"• {rec}")
+                    # One element for the whole list; blank lines keep each bullet its own paragraph
+                    st.markdown("\n\n".join(f"• {rec}" for rec in recommendations))
         except Exception as e:
             st.error(f"Error analyzing file: {str(e)}")
     
@@ -2651,7 +2076,6 @@ def render_data_discovery():
             Contact info@datainfa.com for further understanding and implementation
         """)
         
-    st.markdown(get_penalties_note_css(), unsafe_allow_html=True)
     st.markdown("""
         <div class='penalties-note'>
             ℹ️ We never store your data. We only use it to provide you with a report.
@@ -2668,92 +2092,244 @@ def get_compliance_level_color(level):
     }
     return colors.get(level, "#808080")  # Default to gray if level not found
 
-def convert_for_download():
-    """Convert report content to a downloadable PDF format.
-    Parameters:
-        - None
-    Returns:
-        - bytes: The binary data of the generated PDF if successful, otherwise None.
-    Processing Logic:
-        - Retrieves the report content and organization name from session state.
-        - Adds a header including current date and optional organization logo.
-        - Generates a PDF from combined header and report content, displaying success or error messages accordingly."""
-    try:
-        # Get the original report content from session state
-        original_report_content = st.session_state.get('ai_report_content')
-        if not original_report_content:
-            st.error("No report content available. Please generate a report first.")
-            return None
+# Countries offered by the Privacy Policy Analyzer
+_PPA_COUNTRIES = ("Qatar", "India", "Europe", "Saudi Arabia")
 
-        # Get organization name
-        org_name = st.session_state.get('organization_name', 'Organization')
-        current_date = datetime.now().strftime("%B %d, %Y")
+# Closing note under a privacy policy analysis
+_PPA_NOTE_HTML = """
+            <div style="background: rgba(111, 168, 220, 0.1); padding: 1rem; border-radius: 8px; margin-top: 2rem; border-left: 4px solid #6fa8dc;">
+                <strong style="color: #6fa8dc;">Note:</strong> Your privacy policy document is processed securely and is not stored. 
+                The analysis is performed in real-time and results are displayed immediately.
+            </div>
+        """
 
-        # Add header with logo if available
-        logo_path = os.path.join(config.BASE_DIR, "Assets", "DataINFA.png")
-        header = f"""#### AI Report generated by DataINFA on: {current_date} for {org_name}
+# Link to an auto-detected privacy policy; the URL is escaped before it is filled in
+_FOUND_URL_TMPL = "<div class='ai-analysis-container'>Found privacy policy at: <a href='{u}' target='_blank'>{u}</a></div>"
+
+# Penalties shown under a privacy policy analysis, by PRIVACY_LAWS key
+_PPA_PENALTIES_DATA = {
+    'dpdp_india': _PENALTIES_DATA['DPDP'],
+    'ndp_qatar': _PENALTIES_DATA['PDPPL'],
+    'gdpr_europe': {
+        "Violation Type": [
+            "General violation of GDPR provisions",
+            "Serious violations (e.g., breach notification, DPIA, cross-border transfer)",
+            "Maximum penalty for any infringement"
+        ],
+        "Penalty Amount (EUR)": [
+            "Up to 10 million or 2% of global annual turnover",
+            "Up to 20 million or 4% of global annual turnover",
+            "Up to 20 million or 4% of global annual turnover"
+        ]
+    },
+    'pdpl_saudi': {
+        "Nature of violation/breach": [
+            "Disclosure or publication of Sensitive Data with intent to harm or for personal benefit",
+            "General violations of PDPL provisions",
+            "Failure to implement required security measures",
+            "Failure to maintain records of processing activities",
+            "Failure to respond to data subject rights requests",
+            "Unauthorized cross-border data transfers",
+            "Failure to notify data breaches"
+        ],
+        "Penalty": [
+            "Imprisonment up to 2 years or fine up to 3 million SAR, or both",
+            "Warning or fine up to 5 million SAR (may be doubled for repeat violations)",
+            "Warning or fine up to 5 million SAR",
+            "Warning or fine up to 5 million SAR",
+            "Warning or fine up to 5 million SAR",
+            "Warning or fine up to 5 million SAR",
+            "Warning or fine up to 5 million SAR"
+        ],
+        "Penalty Amount (USD, approx.)": [
+            "Up to ~$800,000",
+            "Up to ~$1.33 million",
+            "Up to ~$1.33 million",
+            "Up to ~$1.33 million",
+            "Up to ~$1.33 million",
+            "Up to ~$1.33 million",
+            "Up to ~$1.33 million"
+        ]
+    },
+}
+_PPA_DEFAULT_PENALTIES = {
+    "Violation Type": [
+        "General violation of privacy provisions",
+        "Serious violations",
+        "Maximum penalty for any infringement"
+    ],
+    "Penalty Amount": [
+        "Up to a significant amount",
+        "Up to a higher amount",
+        "Up to the maximum allowed by law"
+    ]
+}
+
+@functools.lru_cache(maxsize=16)
+def _ppa_penalties_table_html(law_key: str) -> str:
+    """HTML penalties table shown under an analysis against a PRIVACY_LAWS key"""
+    return _penalties_table(_PPA_PENALTIES_DATA.get(law_key, _PPA_DEFAULT_PENALTIES))
+
+@functools.lru_cache(maxsize=1)
+def _ppa_country_options() -> Tuple[Tuple[str, ...], Dict[str, Tuple[str, str]]]:
+    """The analyzer's country names, and each name's (PRIVACY_LAWS key, regulation); built once per process.
+
+    privacy_policy_analyzer pulls in openai, googlesearch and markdown_pdf,
+    so it is still only imported when the analyzer is first used.
+    """
+    from privacy_policy_analyzer import PRIVACY_LAWS
+    options = {
+        law["name"]: (key, law["regulation"])
+        for key, law in PRIVACY_LAWS.items() if law["name"] in _PPA_COUNTRIES
+    }
+    return tuple(options), options
 
----
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _cached_policy_url(organization_name: str, country: str) -> str:
+    """Search for an organization's privacy policy URL; repeat searches within the hour hit the cache.
 
-"""
-        
-        # Combine header with the report content
-        report_with_header = f"{header}{original_report_content}"
-        
-        with st.spinner("Generating PDF report..."):
-            # Generate PDF
-            pdf_data = convert_markdown_to_pdf(report_with_header, org_name)
-            if pdf_data:
-                st.success("PDF report generated successfully!")
-                return pdf_data
-            else:
-                st.error("Failed to generate PDF report. Please try again.")
-                return None
+    A miss raises LookupError so it is not cached.
+    """
+    from privacy_policy_analyzer import find_privacy_policy_url
+    found_url = find_privacy_policy_url(organization_name, country=country)
+    if not found_url:
+        raise LookupError(f"no privacy policy URL found for {organization_name}")
+    return found_url
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _cached_policy_content(url: str) -> str:
+    """Fetch and extract a privacy policy page; repeat fetches within the hour hit the cache.
+
+    A failed fetch raises LookupError so it is not cached.
+    """
+    from privacy_policy_analyzer import fetch_policy_content
+    policy_content = fetch_policy_content(url)
+    if not policy_content:
+        raise LookupError(f"no policy content extracted from {url}")
+    return policy_content
+
+def _policy_content_or_none(url: str) -> Optional[str]:
+    """Privacy policy text at url, or None if it could not be fetched"""
+    try:
+        return _cached_policy_content(url)
+    except LookupError:
+        return None
+
+@st.cache_data(ttl=3600, max_entries=32, show_spinner=False)
+def _cached_policy_analysis(content_digest: str, law_key: str, _policy_content: str) -> str:
+    """Analyze a privacy policy against a law once per distinct (policy, law).
+
+    _policy_content is keyed through content_digest. Failures raise so they
+    are not cached.
+    """
+    from privacy_policy_analyzer import analyze_privacy_policy
+    analysis_result = analyze_privacy_policy(_policy_content, law_key)
+    if "error" in analysis_result:
+        raise ValueError(analysis_result["error"])
+    return analysis_result["analysis"]
+
+@st.cache_resource(ttl=3600, max_entries=16, show_spinner=False)
+def _policy_analysis_pdf(analysis: str, organization_name: str, law_key: str, report_date: str) -> bytes:
+    """Render a privacy policy analysis to PDF once, shared by every session downloading it.
+
+    generate_privacy_policy_pdf stamps today's date in the header, so
+    report_date keys the cache to that day. Failures raise so they are not cached.
+    """
+    from privacy_policy_analyzer import generate_privacy_policy_pdf
+    pdf_content = generate_privacy_policy_pdf({"analysis": analysis}, organization_name=organization_name, law_key=law_key)
+    if not pdf_content:
+        raise ValueError("no PDF content generated")
+    return pdf_content
+
+def _policy_analysis_pdf_or_none(analysis: str, pdf_source: Optional[Tuple[str, str]]) -> Optional[bytes]:
+    """PDF for the current analysis from its (organization name, law key), or None if unavailable"""
+    if not pdf_source:
+        return None
+    try:
+        return _policy_analysis_pdf(analysis, *pdf_source, datetime.now().strftime('%Y-%m-%d'))
     except Exception as e:
-        logger.error(f"Error generating PDF: {e}")
-        st.error("An error occurred while generating the PDF. Please try again.")
+        logger.error(f"Error generating privacy policy PDF: {e}")
         return None
 
-# In the main UI section where the download button is rendered:
-if st.session_state.get('ai_report_generated', False):
-    col1, col2 = st.columns([0.15, 0.85])
-    with col1:
-        # Generate PDF data first
-        pdf_data = convert_for_download() if st.session_state.get('ai_report_content') else None
-        
-        # Only show download button if we have PDF data
-        if pdf_data is not None:
-            if st.download_button(
-                "📥 Download",
-                data=pdf_data,
-                file_name=f"AI_Report_{datetime.now().strftime('%Y%m%d')}.pdf",
-                mime="application/pdf",
-                help="Download the report as PDF",
-                use_container_width=False
-            ):
-                pass  # The download will be handled by Streamlit
+@functools.lru_cache(maxsize=8)
+def _split_policy_analysis(analysis_html: str) -> Tuple[str, str]:
+    """Split an analysis into its title, without '#' and '**', and the rest; once per analysis"""
+    header_line, _, rest_of_analysis = analysis_html.partition('\n')
+    return _ANALYSIS_TITLE_MARKUP_RE.sub('', header_line).strip(), rest_of_analysis
 
+def _auto_detected_policy(org_name: str, country: str, policy_url: Optional[str], policy_text: Optional[str]) -> Optional[str]:
+    """Search for the organization's privacy policy and fetch it"""
+    try:
+        found_url = _cached_policy_url(org_name, country)
+    except LookupError:
+        st.session_state.ppa_error = "Could not find privacy policy URL."
+        return None
+    # Kept with the result so the link stays up on later reruns
+    st.session_state.ppa_found_url_message = _FOUND_URL_TMPL.format(u=html.escape(found_url))
+    policy_content = _policy_content_or_none(found_url)
+    if not policy_content:
+        st.session_state.ppa_error = "Could not extract policy content from the URL."
+    return policy_content
+
+def _policy_from_url(org_name: str, country: str, policy_url: Optional[str], policy_text: Optional[str]) -> Optional[str]:
+    """Fetch the privacy policy at the URL the user entered"""
+    with st.spinner("Fetching and analyzing privacy policy..."):
+        policy_content = _policy_content_or_none(policy_url)
+    if not policy_content:
+        st.session_state.ppa_error = "Could not fetch or extract content from the provided URL."
+    return policy_content
+
+def _pasted_policy(org_name: str, country: str, policy_url: Optional[str], policy_text: Optional[str]) -> Optional[str]:
+    """The privacy policy text the user pasted"""
+    return policy_text
+
+# Analyzer input method -> handler returning the policy text, or None after recording ppa_error
+_PPA_INPUT_HANDLERS = {
+    "Auto-Detect and Analyze Website Policy": _auto_detected_policy,
+    "Enter Privacy Policy URL": _policy_from_url,
+    "Paste Privacy Policy Text": _pasted_policy,
+}
+
+def _start_policy_assessment(org_name: str, selected_country: str, selected_input_method: str,
+                             policy_url: Optional[str], policy_text: Optional[str],
+                             selected_law_key: str, regulation_label: str) -> None:
+    """Validate the analyzer inputs, then fetch and analyze the policy into session state"""
+    # Validation; isspace() checks for blank input without copying a stripped string
+    if not org_name or org_name.isspace():
+        st.error("Please enter your organization name before starting the assessment.")
+        return
+    if selected_input_method == "Enter Privacy Policy URL" and (not policy_url or policy_url.isspace()):
+        st.error("Please enter a valid privacy policy URL.")
+        return
+    if selected_input_method == "Paste Privacy Policy Text" and (not policy_text or policy_text.isspace()):
+        st.error("Please paste the privacy policy text.")
+        return
+    # Clear previous analysis when starting a new assessment
+    clear_ppa_analysis_state()
+    # Fetch the policy text for the chosen input method; handlers record their own errors
+    policy_content = _PPA_INPUT_HANDLERS[selected_input_method](org_name, selected_country, policy_url, policy_text)
+    # Run analysis
+    if policy_content:
+        with st.spinner(f"Analyzing privacy policy against {regulation_label} requirements... (Estimated time: ~60 seconds)"):
+            # Keyed by a digest of the policy, so re-running the same policy and law is instant
+            content_digest = hashlib.blake2b(policy_content.encode(), digest_size=16).hexdigest()
+            try:
+                analysis_html = _cached_policy_analysis(content_digest, selected_law_key, policy_content)
+            except ValueError as e:
+                st.session_state.ppa_error = f"Error analyzing privacy policy: {e}"
+                return
+            st.session_state.ppa_error = None
+            st.session_state.ppa_analysis_html = analysis_html
+            # Only what the PDF is rendered from; the bytes themselves live in a shared cache
+            st.session_state.ppa_pdf_source = (org_name, selected_law_key)
+
+@st.fragment
 def render_privacy_policy_analyzer() -> None:
-    """Render the redesigned AI Privacy Policy Analyzer page with welcome-page style UI/UX."""
-    st.markdown(get_input_label_css(), unsafe_allow_html=True)
-    # Add subtitle CSS and subtitle
-    st.markdown("""
-        <style>
-        .subtitle {
-            font-size: 1.5em;
-            color: #FFDB58;
-            font-weight: 500;
-            margin-bottom: 1.2em;
-            margin-top: 0.2em;
-            letter-spacing: 0.01em;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-    
-    analysis_html = None
-    pdf_content = None
-    found_url_message = None
+    """Render the redesigned AI Privacy Policy Analyzer page with welcome-page style UI/UX.
 
+    Runs as a fragment, so editing the inputs reruns only the analyzer, not
+    the stylesheet, header and sidebar around it.
+    """
     _, center_col, _ = st.columns([1, 2, 1])
     with center_col:
         st.markdown("<div class='subtitle'>AI-based Privacy Policy Assessment</div>", unsafe_allow_html=True)
@@ -2771,17 +2347,10 @@ def render_privacy_policy_analyzer() -> None:
                 # Capitalize the organization name
                 st.session_state.ppa_org_name = org_name.strip().title()
                 # Clear previous analysis when org name changes
-                st.session_state.ppa_analysis_html = None
-                st.session_state.ppa_pdf_content = None
-                st.session_state.ppa_error = None
-                st.session_state.ppa_found_url_message = None
+                clear_ppa_analysis_state()
 
             # 2. Country (Qatar/India/Europe/Saudi Arabia only)
-            from privacy_policy_analyzer import PRIVACY_LAWS
-            country_options = {config["name"]: key for key, config in PRIVACY_LAWS.items()}
-            allowed_countries = ["Qatar", "India", "Europe", "Saudi Arabia"]
-            country_options = {k: v for k, v in country_options.items() if k in allowed_countries}
-            country_names = list(country_options.keys())
+            country_names, country_options = _ppa_country_options()
             # Set default to 'Qatar' if available, otherwise use the first country
             selected_country = st.session_state.get("ppa_selected_country", "Qatar" if "Qatar" in country_names else country_names[0])
             selected_country = st.selectbox(
@@ -2791,18 +2360,10 @@ def render_privacy_policy_analyzer() -> None:
                 help="Select the country for privacy policy analysis"
             )
             st.session_state.ppa_selected_country = selected_country
-            selected_country_key = country_options[selected_country]
+            selected_country_key, regulation_label = country_options[selected_country]
 
             # 4. Regulation (auto-populated, disabled)
-            if selected_country == "Europe":
-                regulation_label = "General Data Protection Regulation (GDPR)"
-                regulation_key = "GDPR"
-            elif selected_country == "Saudi Arabia":
-                regulation_label = "Personal Data Protection Law (PDPL)"
-                regulation_key = "pdpl_saudi"
-            else:
-                regulation_label = PRIVACY_LAWS[selected_country_key]["regulation"]
-                regulation_key = selected_country_key
+            regulation_key = selected_country_key
             st.selectbox(
                 "Regulation",
                 options=[regulation_label],
@@ -2832,117 +2393,88 @@ def render_privacy_policy_analyzer() -> None:
                 index=input_methods.index(st.session_state.ppa_input_method),
                 key="ppa_input_method",
                 label_visibility="collapsed",
+                # Clear previous analysis when input method changes
                 on_change=clear_ppa_analysis_state
             )
-            # Clear previous analysis when input method changes
-            if selected_input_method != st.session_state.ppa_input_method:
-                st.session_state.ppa_analysis_html = None
-                st.session_state.ppa_pdf_content = None
-                st.session_state.ppa_error = None
-                st.session_state.ppa_found_url_message = None
             # Removed direct assignment to st.session_state.ppa_input_method to avoid Streamlit error
 
             # Input fields for each method
             policy_url: Optional[str] = None
             policy_text: Optional[str] = None
-            policy_content: Optional[str] = None
             selected_law_key = selected_country_key
 
-            # Show input for Enter Privacy Policy URL
-            if selected_input_method == "Enter Privacy Policy URL":
-                st.markdown('<p class="input-label">Privacy Policy URL *</p>', unsafe_allow_html=True)
-                policy_url = st.text_input(
-                    "Privacy Policy URL",
-                    value=st.session_state.get("ppa_policy_url", ""),
-                    key="ppa_policy_url_input",
-                    placeholder="https://example.com/privacy-policy",
-                    label_visibility="collapsed"
-                )
-                st.session_state.ppa_policy_url = policy_url
-            # Show input for Paste Privacy Policy Text
-            elif selected_input_method == "Paste Privacy Policy Text":
-                st.markdown('<p class="input-label">Paste Privacy Policy Text *</p>', unsafe_allow_html=True)
-                policy_text = st.text_area(
-                    "Privacy Policy Text",
-                    value=st.session_state.get("ppa_policy_text", ""),
-                    key="ppa_policy_text_input",
-                    placeholder="Paste the full privacy policy text here",
-                    label_visibility="collapsed",
-                    height=200
-                )
-                st.session_state.ppa_policy_text = policy_text
-
-            # Reduce ONLY the size of the Start Assessment button (AI Privacy Policy Analyzer)
-            st.markdown("""
-                <style>
-                .compact-center-btn {
-                    display: flex;
-                    justify-content: center;
-                    margin-top: 1em;
-                    margin-bottom: 1em;
-                }	
-                .compact-center-btn button {
-                    max-width: 160px !important;
-                    min-width: 120px !important;
-                    width: 100% !important;
-                }
-                </style>
-            """, unsafe_allow_html=True)
-
             # Initialize button_clicked variable
             button_clicked = False
 
-            # Only show Start Assessment button if a valid input method is selected
+            # Only show the policy input and Start Assessment button if a valid input method
+            # is selected. They sit in a form, so typing or pasting a policy does not rerun
+            # the page until the assessment is started
             if selected_input_method != "Select":
-                st.markdown('<div class="compact-center-btn">', unsafe_allow_html=True)
-                button_clicked = st.button(
-                    "Start Assessment",
-                    type="primary",
-                    use_container_width=True,
-                    key="ppa_start_assessment_btn"
-                )
-                st.markdown('</div>', unsafe_allow_html=True)
+                with st.form("ppa_input_form", border=False):
+                    # Show input for Enter Privacy Policy URL
+                    if selected_input_method == "Enter Privacy Policy URL":
+                        st.markdown('<p class="input-label">Privacy Policy URL *</p>', unsafe_allow_html=True)
+                        policy_url = st.text_input(
+                            "Privacy Policy URL",
+                            value=st.session_state.get("ppa_policy_url", ""),
+                            key="ppa_policy_url_input",
+                            placeholder="https://example.com/privacy-policy",
+                            label_visibility="collapsed"
+                        )
+                        st.session_state.ppa_policy_url = policy_url
+                    # Show input for Paste Privacy Policy Text
+                    elif selected_input_method == "Paste Privacy Policy Text":
+                        st.markdown('<p class="input-label">Paste Privacy Policy Text *</p>', unsafe_allow_html=True)
+                        policy_text = st.text_area(
+                            "Privacy Policy Text",
+                            value=st.session_state.get("ppa_policy_text", ""),
+                            key="ppa_policy_text_input",
+                            placeholder="Paste the full privacy policy text here",
+                            label_visibility="collapsed",
+                            height=200
+                        )
+                        st.session_state.ppa_policy_text = policy_text
+
+                    # The Start Assessment button is shrunk by .compact-center-btn (styles._PAGE_CSS["privacy"])
+                    st.markdown('<div class="compact-center-btn">', unsafe_allow_html=True)
+                    button_clicked = st.form_submit_button(
+                        "Start Assessment",
+                        type="primary",
+                        use_container_width=True
+                    )
+                    st.markdown('</div>', unsafe_allow_html=True)
 
     # --- OUTSIDE the columns block: render results full-width ---
+    # A new assessment fills session state in this same run, so its results
+    # render below without another rerun
+    if button_clicked:
+        _start_policy_assessment(org_name, selected_country, selected_input_method,
+                                 policy_url, policy_text, selected_law_key, regulation_label)
+    # Read the last result once, after the inputs above have had a chance to set or clear it
+    ppa_result = {key: st.session_state.get(key) for key in _PPA_RESULT_KEYS}
     # Show error if any
-    if st.session_state.get("ppa_error"):
-        st.error(st.session_state.ppa_error)
+    if ppa_result["ppa_error"]:
+        st.error(ppa_result["ppa_error"])
     # Show found url message if any
-    if st.session_state.get("ppa_found_url_message"):
-        st.markdown(st.session_state.ppa_found_url_message, unsafe_allow_html=True)
+    if ppa_result["ppa_found_url_message"]:
+        st.markdown(ppa_result["ppa_found_url_message"], unsafe_allow_html=True)
     # Show analysis if any
-    if st.session_state.get("ppa_analysis_html"):
-        st.markdown(get_ai_report_css(), unsafe_allow_html=True)
-        # Split the analysis_html into first line (header) and the rest
-        analysis_lines = st.session_state.ppa_analysis_html.split('\n', 1)
-        if analysis_lines:
-            # Inject custom CSS for a smaller header
-            st.markdown("""
-                <style>
-                .policy-analysis-header {
-                    font-size: 1.3em;
-                    font-weight: 600;
-                    color: #6fa8dc;
-                    margin-bottom: 0.5em;
-                    margin-top: 0.5em;
-                }
-                </style>
-            """, unsafe_allow_html=True)
-
-            # Render the header with the custom class, removing '#' and '**'
-            header_text = analysis_lines[0].replace('#', '').replace('**', '').strip()
-            st.markdown(f"<div class='policy-analysis-header'>{header_text}</div>", unsafe_allow_html=True)
-        rest_of_analysis = analysis_lines[1] if len(analysis_lines) > 1 else ""
+    if ppa_result["ppa_analysis_html"]:
+        # Split the analysis_html into first line (header) and the rest; the
+        # session keeps the same string object, so reruns hit the cache
+        header_text, rest_of_analysis = _split_policy_analysis(ppa_result["ppa_analysis_html"])
+        # Render the header with the custom class
+        st.markdown(f"<div class='policy-analysis-header'>{header_text}</div>", unsafe_allow_html=True)
         st.markdown(f"""
             <div class="ai-analysis-container">
                 {rest_of_analysis}
             </div>
         """, unsafe_allow_html=True)
-        if st.session_state.get("ppa_pdf_content"):
-            st.markdown(get_download_button_css(), unsafe_allow_html=True)
+        pdf_content = _policy_analysis_pdf_or_none(ppa_result["ppa_analysis_html"], ppa_result["ppa_pdf_source"])
+        if pdf_content:
             st.download_button(
                 label=" Download Analysis Report (PDF)",
-                data=st.session_state.ppa_pdf_content,
+                data=pdf_content,
                 file_name=f"Privacy_Policy_Assessment_Report_{datetime.now().strftime('%Y%m%d')}.pdf",
                 mime="application/pdf",
                 help="Download the analysis report as a PDF document",
@@ -2950,454 +2482,25 @@ def render_privacy_policy_analyzer() -> None:
             )
         
         # --- Insert extra sections here ---
-        # 1. Implementation Framework
-        st.subheader("Implementation Framework")
-        html_path = os.path.join(config.BASE_DIR, "Assets", "INFA.html")
-        if os.path.exists(html_path):
-            with open(html_path, "r", encoding="utf-8") as f:
-                html_content = f.read()
-            centered_html = f"""
-            <style>
-            .diagram-section-bg {{
-                background: #181c24;
-                border-radius: 12px;
-                padding: 32px 10px 10px 10px;
-                margin-bottom: 1rem;
-                min-height: 520px;
-                box-shadow: 0 2px 12px rgba(0,0,0,0.10);
-            }}
-            .diagram-container {{
-                display: flex;
-                justify-content: center;
-                align-items: center;
-                width: 100%;
-                padding: 0;
-                margin: 0;
-                overflow: auto;
-                min-height: 500px;
-                background: transparent;
-            }}
-            .diagram-content {{
-                position: relative;
-                width: 100%;
-                height: 100%;
-                display: flex;
-                justify-content: center;
-                align-items: center;
-            }}
-            .diagram-content svg {{
-                max-width: 100%;
-                height: auto;
-                transform-origin: center;
-                transition: transform 0.3s ease;
-            }}
-            @media (max-width: 1200px) {{
-                .diagram-section-bg {{ min-height: 470px; }}
-                .diagram-content svg {{ transform: scale(0.85); }}
-            }}
-            @media (max-width: 992px) {{
-                .diagram-section-bg {{ min-height: 420px; }}
-                .diagram-content svg {{ transform: scale(0.75); }}
-            }}
-            @media (max-width: 768px) {{
-                .diagram-section-bg {{ min-height: 370px; }}
-                .diagram-content svg {{ transform: scale(0.65); }}
-            }}
-            @media (max-width: 576px) {{
-                .diagram-section-bg {{ min-height: 320px; }}
-                .diagram-content svg {{ transform: scale(0.5); }}
-            }}
-            </style>
-            <div class="diagram-section-bg">
-                <div class="diagram-container">
-                    <div class="diagram-content">
-                        {html_content}
-                    </div>
-                </div>
-            </div>
-            """
-            st.components.v1.html(centered_html, height=700, scrolling=True)
-        else:
-            st.warning("DPDP Implementation Framework diagram not found.")
-        # 2. CLAIRE Framework
-        st.markdown('<div style="margin-bottom: 1rem;"></div>', unsafe_allow_html=True)
-        st.subheader("Informatica CLAIRE Framework")
-        claire_path = os.path.join(config.BASE_DIR, "Assets", "CLAIRE.html")
-        if os.path.exists(claire_path):
-            with open(claire_path, "r", encoding="utf-8") as f:
-                claire_content = f.read()
-            centered_html = f"""
-            <style>
-            .diagram-section-bg {{
-                background: #181c24;
-                border-radius: 12px;
-                padding: 32px 10px 10px 10px;
-                margin-bottom: 1rem;
-                min-height: 520px;
-                box-shadow: 0 2px 12px rgba(0,0,0,0.10);
-            }}
-            .diagram-container {{
-                display: flex;
-                justify-content: center;
-                align-items: center;
-                width: 100%;
-                padding: 0;
-                margin: 0;
-                overflow: auto;
-                min-height: 500px;
-                background: transparent;
-            }}
-            .diagram-content {{
-                position: relative;
-                width: 100%;
-                height: 100%;
-                display: flex;
-                justify-content: center;
-                align-items: center;
-            }}
-            .diagram-content svg {{
-                max-width: 100%;
-                height: auto;
-                transform-origin: center;
-                transition: transform 0.3s ease;
-            }}
-            @media (max-width: 1200px) {{
-                .diagram-section-bg {{ min-height: 470px; }}
-                .diagram-content svg {{ transform: scale(0.85); }}
-            }}
-            @media (max-width: 992px) {{
-                .diagram-section-bg {{ min-height: 420px; }}
-                .diagram-content svg {{ transform: scale(0.75); }}
-            }}
-            @media (max-width: 768px) {{
-                .diagram-section-bg {{ min-height: 370px; }}
-                .diagram-content svg {{ transform: scale(0.65); }}
-            }}
-            @media (max-width: 576px) {{
-                .diagram-section-bg {{ min-height: 320px; }}
-                .diagram-content svg {{ transform: scale(0.5); }}
-            }}
-            </style>
-            <div class="diagram-section-bg">
-                <div class="diagram-container">
-                    <div class="diagram-content">
-                        {claire_content}
-                    </div>
-                </div>
-            </div>
-            """
-            st.components.v1.html(centered_html, height=700, scrolling=True)
-        else:
-            st.warning("CLAIRE Framework diagram not found.")
+        # 1. Implementation Framework and 2. CLAIRE Framework
+        _render_framework_diagrams()
         # 3. Gartner Magic Quadrant
-        def get_image_base64(image_path):
-            with open(image_path, "rb") as img_file:
-                return base64.b64encode(img_file.read()).decode()
-        img1_base64 = get_image_base64(os.path.join(config.BASE_DIR, "Assets", "data-integration-tools-mq.jpg"))
-        img2_base64 = get_image_base64(os.path.join(config.BASE_DIR, "Assets", "ipaas-mq.jpg"))
-        img3_base64 = get_image_base64(os.path.join(config.BASE_DIR, "Assets", "data-governance-mq.jpg"))
-        img4_base64 = get_image_base64(os.path.join(config.BASE_DIR, "Assets", "data-quality-mq.png"))
-        st.markdown("""
-            <style>
-            .magic-quadrant-section {
-                background: #1E1E1E;
-                padding: 20px;
-                border-radius: 10px;
-                margin: 40px 0;
-            }
-            .magic-quadrant-header {
-                color: white;
-                text-align: center;
-                font-size: 24px;
-                font-weight: bold;
-                margin-bottom: 20px;
-            }
-            .magic-quadrant-grid {
-                display: flex;
-                justify-content: space-between;
-                gap: 20px;
-                padding: 10px;
-                flex-wrap: wrap;
-            }
-            .quadrant-item {
-                flex: 1;
-                min-width: 200px;
-                display: flex;
-                flex-direction: column;
-                align-items: center;
-            }
-            .magic-quadrant-title {
-                color: white;
-                text-align: center;
-                margin-bottom: 10px;
-                font-size: 14px;
-                font-weight: 500;
-                height: 40px;
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                text-align: center;
-            }
-            .new-badge {
-                background: #8A2BE2;
-                color: white;
-                padding: 2px 8px;
-                border-radius: 15px;
-                font-size: 10px;
-                font-weight: bold;
-                margin-left: 6px;
-            }
-            .image-container {
-                position: relative;
-                width: 220px;
-                height: 220px;
-                transition: transform 0.3s ease;
-                cursor: pointer;
-            }
-            .image-container img {
-                width: 100%;
-                height: 100%;
-                object-fit: contain;
-                transition: all 0.3s ease;
-                background: white;
-                border-radius: 8px;
-            }
-            .image-container:hover {
-                position: relative;
-                z-index: 1000;
-            }
-            .image-container:hover img {
-                transform: scale(2.5);
-                box-shadow: 0 0 30px rgba(0,0,0,0.7);
-            }
-            .quadrant-link {
-                text-decoration: none;
-                display: block;
-            }
-            </style>
-        """, unsafe_allow_html=True)
-        st.markdown(f"""
-            <div class="magic-quadrant-section">
-                <div class="magic-quadrant-header">
-                    <span style="color: #FFA500;">Informatica Leadership in Gartner Magic Quadrant</span>
-                </div>
-                <div class="magic-quadrant-grid">
-                    <div class="quadrant-item">
-                        <div class="magic-quadrant-title">Data Integration Tools</div>
-                        <a href="https://www.informatica.com/lp/gartner-leadership.html" target="_blank" class="quadrant-link">
-                            <div class="image-container">
-                                <img src="data:image/jpeg;base64,{img1_base64}" alt="Data Integration Tools">
-                            </div>
-                        </a>
-                    </div>
-                    <div class="quadrant-item">
-                        <div class="magic-quadrant-title">Integration Platform as a Service (iPaaS)</div>
-                        <a href="https://www.informatica.com/lp/gartner-leadership.html" target="_blank" class="quadrant-link">
-                            <div class="image-container">
-                                <img src="data:image/jpeg;base64,{img2_base64}" alt="iPaaS">
-                            </div>
-                        </a>
-                    </div>
-                    <div class="quadrant-item">
-                        <div class="magic-quadrant-title">Data and Analytics Governance Platforms<span class="new-badge">NEW</span></div>
-                        <a href="https://www.informatica.com/lp/gartner-leadership.html" target="_blank" class="quadrant-link">
-                            <div class="image-container">
-                                <img src="data:image/jpeg;base64,{img3_base64}" alt="Data Governance">
-                            </div>
-                        </a>
-                    </div>
-                    <div class="quadrant-item">
-                        <div class="magic-quadrant-title">Augmented Data Quality Solutions<span class="new-badge">NEW</span></div>
-                        <a href="https://www.informatica.com/lp/gartner-leadership.html" target="_blank" class="quadrant-link">
-                            <div class="image-container">
-                                <img src="data:image/jpeg;base64,{img4_base64}" alt="Data Quality">
-                            </div>
-                        </a>
-                    </div>
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_MAGIC_QUADRANT_HTML, unsafe_allow_html=True)
         # 4. Potential Penalties Under
-        st.markdown(get_penalties_section_css(), unsafe_allow_html=True)
         # Use selected regulation for penalties
-        regulation_for_loader = st.session_state.get("ppa_selected_regulation", "DPDP")
         st.subheader("Potential Penalties Under " + regulation_label)
-        penalties_data = {}
-        if regulation_for_loader == 'DPDP':
-            penalties_data = {
-                "Nature of violation/breach": [
-                    "Failure of data fiduciary to take reasonable security safeguards to prevent personal data breach",
-                    "Failure to notify Data Protection Board of India and affected data principals in case of personal data breach",
-                    "Non-fulfilment of additional obligations in relation to personal data of children",
-                    "Non-fulfilment of additional obligations by significant data fiduciaries",
-                    "Non-compliance with duties of data principals",
-                    "Breach of any term of voluntary undertaking accepted by the Data Protection Board",
-                    "Residuary penalty"
-                ],
-                "Penalty": [
-                    "May extend to INR 250 crores",
-                    "May extend to INR 200 crores",
-                    "May extend to INR 200 crores",
-                    "May extend to INR 150 crores",
-                    "May extend to INR 10,000",
-                    "Up to the extent applicable",
-                    "May extend to INR 50 crores"
-                ]
-            }
-        elif regulation_for_loader == 'PDPPL':
-            penalties_data = {
-                "Violation Type": [
-                    "General violation of core data protection duties",
-                    "Serious violations (e.g., breach notification, DPIA, cross-border transfer)",
-                    "Legal person (organization) violation",
-                    "Maximum penalty for any infringement"
-                ],
-                "Penalty Amount (QAR)": [
-                    "Up to 1,000,000",
-                    "Up to 5,000,000",
-                    "Up to 1,000,000",
-                    "Up to 5,000,000"
-                ],
-                "Penalty Amount (USD, approx.)": [
-                    "Up to ~$275,000",
-                    "Up to ~$1,375,000",
-                    "Up to ~$275,000",
-                    "Up to ~$1,375,000"
-                ]
-            }
-        elif regulation_for_loader == 'GDPR':
-            penalties_data = {
-                "Violation Type": [
-                    "General violation of GDPR provisions",
-                    "Serious violations (e.g., breach notification, DPIA, cross-border transfer)",
-                    "Maximum penalty for any infringement"
-                ],
-                "Penalty Amount (EUR)": [
-                    "Up to 10 million or 2% of global annual turnover",
-                    "Up to 20 million or 4% of global annual turnover",
-                    "Up to 20 million or 4% of global annual turnover"
-                ]
-            }
-        elif regulation_for_loader == 'pdpl_saudi':
-            penalties_data = {
-                "Nature of violation/breach": [
-                    "Disclosure or publication of Sensitive Data with intent to harm or for personal benefit",
-                    "General violations of PDPL provisions",
-                    "Failure to implement required security measures",
-                    "Failure to maintain records of processing activities",
-                    "Failure to respond to data subject rights requests",
-                    "Unauthorized cross-border data transfers",
-                    "Failure to notify data breaches"
-                ],
-                "Penalty": [
-                    "Imprisonment up to 2 years or fine up to 3 million SAR, or both",
-                    "Warning or fine up to 5 million SAR (may be doubled for repeat violations)",
-                    "Warning or fine up to 5 million SAR",
-                    "Warning or fine up to 5 million SAR",
-                    "Warning or fine up to 5 million SAR",
-                    "Warning or fine up to 5 million SAR",
-                    "Warning or fine up to 5 million SAR"
-                ],
-                "Penalty Amount (USD, approx.)": [
-                    "Up to ~$800,000",
-                    "Up to ~$1.33 million",
-                    "Up to ~$1.33 million",
-                    "Up to ~$1.33 million",
-                    "Up to ~$1.33 million",
-                    "Up to ~$1.33 million",
-                    "Up to ~$1.33 million"
-                ]
-            }
-        else:
-            penalties_data = {
-                "Violation Type": [
-                    "General violation of privacy provisions",
-                    "Serious violations",
-                    "Maximum penalty for any infringement"
-                ],
-                "Penalty Amount": [
-                    "Up to a significant amount",
-                    "Up to a higher amount",
-                    "Up to the maximum allowed by law"
-                ]
-            }
-        if penalties_data:
-            import pandas as pd
-            st.markdown(get_penalties_table_css(), unsafe_allow_html=True)
-            penalties_df = pd.DataFrame(penalties_data)
-            st.markdown(penalties_df.to_html(classes='penalties-table', escape=False, index=False), unsafe_allow_html=True)
-        else:
-            st.info("No penalties data available for the selected regulation.")
+        st.markdown(_ppa_penalties_table_html(regulation_key), unsafe_allow_html=True)
         # 5. Quick AI Data Discovery button
-        st.markdown(get_discovery_button_css(), unsafe_allow_html=True)
         if st.button("🔍 Ready for a Quick AI Data Discovery ?", use_container_width=True, key="ppa_discovery_btn"):
             st.session_state.current_page = 'discovery'
             st.rerun()
         # --- End extra sections ---
         
-        st.markdown("""
-            <div style="background: rgba(111, 168, 220, 0.1); padding: 1rem; border-radius: 8px; margin-top: 2rem; border-left: 4px solid #6fa8dc;">
-                <strong style="color: #6fa8dc;">Note:</strong> Your privacy policy document is processed securely and is not stored. 
-                The analysis is performed in real-time and results are displayed immediately.
-            </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_PPA_NOTE_HTML, unsafe_allow_html=True)
 
-    if button_clicked:
-        # Validation
-        if not org_name.strip():
-            st.error("Please enter your organization name before starting the assessment.")
-            return
-        if selected_input_method == "Enter Privacy Policy URL" and (not policy_url or not policy_url.strip()):
-            st.error("Please enter a valid privacy policy URL.")
-            return
-        if selected_input_method == "Paste Privacy Policy Text" and (not policy_text or not policy_text.strip()):
-            st.error("Please paste the privacy policy text.")
-            return
-        # Clear previous analysis when starting a new assessment
-        st.session_state.ppa_analysis_html = None
-        st.session_state.ppa_pdf_content = None
-        st.session_state.ppa_error = None
-        st.session_state.ppa_found_url_message = None
-        from privacy_policy_analyzer import find_privacy_policy_url, fetch_policy_content, analyze_privacy_policy
-        # Auto-Detect
-        if selected_input_method == "Auto-Detect and Analyze Website Policy":
-            found_url = find_privacy_policy_url(org_name, country=selected_country)
-            if found_url:
-                    st.markdown(get_ai_analysis_css(), unsafe_allow_html=True)
-                    st.markdown(f"<div class='ai-analysis-container'>Found privacy policy at: <a href='{found_url}' target='_blank'>{found_url}</a></div>", unsafe_allow_html=True)
-                    policy_content = fetch_policy_content(found_url)
-                    if not policy_content:
-                        st.session_state.ppa_error = "Could not extract policy content from the URL."
-                        return
-            else:
-                    st.session_state.ppa_error = "Could not find privacy policy URL."
-                    return
-        elif selected_input_method == "Enter Privacy Policy URL":
-            with st.spinner("Fetching and analyzing privacy policy..."):
-                policy_content = fetch_policy_content(policy_url)
-                if not policy_content:
-                    st.session_state.ppa_error = "Could not fetch or extract content from the provided URL."
-                    return
-        elif selected_input_method == "Paste Privacy Policy Text":
-            policy_content = policy_text
-        # Run analysis
-        if policy_content:
-            with st.spinner(f"Analyzing privacy policy against {regulation_label} requirements... (Estimated time: ~60 seconds)"):
-                analysis_result = analyze_privacy_policy(policy_content, selected_law_key, organization_name=org_name)
-                if "error" in analysis_result:
-                    st.session_state.ppa_error = f"Error analyzing privacy policy: {analysis_result['error']}"
-                    return
-                analysis_html = analysis_result["analysis"]
-                pdf_content = analysis_result.get("pdf_content")
-                st.session_state.ppa_error = None
-                st.session_state.ppa_analysis_html = analysis_html
-                st.session_state.ppa_pdf_content = pdf_content
-                # Force a rerun to refresh the page with the new analysis
-                st.rerun()
+# Session state holding the Privacy Policy Analyzer's last result
+_PPA_RESULT_KEYS = ("ppa_analysis_html", "ppa_pdf_source", "ppa_error", "ppa_found_url_message")
 
 def clear_ppa_analysis_state() -> None:
     """Clear previous Privacy Policy Analyzer analysis state."""
-    st.session_state.ppa_analysis_html = None
-    st.session_state.ppa_pdf_content = None
-    st.session_state.ppa_error = None
-    st.session_state.ppa_found_url_message = None
+    st.session_state.update(dict.fromkeys(_PPA_RESULT_KEYS))